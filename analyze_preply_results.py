@@ -10,29 +10,42 @@ Preply词汇测试结果分析脚本
 - 与Preply官方结果对比，计算差异率
 
 使用方法:
-    python analyze_vocab_results.py
+    python analyze_preply_results.py
+    python analyze_preply_results.py --jobs 4
+    python analyze_preply_results.py --word-levels   # 使用同步导出的单词等级词典，不连接数据库
+    python analyze_preply_results.py --no-cache      # 忽略缓存，重新分析所有文件
+    python analyze_preply_results.py --drop-found-words   # 流式明细中省略命中的单词列表
 """
 
+import argparse
+import hashlib
 import json
 import os
+import sqlite3
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
 from pathlib import Path
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Iterable, Iterator, Optional, Set, Tuple
 from datetime import datetime
 import logging
 
+import numpy as np
+
 # 添加项目根目录到Python路径
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-from sqlalchemy import create_engine, text
+from sqlalchemy import String, any_, bindparam, create_engine, func, text
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import sessionmaker
 from app.core.config import Settings
 from app.models.vocabulary import (
     CET4Vocabulary, CET6Vocabulary, KaoyanVocabulary, 
-    Level4Vocabulary, Level8Vocabulary
+    Level4Vocabulary, Level8Vocabulary, normalize_head_word
 )
 from app.service.vocabulary_service import VocabularyEstimateService
+from app.service.word_levels import load_word_levels, resolve_word_levels_path
 
 # 配置日志
 logging.basicConfig(
@@ -45,20 +58,268 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 非 PostgreSQL 数据库使用 IN 查询时每次查询的单词数，避免超过绑定参数数量限制
+IN_QUERY_CHUNK_SIZE = 900
+
+# 并行分析时每个进程分到的文件分片数，分片越多负载越均衡
+SHARDS_PER_JOB = 4
+
+# 每批分析并写入缓存的结果文件数，同时保留在内存中的加载数据和分析结果不超过一批
+CACHE_WRITE_BATCH = 500
+
+# 分析结果缓存的格式版本，分析逻辑或结果结构变化时递增，使旧缓存全部失效
+ANALYSIS_CACHE_VERSION = 1
+DEFAULT_CACHE_PATH = project_root / 'preply_analysis_report' / 'analysis_cache.sqlite3'
+DEFAULT_REPORT_DIR = project_root / 'preply_analysis_report'
+
+# 汇总报告中命中率直方图的分组边界（百分比）
+HIT_RATE_HISTOGRAM_BINS = np.linspace(0, 100, 11)
+
+# 汇总报告中差异率的分位数
+DIFFERENCE_RATE_PERCENTILES = (50, 90, 99)
+
+
+def _pearson(estimates: np.ndarray, preply: np.ndarray) -> Dict[str, Any]:
+    """
+    计算我们的估算与Preply结果的皮尔逊相关系数，只统计Preply结果为正数的用户
+    
+    Returns:
+        Dict[str, Any]: 参与计算的用户数和相关系数，样本不足或方差为 0 时相关系数为 None
+    """
+    valid = preply > 0
+    users = int(valid.sum())
+    pearson = None
+    if users >= 2 and estimates[valid].std() > 0 and preply[valid].std() > 0:
+        pearson = float(np.corrcoef(estimates[valid], preply[valid])[0, 1])
+    return {'users': users, 'pearson': pearson}
+
+
+def _percentiles(values: np.ndarray) -> Dict[str, Optional[float]]:
+    """
+    计算 DIFFERENCE_RATE_PERCENTILES 中各分位数，没有数据时为 None
+    """
+    if not values.size:
+        return {f'p{q}': None for q in DIFFERENCE_RATE_PERCENTILES}
+    results = np.percentile(values, DIFFERENCE_RATE_PERCENTILES)
+    return {f'p{q}': float(value) for q, value in zip(DIFFERENCE_RATE_PERCENTILES, results)}
+
+
+def _file_hash(file_path: str) -> str:
+    """
+    计算文件内容的 SHA-1 哈希
+    """
+    digest = hashlib.sha1()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class AnalysisCache:
+    """
+    单个结果文件分析结果的持久化缓存（SQLite）
+    以文件内容哈希和数据集版本为键，文件内容、词汇数据或估算基准任一变化时缓存自动失效
+    """
+    
+    def __init__(self, path: Path):
+        """
+        打开缓存数据库，不存在时创建
+        
+        Args:
+            path: 缓存文件路径
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.path))
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS analysis_cache ("
+            " content_hash TEXT NOT NULL,"
+            " dataset_version TEXT NOT NULL,"
+            " result TEXT NOT NULL,"
+            " PRIMARY KEY (content_hash, dataset_version))"
+        )
+        self.conn.commit()
+    
+    def find_cached(self, content_hashes: Iterable[str], dataset_version: str) -> Set[str]:
+        """
+        批量查询哪些文件内容哈希已有缓存结果
+        
+        Args:
+            content_hashes: 文件内容哈希
+            dataset_version: 数据集版本
+            
+        Returns:
+            Set[str]: 命中缓存的内容哈希
+        """
+        content_hashes = list(set(content_hashes))
+        found = set()
+        for i in range(0, len(content_hashes), IN_QUERY_CHUNK_SIZE):
+            chunk = content_hashes[i:i + IN_QUERY_CHUNK_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self.conn.execute(
+                f"SELECT content_hash FROM analysis_cache"
+                f" WHERE dataset_version = ? AND content_hash IN ({placeholders})",
+                [dataset_version, *chunk]
+            )
+            found.update(content_hash for (content_hash,) in rows)
+        return found
+    
+    def get(self, content_hash: str, dataset_version: str) -> Optional[Dict[str, Any]]:
+        """
+        读取一个缓存的分析结果，未命中时返回 None
+        """
+        row = self.conn.execute(
+            "SELECT result FROM analysis_cache WHERE content_hash = ? AND dataset_version = ?",
+            (content_hash, dataset_version)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+    
+    def put_many(self, entries: Dict[str, Dict[str, Any]], dataset_version: str):
+        """
+        批量写入分析结果
+        
+        Args:
+            entries: 内容哈希到分析结果的映射
+            dataset_version: 数据集版本
+        """
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO analysis_cache (content_hash, dataset_version, result) VALUES (?, ?, ?)",
+                [
+                    (content_hash, dataset_version, json.dumps(result, ensure_ascii=False))
+                    for content_hash, result in entries.items()
+                ]
+            )
+    
+    def prune(self, dataset_version: str):
+        """
+        清除其他数据集版本的旧条目
+        """
+        with self.conn:
+            self.conn.execute("DELETE FROM analysis_cache WHERE dataset_version != ?", (dataset_version,))
+    
+    def close(self):
+        self.conn.close()
+
+
+def _without_found_words(result: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    返回去掉各词汇表 found_words 列表的分析结果副本
+    """
+    distribution = {
+        vocab_type: {key: value for key, value in data.items() if key != 'found_words'}
+        for vocab_type, data in result['distribution'].items()
+    }
+    return {**result, 'distribution': distribution}
+
+
+def _summary_row(result: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    只保留生成汇总报告所需字段的精简分析结果
+    """
+    return {
+        'difference_rate': result['difference_rate'],
+        'preply_result': result['preply_result'],
+        'our_estimate': {'estimated_vocabulary': result['our_estimate']['estimated_vocabulary']},
+        'distribution': {
+            vocab_type: {
+                'count': data['count'],
+                'total_tested': data['total_tested'],
+                'highest_level_count': data['highest_level_count']
+            }
+            for vocab_type, data in result['distribution'].items()
+        }
+    }
+
+
+class AnalysisReportWriter:
+    """
+    流式分析报告写入器
+    每个用户的分析结果写为明细文件（NDJSON）中的一行，只在内存中保留生成汇总所需的精简字段，
+    全部写完后汇总报告单独写入一个小文件
+    """
+    
+    def __init__(self, report_dir: Path, drop_found_words: bool = False):
+        """
+        初始化写入器
+        
+        Args:
+            report_dir: 报告目录
+            drop_found_words: 是否在明细中省略各词汇表命中的单词列表
+        """
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.details_path = Path(report_dir) / f'preply_results_analysis_{timestamp}.ndjson'
+        self.summary_path = Path(report_dir) / f'preply_results_analysis_summary_{timestamp}.json'
+        self.drop_found_words = drop_found_words
+        self.summary_rows: List[Dict[str, Any]] = []
+        self._file = None
+    
+    def write(self, result: Dict[str, Any]):
+        """
+        写入一个用户的分析结果
+        
+        Args:
+            result: 单个用户的分析结果
+        """
+        if self._file is None:
+            self.details_path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.details_path, 'w', encoding='utf-8')
+        
+        if self.drop_found_words:
+            result = _without_found_words(result)
+        self._file.write(json.dumps(result, ensure_ascii=False, separators=(',', ':')))
+        self._file.write('\n')
+        self.summary_rows.append(_summary_row(result))
+    
+    def write_summary(self, summary: Dict[str, Any]):
+        """
+        写入汇总报告，并记录对应的明细文件
+        
+        Args:
+            summary: 汇总报告
+        """
+        self.close()
+        summary_data = {
+            'summary': summary,
+            'details_file': self.details_path.name,
+            'details_count': len(self.summary_rows),
+            'found_words_included': not self.drop_found_words
+        }
+        with open(self.summary_path, 'w', encoding='utf-8') as f:
+            json.dump(summary_data, f, ensure_ascii=False, indent=2)
+    
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
 
 class VocabResultAnalyzer:
     """
     词汇测试结果分析器
     """
     
-    def __init__(self):
+    def __init__(self, word_levels_path: Optional[str] = None):
         """
         初始化分析器
+        
+        Args:
+            word_levels_path: 单词等级词典路径，不为 None 时从词典查询单词归属而不连接数据库，空字符串表示配置中的默认路径；
+                词典在第一次查询单词归属时加载，并行分析时只在子进程中加载
         """
         self.settings = Settings()
         self.engine = None
         self.session = None
-        self._setup_database()
+        self.word_levels_path = word_levels_path
+        self.word_levels: Optional[Dict[str, Set[str]]] = None
+        if word_levels_path is None:
+            self._setup_database()
         
         # 词汇表优先级映射（数字越大优先级越高）
         self.vocab_priority = {
@@ -111,6 +372,18 @@ class VocabResultAnalyzer:
             logger.error(f"数据库连接失败: {e}")
             raise
     
+    def _load_word_levels(self):
+        """
+        加载同步导出的单词等级词典
+        """
+        path = resolve_word_levels_path(self.word_levels_path)
+        try:
+            self.word_levels = load_word_levels(path)
+            logger.info(f"已加载单词等级词典: {path} ({len(self.word_levels)} 个单词)")
+        except (OSError, ValueError) as e:
+            logger.error(f"加载单词等级词典失败 {path}: {e}")
+            raise
+    
     def get_test_result_files(self) -> List[str]:
         """
         获取preply_results目录中的所有测试结果文件
@@ -123,7 +396,7 @@ class VocabResultAnalyzer:
             logger.error(f"结果目录不存在: {results_dir}")
             return []
         
-        json_files = list(results_dir.glob('vocab_test_result_*.json'))
+        json_files = sorted(results_dir.glob('vocab_test_result_*.json'))
         logger.info(f"找到 {len(json_files)} 个测试结果文件")
         
         return [str(f) for f in json_files]
@@ -155,14 +428,14 @@ class VocabResultAnalyzer:
             test_data: 测试结果数据
             
         Returns:
-            List[str]: 用户认识的单词列表
+            List[str]: 用户认识的单词列表（已规范化，与 head_word_norm 列一致）
         """
         known_words = []
         
         for round_data in test_data.get('rounds', []):
             for word_info in round_data.get('words', []):
                 if word_info.get('known', False):
-                    known_words.append(word_info.get('word', '').lower())
+                    known_words.append(normalize_head_word(word_info.get('word', '')))
         
         # 去重
         known_words = list(set(known_words))
@@ -170,62 +443,103 @@ class VocabResultAnalyzer:
         
         return known_words
     
-    def analyze_word_distribution(self, known_words: List[str]) -> Dict[str, Dict[str, Any]]:
+    def resolve_words(self, words: Iterable[str], vocab_types: Iterable[str] = None) -> Dict[str, Set[str]]:
         """
-        分析单词在各词汇表中的分布
+        批量查询单词所属的词汇表，每个词汇表只查询一次
+        PostgreSQL 将全部单词作为一个数组参数传入 = ANY(...)，其他数据库分块使用 IN 查询；
+        指定了单词等级词典时直接在内存中查找
         
         Args:
-            known_words: 用户认识的单词列表
+            words: 规范化后的单词
+            vocab_types: 要查询的词汇表类型，默认查询全部词汇表
             
         Returns:
-            Dict[str, Dict[str, Any]]: 各词汇表的分析结果
+            Dict[str, Set[str]]: 单词到所属词汇表类型集合的映射，未收录的单词不出现在结果中
+            
+        Raises:
+            Exception: 查询词汇表失败时回滚会话后重新抛出，避免用不完整的归属映射生成并缓存分析结果
         """
-        distribution = {}
-        word_levels = {}  # 记录每个单词的最高等级
+        words = sorted(set(words))
+        word_books: Dict[str, Set[str]] = {}
+        if not words:
+            return word_books
         
-        # 查询每个词汇表
-        for vocab_type, model_class in self.vocab_models.items():
+        if self.word_levels_path is not None:
+            if self.word_levels is None:
+                self._load_word_levels()
+            selected = set(vocab_types or self.vocab_models)
+            for word in words:
+                books = self.word_levels.get(word, set()) & selected
+                if books:
+                    word_books[word] = books
+            logger.info(f"单词等级词典: 在 {len(words)} 个单词中找到 {len(word_books)} 个")
+            return word_books
+        
+        use_array = self.engine.dialect.name == "postgresql"
+        if use_array:
+            chunks = [words]
+        else:
+            chunks = [words[i:i + IN_QUERY_CHUNK_SIZE] for i in range(0, len(words), IN_QUERY_CHUNK_SIZE)]
+        
+        for vocab_type in (vocab_types or self.vocab_models):
+            column = self.vocab_models[vocab_type].head_word_norm
+            found_count = 0
             try:
-                # 查询该词汇表中存在的单词
-                found_words = self.session.query(model_class.head_word).filter(
-                    model_class.head_word.in_(known_words)
-                ).all()
-                
-                found_word_list = [word[0].lower() for word in found_words]
-                
-                # 更新单词等级映射
-                for word in found_word_list:
-                    current_priority = self.vocab_priority[vocab_type]
-                    if word not in word_levels or word_levels[word]['priority'] < current_priority:
-                        word_levels[word] = {
-                            'level': vocab_type,
-                            'priority': current_priority
-                        }
-                
-                distribution[vocab_type] = {
-                    'found_words': found_word_list,
-                    'count': len(found_word_list),
-                    'total_tested': len(known_words)
-                }
-                
-                logger.info(f"{self.vocab_names[vocab_type]}词汇表: 找到 {len(found_word_list)} 个单词")
-                
+                for chunk in chunks:
+                    if use_array:
+                        condition = column == any_(bindparam("words", value=chunk, type_=ARRAY(String)))
+                    else:
+                        condition = column.in_(chunk)
+                    for (word,) in self.session.query(column).filter(condition).distinct():
+                        word_books.setdefault(word, set()).add(vocab_type)
+                        found_count += 1
+                logger.info(f"{self.vocab_names[vocab_type]}词汇表: 在 {len(words)} 个单词中找到 {found_count} 个")
             except Exception as e:
                 logger.error(f"查询{vocab_type}词汇表时出错: {e}")
-                distribution[vocab_type] = {
-                    'found_words': [],
-                    'count': 0,
-                    'total_tested': len(known_words)
-                }
+                self.session.rollback()
+                raise
+        
+        return word_books
+    
+    def analyze_word_distribution(
+        self,
+        known_words: List[str],
+        word_books: Dict[str, Set[str]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        分析单词在各词汇表中的分布
+        
+        Args:
+            known_words: 用户认识的单词列表
+            word_books: resolve_words 返回的单词归属映射，未提供时只针对这些单词查询数据库
+            
+        Returns:
+            Dict[str, Dict[str, Any]]: 各词汇表的分析结果
+        """
+        if word_books is None:
+            word_books = self.resolve_words(known_words)
         
-        # 统计按最高等级分类的单词数量
+        found_words = {vocab_type: [] for vocab_type in self.vocab_models}
         level_counts = {level: 0 for level in self.vocab_priority.keys()}
-        for word_info in word_levels.values():
-            level_counts[word_info['level']] += 1
         
-        # 添加等级统计信息
-        for vocab_type in distribution.keys():
-            distribution[vocab_type]['highest_level_count'] = level_counts[vocab_type]
+        for word in known_words:
+            books = word_books.get(word)
+            if not books:
+                continue
+            for vocab_type in books:
+                found_words[vocab_type].append(word)
+            # 统计按最高等级分类的单词数量
+            highest_level = max(books, key=self.vocab_priority.__getitem__)
+            level_counts[highest_level] += 1
+        
+        distribution = {}
+        for vocab_type in self.vocab_models:
+            distribution[vocab_type] = {
+                'found_words': found_words[vocab_type],
+                'count': len(found_words[vocab_type]),
+                'total_tested': len(known_words),
+                'highest_level_count': level_counts[vocab_type]
+            }
         
         return distribution
     
@@ -301,36 +615,70 @@ class VocabResultAnalyzer:
         except (ValueError, TypeError):
             return 0.0, "Preply结果格式错误，无法计算差异率"
     
-    def analyze_single_result(self, file_path: str) -> Dict[str, Any]:
+    def load_result_words(self, file_path: str) -> Dict[str, Any]:
         """
-        分析单个测试结果文件
+        加载测试结果文件并只保留分析所需的字段
         
         Args:
             file_path: 测试结果文件路径
             
         Returns:
-            Dict[str, Any]: 分析结果
+            Dict[str, Any]: 包含认识的单词、Preply结果和测试摘要的字典，加载失败时为空字典
         """
-        # 加载测试数据
         test_data = self.load_test_result(file_path)
         if not test_data:
             return {}
         
+        return {
+            'file_path': file_path,
+            'known_words': self.extract_known_words(test_data),
+            'final_vocab_size': test_data.get('final_vocab_size', '0'),
+            'summary': test_data.get('summary', {})
+        }
+    
+    def analyze_single_result(self, file_path: str, word_books: Dict[str, Set[str]] = None) -> Dict[str, Any]:
+        """
+        分析单个测试结果文件
+        
+        Args:
+            file_path: 测试结果文件路径
+            word_books: resolve_words 返回的单词归属映射，未提供时单独查询该文件的单词
+            
+        Returns:
+            Dict[str, Any]: 分析结果
+        """
+        result_words = self.load_result_words(file_path)
+        if not result_words:
+            return {}
+        return self.build_result(result_words, word_books)
+    
+    def build_result(self, result_words: Dict[str, Any], word_books: Dict[str, Set[str]] = None) -> Dict[str, Any]:
+        """
+        根据单词归属映射计算单个测试结果的分析结果
+        
+        Args:
+            result_words: load_result_words 返回的数据
+            word_books: 单词归属映射
+            
+        Returns:
+            Dict[str, Any]: 分析结果
+        """
+        file_path = result_words['file_path']
+        
         # 提取用户信息
         file_name = os.path.basename(file_path)
         user_id = file_name.replace('vocab_test_result_', '').replace('.json', '')
         
-        # 提取认识的单词
-        known_words = self.extract_known_words(test_data)
+        known_words = result_words['known_words']
         
         # 分析词汇表分布
-        distribution = self.analyze_word_distribution(known_words)
+        distribution = self.analyze_word_distribution(known_words, word_books)
         
         # 计算词汇量估算
         our_estimate = self.calculate_vocabulary_estimate(distribution)
         
         # 获取Preply结果
-        preply_result = test_data.get('final_vocab_size', '0')
+        preply_result = result_words['final_vocab_size']
         
         # 计算差异率
         diff_rate, diff_desc = self.calculate_difference_rate(
@@ -347,37 +695,195 @@ class VocabResultAnalyzer:
             'preply_result': preply_result,
             'difference_rate': diff_rate,
             'difference_description': diff_desc,
-            'test_summary': test_data.get('summary', {})
+            'test_summary': result_words['summary']
         }
     
-    def analyze_all_results(self) -> List[Dict[str, Any]]:
+    def load_result_files(self, result_files: List[str]) -> List[Dict[str, Any]]:
+        """
+        加载一组测试结果文件，跳过加载失败的文件
+        
+        Args:
+            result_files: 测试结果文件路径列表
+            
+        Returns:
+            List[Dict[str, Any]]: load_result_words 返回的数据列表
+        """
+        loaded = []
+        for file_path in result_files:
+            result_words = self.load_result_words(file_path)
+            if result_words:
+                loaded.append(result_words)
+        return loaded
+    
+    def analyze_files(self, result_files: List[str]) -> List[Dict[str, Any]]:
+        """
+        分析一组测试结果文件
+        先汇总这些文件中认识的单词并一次性查询归属，再在内存中按文件统计
+        
+        Args:
+            result_files: 测试结果文件路径列表
+            
+        Returns:
+            List[Dict[str, Any]]: 分析结果，顺序与文件列表一致，加载失败的文件被跳过
+        """
+        loaded = self.load_result_files(result_files)
+        all_words = set()
+        for result_words in loaded:
+            all_words.update(result_words['known_words'])
+        
+        logger.info(f"共 {len(loaded)} 个测试结果，{len(all_words)} 个不同的认识单词")
+        word_books = self.resolve_words(all_words)
+        return [self.build_result(result_words, word_books) for result_words in loaded]
+    
+    def dataset_version(self) -> str:
+        """
+        计算当前词汇数据和估算基准的版本标识，用作分析结果缓存键的一部分
+        使用单词等级词典时取词典文件内容的哈希，否则取各词汇表的行数和最后更新时间
+        
+        Returns:
+            str: 版本标识
+        """
+        if self.word_levels_path is not None:
+            source = {'word_levels': _file_hash(str(resolve_word_levels_path(self.word_levels_path)))}
+        else:
+            source = {}
+            for vocab_type, model_class in self.vocab_models.items():
+                count, last_updated = self.session.query(
+                    func.count(model_class.id), func.max(model_class.updated_at)
+                ).one()
+                source[vocab_type] = [count, last_updated.isoformat() if last_updated else None]
+        
+        source['cache_version'] = ANALYSIS_CACHE_VERSION
+        source['vocab_priority'] = self.vocab_priority
+        source['benchmarks'] = VocabularyEstimateService.VOCABULARY_BENCHMARKS
+        payload = json.dumps(source, sort_keys=True)
+        return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+    
+    def analyze_all_results(self, jobs: int = 1, cache: Optional[AnalysisCache] = None) -> List[Dict[str, Any]]:
         """
         分析所有测试结果文件
         
+        Args:
+            jobs: 并行分析的进程数，1 表示在当前进程中分析
+            cache: 分析结果缓存，提供时只分析新增或内容变化的文件
+            
         Returns:
-            List[Dict[str, Any]]: 所有用户的分析结果
+            List[Dict[str, Any]]: 所有用户的分析结果，按文件名排序
+        """
+        return list(self.iter_results(jobs, cache))
+    
+    def iter_results(self, jobs: int = 1, cache: Optional[AnalysisCache] = None) -> Iterator[Dict[str, Any]]:
+        """
+        逐个生成所有测试结果文件的分析结果，调用方可边分析边写出，不必保留全部结果
+        文件按 CACHE_WRITE_BATCH 分批加载、分析并写入缓存，每批分析完成后即开始输出
+        
+        Args:
+            jobs: 并行分析的进程数，1 表示在当前进程中分析
+            cache: 分析结果缓存，提供时只分析新增或内容变化的文件
+            
+        Yields:
+            Dict[str, Any]: 单个用户的分析结果，按文件名排序
         """
         result_files = self.get_test_result_files()
         if not result_files:
             logger.warning("没有找到测试结果文件")
-            return []
+            return
         
-        all_results = []
+        if cache is not None:
+            dataset_version = self.dataset_version()
+            cache.prune(dataset_version)
+            file_hashes = {file_path: _file_hash(file_path) for file_path in result_files}
+            cached_hashes = cache.find_cached(file_hashes.values(), dataset_version)
+            pending_count = sum(1 for content_hash in file_hashes.values() if content_hash not in cached_hashes)
+            logger.info(f"缓存命中 {len(result_files) - pending_count} 个文件，需要分析 {pending_count} 个文件")
         
-        for file_path in result_files:
-            logger.info(f"正在分析: {file_path}")
-            result = self.analyze_single_result(file_path)
-            if result:
-                all_results.append(result)
+        # 进程池在所有批次间复用，子进程只初始化一次
+        with self._worker_pool(jobs) as executor:
+            for start in range(0, len(result_files), CACHE_WRITE_BATCH):
+                batch = result_files[start:start + CACHE_WRITE_BATCH]
+                if cache is None:
+                    yield from self._analyze_pending(batch, jobs, executor)
+                    continue
+                
+                pending = [file_path for file_path in batch if file_hashes[file_path] not in cached_hashes]
+                analyzed = {result['file_path']: result for result in self._analyze_pending(pending, jobs, executor)}
+                if analyzed:
+                    cache.put_many(
+                        {file_hashes[file_path]: result for file_path, result in analyzed.items()}, dataset_version
+                    )
+                
+                for file_path in batch:
+                    content_hash = file_hashes[file_path]
+                    if file_path in analyzed:
+                        result = analyzed[file_path]
+                    elif content_hash in cached_hashes:
+                        # 内容相同的文件可能位于不同路径，用户信息按当前文件名重新生成
+                        result = cache.get(content_hash, dataset_version)
+                        result['file_path'] = file_path
+                        result['user_id'] = os.path.basename(file_path).replace('vocab_test_result_', '').replace('.json', '')
+                    else:
+                        continue
+                    yield result
+    
+    def _worker_pool(self, jobs: int):
+        """
+        创建并行分析用的进程池，每个子进程使用独立的数据库引擎或自行加载单词等级词典
+        
+        Args:
+            jobs: 并行进程数
+            
+        Returns:
+            进程池上下文，jobs 不大于 1 时为 None
+        """
+        if jobs <= 1:
+            return nullcontext()
+        logger.info(f"使用 {jobs} 个进程并行分析")
+        return ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=_init_worker_analyzer,
+            initargs=(self.word_levels_path,)
+        )
+    
+    def _analyze_pending(
+        self,
+        result_files: List[str],
+        jobs: int,
+        executor: Optional[ProcessPoolExecutor]
+    ) -> List[Dict[str, Any]]:
+        """
+        分析一批结果文件，提供进程池时按分片分发到子进程
+        子进程对分到的分片完成加载、查询单词归属和统计，只把分析结果返回当前进程合并
+        
+        Args:
+            result_files: 测试结果文件路径列表
+            jobs: 并行进程数
+            executor: _worker_pool 创建的进程池，为 None 时在当前进程中分析
+            
+        Returns:
+            List[Dict[str, Any]]: 分析结果，顺序与文件列表一致，加载失败的文件被跳过
+        """
+        if not result_files:
+            return []
+        if executor is None or len(result_files) == 1:
+            return self.analyze_files(result_files)
         
-        return all_results
+        shard_count = min(len(result_files), jobs * SHARDS_PER_JOB)
+        shard_size = -(-len(result_files) // shard_count)
+        shards = [result_files[i:i + shard_size] for i in range(0, len(result_files), shard_size)]
+        logger.info(f"并行分析 {len(result_files)} 个结果文件（{len(shards)} 个分片）")
+        
+        results = []
+        for shard_results in executor.map(_analyze_files_in_worker, shards):
+            results.extend(shard_results)
+        return results
     
     def generate_summary_report(self, all_results: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         生成汇总报告
+        先将所有用户的差异率、命中数和估算值一次性载入数组，再以向量化运算计算均值、分位数、直方图和相关系数
         
         Args:
-            all_results: 所有用户的分析结果
+            all_results: 所有用户的分析结果（或 AnalysisReportWriter 保留的精简结果）
             
         Returns:
             Dict[str, Any]: 汇总报告
@@ -386,43 +892,73 @@ class VocabResultAnalyzer:
             return {}
         
         total_users = len(all_results)
-        total_diff_rates = [r['difference_rate'] for r in all_results if r['difference_rate'] > 0]
+        vocab_types = list(self.vocab_priority.keys())
         
-        avg_diff_rate = sum(total_diff_rates) / len(total_diff_rates) if total_diff_rates else 0
+        # 一次遍历取出所需字段，之后的统计全部在数组上进行
+        diff_rates = np.empty(total_users)
+        estimates = np.empty(total_users)
+        preply = np.empty(total_users)
+        tested = np.zeros((total_users, len(vocab_types)))
+        hits = np.zeros((total_users, len(vocab_types)))
+        for row, result in enumerate(all_results):
+            diff_rates[row] = result['difference_rate']
+            estimates[row] = result['our_estimate']['estimated_vocabulary']
+            preply_result = str(result.get('preply_result', ''))
+            preply[row] = int(preply_result) if preply_result.isdigit() else 0
+            distribution = result['distribution']
+            for col, vocab_type in enumerate(vocab_types):
+                data = distribution.get(vocab_type)
+                if data:
+                    tested[row, col] = data['total_tested']
+                    hits[row, col] = data['highest_level_count']
         
-        # 统计各词汇表的平均命中率
+        # 差异率为 0 表示无法计算（或完全一致），与平均差异率一样不参与统计
+        valid_diff_rates = diff_rates[diff_rates > 0]
+        avg_diff_rate = float(valid_diff_rates.mean()) if valid_diff_rates.size else 0
+        
+        # 统计各词汇表的命中率
         vocab_stats = {}
-        for vocab_type in self.vocab_priority.keys():
-            hit_rates = []
-            for result in all_results:
-                dist = result['distribution'].get(vocab_type, {})
-                if dist.get('total_tested', 0) > 0:
-                    hit_rate = dist.get('highest_level_count', 0) / dist['total_tested'] * 100
-                    hit_rates.append(hit_rate)
-            
+        with np.errstate(divide='ignore', invalid='ignore'):
+            hit_rates = np.where(tested > 0, hits / tested * 100, np.nan)
+        for i, vocab_type in enumerate(vocab_types):
+            rates = hit_rates[:, i]
+            rates = rates[~np.isnan(rates)]
+            counts, _ = np.histogram(rates, bins=HIT_RATE_HISTOGRAM_BINS)
             vocab_stats[vocab_type] = {
                 'name': self.vocab_names[vocab_type],
-                'avg_hit_rate': sum(hit_rates) / len(hit_rates) if hit_rates else 0,
-                'users_tested': len(hit_rates)
+                'avg_hit_rate': float(rates.mean()) if rates.size else 0,
+                'users_tested': int(rates.size),
+                'hit_rate_histogram': {
+                    'bins': HIT_RATE_HISTOGRAM_BINS.tolist(),
+                    'counts': counts.tolist()
+                }
             }
         
         return {
             'total_users': total_users,
             'average_difference_rate': avg_diff_rate,
+            'difference_rate_percentiles': _percentiles(valid_diff_rates),
+            'estimate_correlation': _pearson(estimates, preply),
             'vocab_stats': vocab_stats,
             'analysis_time': datetime.now().isoformat()
         }
     
-    def save_analysis_report(self, all_results: List[Dict[str, Any]], summary: Dict[str, Any]):
+    def save_analysis_report(
+        self,
+        all_results: List[Dict[str, Any]],
+        summary: Dict[str, Any],
+        report_dir: Path = DEFAULT_REPORT_DIR
+    ):
         """
         保存分析报告到文件
         
         Args:
             all_results: 所有用户的分析结果
             summary: 汇总报告
+            report_dir: 报告目录
         """
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        report_file = project_root / f'preply_analysis_report/preply_results_analysis_report_{timestamp}.json'
+        report_file = Path(report_dir) / f'preply_results_analysis_report_{timestamp}.json'
         
         report_data = {
             'summary': summary,
@@ -430,6 +966,7 @@ class VocabResultAnalyzer:
         }
         
         try:
+            report_file.parent.mkdir(parents=True, exist_ok=True)
             with open(report_file, 'w', encoding='utf-8') as f:
                 json.dump(report_data, f, ensure_ascii=False, indent=2)
             
@@ -453,11 +990,25 @@ class VocabResultAnalyzer:
         print(f"\n📈 总体统计:")
         print(f"   - 分析用户数: {summary.get('total_users', 0)}")
         print(f"   - 平均差异率: {summary.get('average_difference_rate', 0):.1f}%")
+        percentiles = summary.get('difference_rate_percentiles', {})
+        if any(value is not None for value in percentiles.values()):
+            print("   - 差异率分位数: " + ", ".join(
+                f"{name.upper()} {value:.1f}%" for name, value in percentiles.items() if value is not None
+            ))
+        correlation = summary.get('estimate_correlation', {})
+        if correlation.get('pearson') is not None:
+            print(f"   - 估算与Preply结果的相关系数: {correlation['pearson']:.3f} (用户数: {correlation['users']})")
         
         print(f"\n📚 各词汇表命中率统计:")
         vocab_stats = summary.get('vocab_stats', {})
         for vocab_type, stats in vocab_stats.items():
             print(f"   - {stats['name']}: {stats['avg_hit_rate']:.1f}% (测试用户: {stats['users_tested']})")
+            histogram = stats.get('hit_rate_histogram')
+            if histogram and stats['users_tested']:
+                bins = histogram['bins']
+                print("       " + " ".join(
+                    f"{bins[i]:.0f}-{bins[i + 1]:.0f}%:{count}" for i, count in enumerate(histogram['counts'])
+                ))
         
         print(f"\n⏰ 分析时间: {summary.get('analysis_time', '')}")
         print("=" * 80)
@@ -470,35 +1021,153 @@ class VocabResultAnalyzer:
             self.session.close()
         if self.engine:
             self.engine.dispose()
-        logger.info("数据库连接已关闭")
+            logger.info("数据库连接已关闭")
+
+
+# 进程池子进程中的分析器，由 _init_worker_analyzer 创建，随子进程退出
+_worker_analyzer = None
+
+
+def _init_worker_analyzer(word_levels_path: Optional[str] = None):
+    """
+    进程池初始化函数，为每个子进程创建独立的分析器和数据库引擎
+    
+    Args:
+        word_levels_path: 单词等级词典路径，提供时子进程使用词典而不连接数据库
+    """
+    global _worker_analyzer
+    _worker_analyzer = VocabResultAnalyzer(word_levels_path)
+
+
+def _analyze_files_in_worker(result_files: List[str]) -> List[Dict[str, Any]]:
+    """
+    在子进程中分析一个分片的结果文件
+    
+    Args:
+        result_files: 分片内的测试结果文件路径
+        
+    Returns:
+        List[Dict[str, Any]]: 分析结果
+    """
+    return _worker_analyzer.analyze_files(result_files)
+
+
+def parse_arguments():
+    """
+    解析命令行参数
+    """
+    parser = argparse.ArgumentParser(
+        description="Preply词汇测试结果分析脚本",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+示例:
+  python analyze_preply_results.py             # 在当前进程中分析所有结果文件
+  python analyze_preply_results.py --jobs 4    # 4个进程并行分析
+  python analyze_preply_results.py --word-levels                      # 使用默认路径的单词等级词典，离线分析
+  python analyze_preply_results.py --word-levels /tmp/word_levels.json.gz
+  python analyze_preply_results.py --no-cache  # 忽略缓存，重新分析所有文件
+  python analyze_preply_results.py --drop-found-words   # 明细中省略命中的单词列表
+  python analyze_preply_results.py --format json        # 输出包含全部明细的单个JSON文件
+        """
+    )
+    parser.add_argument(
+        "--word-levels",
+        nargs="?",
+        const="",
+        default=None,
+        metavar="PATH",
+        help="从同步导出的单词等级词典查询单词归属，不连接数据库（不指定路径时使用配置中的 word_levels_path）"
+    )
+    parser.add_argument(
+        "--format",
+        choices=["ndjson", "json"],
+        default="ndjson",
+        help="报告格式: ndjson 每个用户一行并单独写出汇总文件，json 为包含全部明细的单个文件（默认: ndjson）"
+    )
+    parser.add_argument(
+        "--drop-found-words",
+        action="store_true",
+        help="明细中不输出各词汇表命中的单词列表（仅 ndjson 格式）"
+    )
+    parser.add_argument(
+        "--report-dir",
+        type=str,
+        default=str(DEFAULT_REPORT_DIR),
+        help="报告输出目录（默认: preply_analysis_report）"
+    )
+    parser.add_argument(
+        "--cache-path",
+        type=str,
+        default=str(DEFAULT_CACHE_PATH),
+        help="分析结果缓存文件路径（默认: preply_analysis_report/analysis_cache.sqlite3）"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="不使用分析结果缓存，重新分析所有文件"
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="并行分析的进程数，每个进程使用独立的数据库连接（默认: 1）"
+    )
+    return parser.parse_args()
 
 
 def main():
     """
     主函数
     """
+    args = parse_arguments()
     print("\n🚀 开始Preply词汇测试结果分析...")
     
     analyzer = None
+    cache = None
     try:
         # 创建分析器
-        analyzer = VocabResultAnalyzer()
-        
-        # 分析所有结果
-        all_results = analyzer.analyze_all_results()
+        analyzer = VocabResultAnalyzer(word_levels_path=args.word_levels)
         
-        if not all_results:
-            print("❌ 没有找到有效的测试结果文件")
-            return
+        # 打开分析结果缓存
+        if not args.no_cache:
+            cache = AnalysisCache(Path(args.cache_path))
         
-        # 生成汇总报告
-        summary = analyzer.generate_summary_report(all_results)
-        
-        # 打印汇总报告
-        analyzer.print_summary_report(summary)
-        
-        # 保存详细报告
-        analyzer.save_analysis_report(all_results, summary)
+        if args.format == 'json':
+            # 分析所有结果
+            all_results = analyzer.analyze_all_results(jobs=args.jobs, cache=cache)
+            
+            if not all_results:
+                print("❌ 没有找到有效的测试结果文件")
+                return
+            
+            # 生成汇总报告
+            summary = analyzer.generate_summary_report(all_results)
+            
+            # 打印汇总报告
+            analyzer.print_summary_report(summary)
+            
+            # 保存详细报告
+            analyzer.save_analysis_report(all_results, summary, Path(args.report_dir))
+        else:
+            # 边分析边写出明细
+            with AnalysisReportWriter(Path(args.report_dir), args.drop_found_words) as writer:
+                for result in analyzer.iter_results(jobs=args.jobs, cache=cache):
+                    writer.write(result)
+                
+                if not writer.summary_rows:
+                    print("❌ 没有找到有效的测试结果文件")
+                    return
+                
+                # 生成并打印汇总报告
+                summary = analyzer.generate_summary_report(writer.summary_rows)
+                analyzer.print_summary_report(summary)
+                
+                # 保存汇总报告
+                writer.write_summary(summary)
+            
+            logger.info(f"分析明细已保存到: {writer.details_path}")
+            print(f"📊 分析明细已保存到: {writer.details_path}")
+            print(f"📊 汇总报告已保存到: {writer.summary_path}")
         
         print("\n🎉 分析完成！")
         
@@ -508,6 +1177,8 @@ def main():
         logger.error(f"分析过程中发生错误: {e}")
         print(f"\n❌ 分析失败: {e}")
     finally:
+        if cache:
+            cache.close()
         if analyzer:
             analyzer.close()
 
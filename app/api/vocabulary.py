@@ -1,10 +1,11 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from sqlalchemy import func
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from pydantic import BaseModel
 
 from app.db import get_db
+from app.service.vocabulary_snapshot import get_vocabulary_snapshot
 from app.service.vocabulary_service import (
     VocabularyEstimateService,
     VocabularyEstimateRequest,
@@ -15,7 +16,9 @@ from app.models.vocabulary import (
     CET6Vocabulary, 
     KaoyanVocabulary,
     Level4Vocabulary,
-    Level8Vocabulary
+    Level8Vocabulary,
+    TABLE_MODEL_MAPPING,
+    normalize_head_word
 )
 
 router = APIRouter(prefix="/vocabulary", tags=["词汇"])
@@ -28,11 +31,11 @@ class VocabularyItem(BaseModel):
     id: int
     word_rank: int
     head_word: str
-    translation: str
-    book_id: str
-    word_id: str
-    us_phone: str
-    uk_phone: str
+    translation: Optional[str] = None
+    book_id: Optional[str] = None
+    word_id: Optional[str] = None
+    us_phone: Optional[str] = None
+    uk_phone: Optional[str] = None
     
     class Config:
         from_attributes = True
@@ -50,10 +53,16 @@ class RandomVocabularyResponse(BaseModel):
     total_count: int
 
 
+# 模型类到词汇类型的映射
+MODEL_TABLE_MAPPING = {model_class: name for name, model_class in TABLE_MODEL_MAPPING.items()}
+
+
 def get_random_words(db: Session, model_class, count: int = 20) -> List[VocabularyItem]:
     """
     从指定模型中随机获取词汇
     
+    优先从内存映射的词汇快照中抽取，快照不可用时回退到数据库查询
+    
     Args:
         db: 数据库会话
         model_class: 词汇模型类
@@ -63,6 +72,11 @@ def get_random_words(db: Session, model_class, count: int = 20) -> List[Vocabula
         词汇列表
     """
     try:
+        snapshot = get_vocabulary_snapshot()
+        vocabulary_type = MODEL_TABLE_MAPPING.get(model_class)
+        if snapshot is not None and snapshot.has_book(vocabulary_type):
+            return [VocabularyItem(**word) for word in snapshot.random_words(vocabulary_type, count)]
+        
         # 使用SQLAlchemy的func.random()进行随机查询
         words = db.query(model_class).order_by(func.random()).limit(count).all()
         return [VocabularyItem.from_orm(word) for word in words]
@@ -161,6 +175,38 @@ async def get_random_vocabulary_by_type(
         )
 
 
+@router.get("/lookup/{head_word}", response_model=Dict[str, List[VocabularyItem]])
+async def lookup_word(head_word: str, db: Session = Depends(get_db)):
+    """
+    查询单词在各词汇表中的记录，按规范化单词匹配，不区分大小写
+    
+    Args:
+        head_word: 要查询的单词
+        
+    Returns:
+        词汇类型到匹配记录列表的映射，未收录的词汇类型不出现在结果中
+    """
+    try:
+        snapshot = get_vocabulary_snapshot()
+        norm_word = normalize_head_word(head_word)
+        result = {}
+        for vocabulary_type, model_class in TABLE_MODEL_MAPPING.items():
+            if snapshot is not None and snapshot.has_book(vocabulary_type):
+                words = [VocabularyItem(**word) for word in snapshot.find_word(vocabulary_type, head_word)]
+            else:
+                rows = db.query(model_class).filter(model_class.head_word_norm == norm_word).all()
+                words = [VocabularyItem.from_orm(row) for row in rows]
+            if words:
+                result[vocabulary_type] = words
+        return result
+        
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"查询单词失败: {str(e)}"
+        )
+
+
 @router.get("/stats")
 async def get_vocabulary_stats(db: Session = Depends(get_db)):
     """
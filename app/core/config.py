@@ -25,6 +25,11 @@ class Settings(BaseSettings):
     app_name: str = "VocabTracker API"
     debug: bool = False
     
+    # 数据文件配置
+    vocabulary_snapshot_path: str = "datasets/vocabulary.snapshot"
+    word_levels_path: str = "datasets/word_levels.json.gz"
+    sync_report_dir: str = "sync_reports"
+    
     def __init__(self, **kwargs):
         """
         初始化配置，优先从JSON配置文件读取
@@ -65,6 +70,13 @@ class Settings(BaseSettings):
                     app_config = config_data["app"]
                     self.app_name = app_config.get("name", self.app_name)
                     self.debug = app_config.get("debug", self.debug)
+                
+                # 加载数据文件配置
+                if "data" in config_data:
+                    data_config = config_data["data"]
+                    self.vocabulary_snapshot_path = data_config.get("snapshot_path", self.vocabulary_snapshot_path)
+                    self.word_levels_path = data_config.get("word_levels_path", self.word_levels_path)
+                    self.sync_report_dir = data_config.get("report_dir", self.sync_report_dir)
                     
             except (json.JSONDecodeError, FileNotFoundError, KeyError) as e:
                 # 如果配置文件读取失败，使用默认值并记录警告
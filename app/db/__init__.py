@@ -1,4 +1,4 @@
-from sqlalchemy import create_engine, text
+from sqlalchemy import bindparam, create_engine, func, inspect, select, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 from typing import Generator
@@ -25,6 +25,9 @@ SessionLocal = sessionmaker(
 # 创建基础模型类
 Base = declarative_base()
 
+# 回填规范化单词时每批更新的行数
+BACKFILL_BATCH_SIZE = 5000
+
 
 def get_db() -> Generator[Session, None, None]:
     """
@@ -53,12 +56,109 @@ def init_db() -> None:
         
         # 创建所有表
         Base.metadata.create_all(bind=engine)
+        
+        # 为已存在的表补充新增的列和索引
+        upgrade_schema()
         logger.info("数据库初始化成功")
     except Exception as e:
         logger.error(f"数据库初始化失败: {e}")
         raise
 
 
+def upgrade_schema() -> None:
+    """
+    为已存在的表补充模型中新增的列和索引，并删除主键列上多余的索引
+    只处理新增的可空列，不修改或删除已有列
+    """
+    inspector = inspect(engine)
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        
+        existing_columns = {column["name"] for column in inspector.get_columns(table.name)}
+        with engine.begin() as connection:
+            for column in table.columns:
+                if column.name not in existing_columns:
+                    column_type = column.type.compile(dialect=engine.dialect)
+                    connection.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}"))
+                    logger.info(f"表 {table.name} 新增列: {column.name}")
+            
+            # 删除主键列上多余的二级索引（主键约束本身已带有索引）
+            model_index_names = {index.name for index in table.indexes}
+            for index in inspector.get_indexes(table.name):
+                if index["column_names"] == ["id"] and index["name"] not in model_index_names:
+                    connection.execute(text(f"DROP INDEX {index['name']}"))
+                    logger.info(f"表 {table.name} 删除多余索引: {index['name']}")
+        
+        if "head_word_norm" in table.columns:
+            _backfill_head_word_norm(table)
+        
+        existing_indexes = {index["name"]: index for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            existing = existing_indexes.get(index.name)
+            # 旧版本中同名的非唯一索引需要替换为唯一索引
+            if existing is not None and (existing["unique"] or not index.unique):
+                continue
+            try:
+                with engine.begin() as connection:
+                    if index.unique and len(index.columns) == 1:
+                        # 先检查重复值，存在重复时保留原有索引（SQLite 的 DDL 不在事务中回滚）
+                        column = next(iter(index.columns))
+                        duplicates = connection.execute(
+                            select(func.count(column) - func.count(column.distinct()))
+                        ).scalar()
+                        if duplicates:
+                            raise ValueError(f"存在 {duplicates} 条重复的 {column.name}")
+                    if existing is not None:
+                        index.drop(bind=connection)
+                    index.create(bind=connection)
+                logger.info(f"表 {table.name} 创建索引: {index.name}")
+            except Exception as e:
+                if index.unique:
+                    logger.error(
+                        f"表 {table.name} 无法创建唯一索引 {index.name}: {e}；"
+                        f"请先执行一次全量同步清除重复或为空的单词ID，否则增量同步将失败"
+                    )
+                else:
+                    logger.warning(f"创建索引 {index.name} 失败: {e}")
+
+
+def _backfill_head_word_norm(table) -> None:
+    """
+    为 head_word_norm 为空的已有记录分批回填规范化单词，
+    规则与同步时相同（normalize_head_word），否则升级后在重新同步之前单词查询没有结果
+    
+    Args:
+        table: 包含 head_word 和 head_word_norm 列的表
+    """
+    # app.models 依赖本模块，在函数内导入
+    from app.models.vocabulary import normalize_head_word
+    
+    update = (
+        table.update()
+        .where(table.c.id == bindparam("row_id"))
+        .values(head_word_norm=bindparam("norm"))
+    )
+    total = 0
+    while True:
+        with engine.begin() as connection:
+            rows = connection.execute(
+                select(table.c.id, table.c.head_word)
+                .where(table.c.head_word_norm.is_(None))
+                .limit(BACKFILL_BATCH_SIZE)
+            ).all()
+            if not rows:
+                break
+            connection.execute(update, [
+                {"row_id": row_id, "norm": normalize_head_word(head_word)}
+                for row_id, head_word in rows
+            ])
+        total += len(rows)
+    
+    if total:
+        logger.info(f"表 {table.name} 回填规范化单词: {total} 条记录")
+
+
 def check_db_connection() -> bool:
     """
     检查数据库连接是否正常
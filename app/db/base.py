@@ -33,7 +33,6 @@ class BaseModel(Base, TimestampMixin):
     id = Column(
         Integer,
         primary_key=True,
-        index=True,
         autoincrement=True,
         comment="主键ID"
     )
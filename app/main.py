@@ -1,6 +1,7 @@
 # app/main.py
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Depends
+from fastapi.responses import PlainTextResponse
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 from loguru import logger
@@ -8,6 +9,7 @@ from loguru import logger
 from app.db import get_db, init_db, check_db_connection
 from app.core.config import settings
 from app.api import vocabulary
+from app.service.sync_report import load_latest_sync_report, render_sync_metrics
 
 
 @asynccontextmanager
@@ -92,6 +94,18 @@ async def health_check(db: Session = Depends(get_db)):
         }
 
 
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """
+    监控指标接口
+    以 Prometheus 文本格式返回最近一次词汇同步的运行报告
+    """
+    return PlainTextResponse(
+        render_sync_metrics(load_latest_sync_report()),
+        media_type="text/plain; version=0.0.4"
+    )
+
+
 @app.get("/hello/{name}")
 async def say_hello(name: str):
     """
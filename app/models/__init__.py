@@ -4,7 +4,8 @@ from .vocabulary import (
     KaoyanVocabulary,
     Level4Vocabulary,
     Level8Vocabulary,
-    TABLE_MODEL_MAPPING
+    TABLE_MODEL_MAPPING,
+    normalize_head_word
 )
 
 __all__ = [
@@ -13,5 +14,6 @@ __all__ = [
     "KaoyanVocabulary",
     "Level4Vocabulary",
     "Level8Vocabulary",
-    "TABLE_MODEL_MAPPING"
+    "TABLE_MODEL_MAPPING",
+    "normalize_head_word"
 ]
\ No newline at end of file
@@ -1,7 +1,23 @@
+import unicodedata
+
 from sqlalchemy import Column, Integer, String, Text, DateTime, func
 from app.db.base import BaseModel
 
 
+def normalize_head_word(word: str) -> str:
+    """
+    规范化单词，用于不区分大小写的查询
+    先做 Unicode NFKC 规范化（如全角字母转半角），再去除首尾空白并转为小写
+    
+    Args:
+        word: 原始单词
+        
+    Returns:
+        规范化后的单词
+    """
+    return unicodedata.normalize("NFKC", word or "").strip().lower()
+
+
 class CET4Vocabulary(BaseModel):
     """
     CET4词汇表模型
@@ -10,11 +26,13 @@ class CET4Vocabulary(BaseModel):
     
     word_rank = Column(Integer, nullable=False, comment="单词序号")
     head_word = Column(String(100), nullable=False, index=True, comment="单词")
+    head_word_norm = Column(String(100), index=True, comment="规范化单词（NFKC、去空白、小写）")
     translation = Column(Text, comment="中文翻译")
     book_id = Column(String(50), comment="单词书ID")
-    word_id = Column(String(50), comment="单词ID")
+    word_id = Column(String(50), unique=True, index=True, comment="单词ID")
     us_phone = Column(String(100), comment="美音音标")
     uk_phone = Column(String(100), comment="英音音标")
+    content_hash = Column(String(40), comment="同步内容哈希")
     
     def __repr__(self):
         return f"<CET4Vocabulary(head_word='{self.head_word}')>"
@@ -28,11 +46,13 @@ class CET6Vocabulary(BaseModel):
     
     word_rank = Column(Integer, nullable=False, comment="单词序号")
     head_word = Column(String(100), nullable=False, index=True, comment="单词")
+    head_word_norm = Column(String(100), index=True, comment="规范化单词（NFKC、去空白、小写）")
     translation = Column(Text, comment="中文翻译")
     book_id = Column(String(50), comment="单词书ID")
-    word_id = Column(String(50), comment="单词ID")
+    word_id = Column(String(50), unique=True, index=True, comment="单词ID")
     us_phone = Column(String(100), comment="美音音标")
     uk_phone = Column(String(100), comment="英音音标")
+    content_hash = Column(String(40), comment="同步内容哈希")
     
     def __repr__(self):
         return f"<CET6Vocabulary(head_word='{self.head_word}')>"
@@ -46,11 +66,13 @@ class KaoyanVocabulary(BaseModel):
     
     word_rank = Column(Integer, nullable=False, comment="单词序号")
     head_word = Column(String(100), nullable=False, index=True, comment="单词")
+    head_word_norm = Column(String(100), index=True, comment="规范化单词（NFKC、去空白、小写）")
     translation = Column(Text, comment="中文翻译")
     book_id = Column(String(50), comment="单词书ID")
-    word_id = Column(String(50), comment="单词ID")
+    word_id = Column(String(50), unique=True, index=True, comment="单词ID")
     us_phone = Column(String(100), comment="美音音标")
     uk_phone = Column(String(100), comment="英音音标")
+    content_hash = Column(String(40), comment="同步内容哈希")
     
     def __repr__(self):
         return f"<KaoyanVocabulary(head_word='{self.head_word}')>"
@@ -64,11 +86,13 @@ class Level4Vocabulary(BaseModel):
     
     word_rank = Column(Integer, nullable=False, comment="单词序号")
     head_word = Column(String(100), nullable=False, index=True, comment="单词")
+    head_word_norm = Column(String(100), index=True, comment="规范化单词（NFKC、去空白、小写）")
     translation = Column(Text, comment="中文翻译")
     book_id = Column(String(50), comment="单词书ID")
-    word_id = Column(String(50), comment="单词ID")
+    word_id = Column(String(50), unique=True, index=True, comment="单词ID")
     us_phone = Column(String(100), comment="美音音标")
     uk_phone = Column(String(100), comment="英音音标")
+    content_hash = Column(String(40), comment="同步内容哈希")
     
     def __repr__(self):
         return f"<Level4Vocabulary(head_word='{self.head_word}')>"
@@ -82,11 +106,13 @@ class Level8Vocabulary(BaseModel):
     
     word_rank = Column(Integer, nullable=False, comment="单词序号")
     head_word = Column(String(100), nullable=False, index=True, comment="单词")
+    head_word_norm = Column(String(100), index=True, comment="规范化单词（NFKC、去空白、小写）")
     translation = Column(Text, comment="中文翻译")
     book_id = Column(String(50), comment="单词书ID")
-    word_id = Column(String(50), comment="单词ID")
+    word_id = Column(String(50), unique=True, index=True, comment="单词ID")
     us_phone = Column(String(100), comment="美音音标")
     uk_phone = Column(String(100), comment="英音音标")
+    content_hash = Column(String(40), comment="同步内容哈希")
     
     def __repr__(self):
         return f"<Level8Vocabulary(head_word='{self.head_word}')>"
@@ -0,0 +1,169 @@
+"""
+词汇同步运行报告
+
+同步脚本每次运行结束后写出一份 JSON 报告（按文件、按阶段统计吞吐量和资源占用），
+同时更新 latest.json，API 的 /metrics 接口读取最新报告并以 Prometheus 文本格式输出。
+"""
+
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from loguru import logger
+
+from app.core.config import settings
+
+try:
+    import resource
+except ImportError:  # Windows 没有 resource 模块
+    resource = None
+
+
+SYNC_REPORT_VERSION = 1
+LATEST_REPORT_NAME = "latest.json"
+
+# 每个文件报告中输出为指标的数值字段及说明
+FILE_METRICS = (
+    ("lines_read", "读取的行数"),
+    ("decode_failures", "JSON解析失败的行数"),
+    ("extract_failures", "字段提取失败的记录数"),
+    ("skipped_word_ids", "单词ID为空或重复而跳过的记录数"),
+    ("rows_written", "写入的行数"),
+    ("bytes_read", "读取的字节数"),
+    ("wall_seconds", "同步耗时（秒）"),
+    ("cpu_seconds", "同步占用的CPU时间（秒）"),
+    ("rows_per_second", "每秒写入行数"),
+    ("peak_rss_bytes", "同步进程的峰值常驻内存（字节）"),
+)
+
+
+def resolve_report_dir(path: Optional[str] = None) -> Path:
+    """
+    解析报告目录路径，相对路径以项目根目录为基准
+    """
+    report_dir = Path(path or settings.sync_report_dir)
+    if not report_dir.is_absolute():
+        project_root = Path(__file__).parent.parent.parent
+        report_dir = project_root / report_dir
+    return report_dir
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """
+    获取当前进程的峰值常驻内存（字节），平台不支持时返回 None
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux 以 KB 为单位，macOS 以字节为单位
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _write_json(path: Path, data: Dict[str, Any]):
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+def write_sync_report(report: Dict[str, Any], report_dir: Path) -> Path:
+    """
+    写入同步报告，并原子替换 latest.json
+
+    Args:
+        report: 同步报告
+        report_dir: 报告目录
+
+    Returns:
+        本次报告的文件路径
+    """
+    report_dir.mkdir(parents=True, exist_ok=True)
+    started = time.strftime("%Y%m%d_%H%M%S", time.localtime(report["started_at"]))
+    report_path = report_dir / f"sync_report_{started}_{os.getpid()}.json"
+    _write_json(report_path, report)
+    _write_json(report_dir / LATEST_REPORT_NAME, report)
+    return report_path
+
+
+def load_latest_sync_report(report_dir: Optional[Path] = None) -> Optional[Dict[str, Any]]:
+    """
+    读取最新的同步报告，不存在或无法解析时返回 None
+    """
+    path = (report_dir or resolve_report_dir()) / LATEST_REPORT_NAME
+    if not path.exists():
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        logger.error(f"读取同步报告失败 {path}: {e}")
+        return None
+
+
+def _escape_label(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _format_labels(labels: Dict[str, Any]) -> str:
+    return ",".join(f'{key}="{_escape_label(value)}"' for key, value in labels.items())
+
+
+def _format_value(value: Any) -> str:
+    if isinstance(value, (bool, int)):
+        return str(int(value))
+    return repr(float(value))
+
+
+def _metric(lines: List[str], name: str, help_text: str, samples: List[tuple]):
+    """
+    追加一个 gauge 指标及其样本，跳过值为空的样本
+    """
+    samples = [(labels, value) for labels, value in samples if value is not None]
+    if not samples:
+        return
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} gauge")
+    for labels, value in samples:
+        label_text = f"{{{_format_labels(labels)}}}" if labels else ""
+        lines.append(f"{name}{label_text} {_format_value(value)}")
+
+
+def render_sync_metrics(report: Optional[Dict[str, Any]]) -> str:
+    """
+    将同步报告渲染为 Prometheus 文本格式
+
+    Args:
+        report: 同步报告，为 None 时只输出说明注释
+
+    Returns:
+        Prometheus 文本格式的指标
+    """
+    if report is None:
+        return "# 暂无词汇同步报告\n"
+
+    lines: List[str] = []
+    _metric(lines, "vocab_sync_last_run_timestamp_seconds", "最近一次同步结束时间",
+            [({}, report.get("finished_at"))])
+    _metric(lines, "vocab_sync_last_run_success", "最近一次同步是否全部成功",
+            [({}, int(bool(report.get("success"))))])
+    _metric(lines, "vocab_sync_last_run_wall_seconds", "最近一次同步总耗时（秒）",
+            [({}, report.get("wall_seconds"))])
+    _metric(lines, "vocab_sync_last_run_peak_rss_bytes", "最近一次同步的峰值常驻内存（字节）",
+            [({}, report.get("peak_rss_bytes"))])
+
+    files = report.get("files", [])
+    _metric(lines, "vocab_sync_file_success", "文件是否同步成功",
+            [({"file": item["file"], "table": item["table"]}, int(bool(item.get("success")))) for item in files])
+    for field, help_text in FILE_METRICS:
+        _metric(lines, f"vocab_sync_file_{field}", help_text,
+                [({"file": item["file"], "table": item["table"]}, item.get(field)) for item in files])
+    _metric(lines, "vocab_sync_file_stage_seconds", "文件各阶段耗时（秒）", [
+        ({"file": item["file"], "stage": stage}, seconds)
+        for item in files
+        for stage, seconds in item.get("stages", {}).items()
+    ])
+
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,309 @@
+"""
+词汇二进制快照
+
+由同步脚本生成，API 以只读 mmap 方式加载，所有 worker 共享同一份页缓存。
+
+文件布局（小端序，各段按 8 字节对齐）:
+    文件头:   magic(8s) | version(u32) | book_count(u32)
+    目录项:   book_name(16s) | count(u32) | reserved(u32) | section_offset(u64)
+    词书段:   ids[n](u32) | ranks[n](u32) | order[n](u32) | nulls[n](u32) | offsets[n*F+1](u32) | heap
+
+其中 heap 为 UTF-8 字符串堆，第 i 条记录的第 f 个字符串字段位于
+heap[offsets[i*F+f]:offsets[i*F+f+1]]；order 为按规范化单词排序后的下标，用于不区分大小写的二分查找；
+nulls[i] 的第 f 位表示第 f 个字符串字段在数据库中为 NULL，读取时还原为 None。
+"""
+
+import mmap
+import os
+import random
+import struct
+import threading
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from loguru import logger
+
+from app.core.config import settings
+from app.models.vocabulary import normalize_head_word
+
+
+SNAPSHOT_MAGIC = b"VOCSNAP1"
+SNAPSHOT_VERSION = 3
+
+# 字符串字段（按存储顺序）
+STRING_FIELDS = ("head_word", "translation", "book_id", "word_id", "us_phone", "uk_phone", "head_word_norm")
+# 写入快照的记录字段顺序
+RECORD_FIELDS = ("id", "word_rank") + STRING_FIELDS
+
+_HEADER = struct.Struct("<8sII")
+_DIRECTORY_ENTRY = struct.Struct("<16sIIQ")
+_FIELD_COUNT = len(STRING_FIELDS)
+_HEAD_WORD_FIELD = STRING_FIELDS.index("head_word")
+_NORM_FIELD = STRING_FIELDS.index("head_word_norm")
+_U32 = array("I").itemsize
+
+
+def resolve_snapshot_path(path: Optional[str] = None) -> Path:
+    """
+    解析快照文件路径，相对路径以项目根目录为基准
+    """
+    snapshot_path = Path(path or settings.vocabulary_snapshot_path)
+    if not snapshot_path.is_absolute():
+        project_root = Path(__file__).parent.parent.parent
+        snapshot_path = project_root / snapshot_path
+    return snapshot_path
+
+
+def _align(size: int, alignment: int = 8) -> int:
+    return (size + alignment - 1) // alignment * alignment
+
+
+def _build_book_section(records: Iterable[Sequence[Any]]) -> Tuple[int, bytes]:
+    """
+    将一个词书的记录编码为快照段
+
+    Args:
+        records: 按 RECORD_FIELDS 顺序排列的记录元组
+
+    Returns:
+        (记录数, 编码后的二进制段)
+    """
+    ids = array("I")
+    ranks = array("I")
+    nulls = array("I")
+    offsets = array("I", [0])
+    heap = bytearray()
+    norm_words: List[str] = []
+
+    for record in records:
+        ids.append(record[0] or 0)
+        ranks.append(record[1] or 0)
+        values = list(record[2:])
+        # 尚未同步规范化列的旧数据在导出时补算
+        if not values[_NORM_FIELD]:
+            values[_NORM_FIELD] = normalize_head_word(values[_HEAD_WORD_FIELD])
+        null_mask = 0
+        for field, value in enumerate(values):
+            if value is None:
+                null_mask |= 1 << field
+            else:
+                heap += value.encode("utf-8")
+            offsets.append(len(heap))
+        nulls.append(null_mask)
+        norm_words.append(values[_NORM_FIELD])
+
+    order = array("I", sorted(range(len(norm_words)), key=norm_words.__getitem__))
+
+    section = bytearray()
+    for part in (ids, ranks, order, nulls, offsets):
+        section += part.tobytes()
+    section += b"\0" * (_align(len(section)) - len(section))
+    section += heap
+    return len(ids), bytes(section)
+
+
+def write_snapshot(path: Path, books: Dict[str, Iterable[Sequence[Any]]]) -> int:
+    """
+    写入词汇快照
+
+    先写入临时文件再原子替换，已映射旧快照的进程不受影响。
+
+    Args:
+        path: 快照文件路径
+        books: 词书名称到记录迭代器的映射
+
+    Returns:
+        写入的记录总数
+    """
+    sections = [(name, *_build_book_section(records)) for name, records in books.items()]
+
+    data_offset = _align(_HEADER.size + _DIRECTORY_ENTRY.size * len(sections))
+    directory = bytearray()
+    body = bytearray()
+    for name, count, section in sections:
+        directory += _DIRECTORY_ENTRY.pack(name.encode("ascii"), count, 0, data_offset + len(body))
+        body += section
+        body += b"\0" * (_align(len(body)) - len(body))
+
+    header = _HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(sections)) + directory
+    header += b"\0" * (data_offset - len(header))
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(header)
+        f.write(body)
+    os.replace(tmp_path, path)
+    return sum(count for _, count, _ in sections)
+
+
+class _BookView:
+    """
+    单个词书在快照中的只读视图，所有数组均直接引用 mmap 内存
+    """
+
+    def __init__(self, view: memoryview, offset: int, count: int):
+        self.count = count
+        pos = offset
+        self.ids = view[pos:pos + count * _U32].cast("I")
+        pos += count * _U32
+        self.ranks = view[pos:pos + count * _U32].cast("I")
+        pos += count * _U32
+        self.order = view[pos:pos + count * _U32].cast("I")
+        pos += count * _U32
+        self.nulls = view[pos:pos + count * _U32].cast("I")
+        pos += count * _U32
+        offsets_len = count * _FIELD_COUNT + 1
+        self.offsets = view[pos:pos + offsets_len * _U32].cast("I")
+        pos = _align(pos + offsets_len * _U32)
+        self.heap = view[pos:pos + self.offsets[offsets_len - 1]]
+
+    def _string(self, index: int, field: int) -> str:
+        slot = index * _FIELD_COUNT + field
+        return str(self.heap[self.offsets[slot]:self.offsets[slot + 1]], "utf-8")
+
+    def record(self, index: int) -> Dict[str, Any]:
+        """
+        解码第 index 条记录
+        """
+        item = {"id": self.ids[index], "word_rank": self.ranks[index]}
+        null_mask = self.nulls[index]
+        for field, name in enumerate(STRING_FIELDS):
+            item[name] = None if null_mask >> field & 1 else self._string(index, field)
+        return item
+
+    def find(self, norm_word: str) -> List[int]:
+        """
+        按规范化单词二分查找，返回所有匹配记录的下标
+        """
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._string(self.order[mid], _NORM_FIELD) < norm_word:
+                lo = mid + 1
+            else:
+                hi = mid
+        matches = []
+        while lo < self.count and self._string(self.order[lo], _NORM_FIELD) == norm_word:
+            matches.append(self.order[lo])
+            lo += 1
+        return matches
+
+    def release(self):
+        for part in (self.ids, self.ranks, self.order, self.nulls, self.offsets, self.heap):
+            part.release()
+
+
+class VocabularySnapshot:
+    """
+    词汇快照读取器
+    以只读方式 mmap 快照文件，查询与随机抽取均不复制整表数据
+    """
+
+    def __init__(self, path: Path):
+        """
+        打开快照文件
+
+        Args:
+            path: 快照文件路径
+        """
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            stat = os.fstat(f.fileno())
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.identity = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        self._view = memoryview(self._mmap)
+        self._books: Dict[str, _BookView] = {}
+
+        magic, version, book_count = _HEADER.unpack_from(self._view, 0)
+        if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+            self.close()
+            raise ValueError(f"无效的词汇快照文件: {self.path}")
+
+        for i in range(book_count):
+            name, count, _, offset = _DIRECTORY_ENTRY.unpack_from(
+                self._view, _HEADER.size + i * _DIRECTORY_ENTRY.size
+            )
+            self._books[name.rstrip(b"\0").decode("ascii")] = _BookView(self._view, offset, count)
+
+    def has_book(self, book: str) -> bool:
+        return book in self._books
+
+    def count(self, book: str) -> int:
+        """
+        获取词书的单词数量
+        """
+        return self._books[book].count
+
+    def random_words(self, book: str, count: int) -> List[Dict[str, Any]]:
+        """
+        从词书中随机抽取单词，仅解码被抽中的记录
+
+        Args:
+            book: 词书名称
+            count: 抽取数量
+
+        Returns:
+            词汇记录列表
+        """
+        view = self._books[book]
+        indexes = random.sample(range(view.count), min(count, view.count))
+        return [view.record(i) for i in indexes]
+
+    def find_word(self, book: str, head_word: str) -> List[Dict[str, Any]]:
+        """
+        在词书中查找单词，不区分大小写
+
+        Args:
+            book: 词书名称
+            head_word: 单词
+
+        Returns:
+            匹配的词汇记录列表
+        """
+        view = self._books[book]
+        return [view.record(i) for i in view.find(normalize_head_word(head_word))]
+
+    def close(self):
+        """
+        释放内存映射
+        """
+        for view in self._books.values():
+            view.release()
+        self._view.release()
+        self._mmap.close()
+
+
+_snapshot: Optional[VocabularySnapshot] = None
+_snapshot_lock = threading.Lock()
+
+
+def get_vocabulary_snapshot() -> Optional[VocabularySnapshot]:
+    """
+    获取当前进程的词汇快照
+
+    首次调用时才映射文件；快照文件被同步脚本替换后自动重新映射。
+    快照不存在或无法读取时返回 None，调用方应回退到数据库查询。
+    """
+    global _snapshot
+    path = resolve_snapshot_path()
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+
+    identity = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+    snapshot = _snapshot
+    if snapshot is not None and snapshot.identity == identity:
+        return snapshot
+
+    with _snapshot_lock:
+        if _snapshot is None or _snapshot.identity != identity:
+            try:
+                _snapshot = VocabularySnapshot(path)
+                logger.info(f"已加载词汇快照: {path}")
+            except (OSError, ValueError, struct.error) as e:
+                logger.error(f"加载词汇快照失败 {path}: {e}")
+                _snapshot = None
+        return _snapshot
@@ -0,0 +1,98 @@
+"""
+单词等级词典
+
+由同步脚本在导出快照时一并生成，记录每个规范化单词出现在哪些词书中，
+结果分析脚本加载后即可离线统计词汇表分布，无需连接数据库。
+
+文件为 gzip 压缩的 JSON:
+    {"version": 1, "books": ["cet4", ...], "words": {"abandon": 3, ...}}
+
+其中 words 的值为位掩码，第 i 位表示单词出现在 books[i] 中。
+"""
+
+import gzip
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Set
+
+from app.core.config import settings
+
+
+WORD_LEVELS_VERSION = 1
+
+
+def resolve_word_levels_path(path: Optional[str] = None) -> Path:
+    """
+    解析单词等级词典路径，相对路径以项目根目录为基准
+    """
+    word_levels_path = Path(path or settings.word_levels_path)
+    if not word_levels_path.is_absolute():
+        project_root = Path(__file__).parent.parent.parent
+        word_levels_path = project_root / word_levels_path
+    return word_levels_path
+
+
+def write_word_levels(path: Path, books: Dict[str, Iterable[str]]) -> int:
+    """
+    写入单词等级词典
+
+    先写入临时文件再原子替换，内容相同时生成的文件字节一致。
+
+    Args:
+        path: 词典文件路径
+        books: 词书名称到规范化单词迭代器的映射，词书顺序决定位掩码的位序
+
+    Returns:
+        写入的单词数
+    """
+    masks: Dict[str, int] = {}
+    for bit, words in enumerate(books.values()):
+        for word in words:
+            if word:
+                masks[word] = masks.get(word, 0) | (1 << bit)
+
+    data = {
+        "version": WORD_LEVELS_VERSION,
+        "books": list(books),
+        "words": dict(sorted(masks.items()))
+    }
+    payload = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        with gzip.GzipFile(fileobj=f, mode="wb", mtime=0) as gz:
+            gz.write(payload)
+    os.replace(tmp_path, path)
+    return len(masks)
+
+
+def load_word_levels(path: Path) -> Dict[str, Set[str]]:
+    """
+    加载单词等级词典
+
+    Args:
+        path: 词典文件路径
+
+    Returns:
+        规范化单词到所属词书名称集合的映射
+
+    Raises:
+        OSError: 文件无法读取
+        ValueError: 文件格式或版本不匹配
+    """
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        data = json.load(f)
+    if not isinstance(data, dict) or data.get("version") != WORD_LEVELS_VERSION:
+        raise ValueError(f"无效的单词等级词典文件: {path}")
+
+    books = data["books"]
+    # 相同的位掩码共享同一个集合，词典中只有少量不同的组合
+    book_sets: Dict[int, Set[str]] = {}
+    word_books = {}
+    for word, mask in data["words"].items():
+        if mask not in book_sets:
+            book_sets[mask] = {book for bit, book in enumerate(books) if mask >> bit & 1}
+        word_books[word] = book_sets[mask]
+    return word_books
@@ -6,10 +6,13 @@ Preply词汇量测试脚本启动入口
 使用方法:
     python run_preply_test.py                # 运行词汇量测试
     python run_preply_test.py --headless     # 无头模式运行
+    python run_preply_test.py --batch 100    # 无头浏览器池批量运行100个测试
+    python run_preply_test.py --profiles profiles.json  # 无头运行配置文件中的模拟用户
     python run_preply_test.py --help         # 显示帮助信息
 """
 
 import argparse
+import os
 import sys
 from pathlib import Path
 
@@ -17,7 +20,9 @@ from pathlib import Path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-from scripts.preply_vocab_test import VocabTestScraper, logger
+from scripts.preply_batch_runner import add_batch_arguments, run_batch_from_args
+from scripts.preply_fixture_server import add_replay_arguments, replay_target
+from scripts.preply_vocab_test import VocabTestScraper, logger, uniform_wait_timeouts
 
 
 def parse_arguments():
@@ -42,6 +47,10 @@ def parse_arguments():
   python run_preply_test.py --headless     # 无头模式运行（可能无法通过验证）
   python run_preply_test.py --timeout 60   # 设置60秒超时
   python run_preply_test.py --verify-timeout 600  # 设置验证等待时间为10分钟
+  python run_preply_test.py --batch 100 --workers 4  # 4个无头浏览器并行运行100个测试
+  python run_preply_test.py --profiles profiles.json  # 按配置文件运行模拟用户（点击数或目标等级）
+  python run_preply_test.py --batch 20 --replay      # 使用本地回放服务离线运行，无需网络
+  python run_preply_test.py --batch 20 --lean        # 精简模式：按拒绝列表拦截图片、字体和已知的第三方请求，复用预热的用户数据目录
         """
     )
     
@@ -65,6 +74,23 @@ def parse_arguments():
         help="Cloudflare验证等待超时时间（秒），默认300秒（5分钟）"
     )
     
+    parser.add_argument(
+        "--wait-timeout",
+        type=float,
+        help="页面元素条件等待的统一上限（秒），默认按等待类型使用10~20秒"
+    )
+    
+    parser.add_argument(
+        "--batch",
+        type=int,
+        metavar="N",
+        help="批量模式：使用无头浏览器池并行运行N个随机点击测试，结果写入 preply_results/"
+    )
+    
+    add_batch_arguments(parser)
+    
+    add_replay_arguments(parser)
+    
     return parser.parse_args()
 
 
@@ -76,7 +102,7 @@ def execute_vocab_test(test):
         test: PreplyVocabTest实例
     """
     print("\n🎯 开始Preply词汇量测试...")
-    print("目标网站: https://preply.com/en/learn/english/test-your-vocab")
+    print(f"目标网站: {test.target_url}")
     print("测试说明: 通过两轮点击认识的单词来评估您的词汇量")
     print("-" * 60)
     
@@ -105,7 +131,7 @@ def execute_vocab_test(test):
             print("输入无效，请输入数字")
     
     print(f"\n📚 开始词汇量测试，第一轮将点击 {round1_clicks} 个认识的词汇，第二轮将点击 {round2_clicks} 个认识的词汇...")
-    print("💡 测试流程: 第一轮测试完成后等待3秒进入第二轮，第二轮完成后等待5秒获取最终词汇量评估")
+    print("💡 测试流程: 第一轮完成后等待第二轮单词出现即进入第二轮，第二轮完成后等待最终词汇量显示即读取评估结果（不使用固定延时）")
     
     result = test.random_click_vocab_labels(round1_clicks, round2_clicks)
     
@@ -159,6 +185,25 @@ def execute_vocab_test(test):
     return result
 
 
+def execute_batch_test(args):
+    """
+    批量模式：无头、非交互地并行运行随机生成或配置文件中的测试
+    
+    Args:
+        args: 命令行参数
+    """
+    logger.info(f"批量模式启动，{args.workers} 个浏览器，测试配置: {args.profiles or f'随机生成 {args.batch} 个'}")
+    try:
+        succeeded = run_batch_from_args(args, args.batch)
+    except KeyboardInterrupt:
+        print("\n\n⚠️  用户中断了批量测试")
+        logger.info("用户中断程序")
+        sys.exit(1)
+    
+    if not succeeded:
+        sys.exit(1)
+
+
 def main():
     """
     主函数
@@ -166,6 +211,10 @@ def main():
     # 解析命令行参数
     args = parse_arguments()
     
+    if args.batch or args.profiles:
+        execute_batch_test(args)
+        return
+    
     logger.info("=" * 60)
     logger.info("Preply词汇量测试脚本启动")
     logger.info(f"无头模式: {'是' if args.headless else '否'}")
@@ -189,15 +238,20 @@ def main():
     print("=" * 60)
     
     try:
-        # 创建测试实例
-        test = VocabTestScraper(
-            headless=args.headless,
-            timeout=args.timeout,
-            verify_timeout=args.verify_timeout
-        )
-        
-        # 直接启动词汇量测试
-        execute_vocab_test(test)
+        with replay_target(args) as target_url:
+            # 创建测试实例
+            test = VocabTestScraper(
+                headless=args.headless,
+                timeout=args.timeout,
+                verify_timeout=args.verify_timeout,
+                wait_timeouts=uniform_wait_timeouts(args.wait_timeout),
+                target_url=target_url,
+                lean=args.lean,
+                profile_dir=os.path.join(args.profile_dir, 'default') if args.profile_dir else None
+            )
+            
+            # 直接启动词汇量测试
+            execute_vocab_test(test)
         
         print("\n🎉 词汇量测试完成！")
         
@@ -0,0 +1,377 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+词汇量估算基准校准脚本
+
+读取 analyze_preply_results.py 输出的分析明细，将各用户在各词汇表中的掌握率和 Preply 官方词汇量
+载入 NumPy 数组，拟合 VocabularyEstimateService.VOCABULARY_BENCHMARKS 中的词汇总量和权重，
+使估算结果与 Preply 结果的平均相对误差最小，并将最优参数写入 JSON 文件。
+
+拟合分两步:
+1. 估算值对“词汇总量 × 权重”是线性的，先用按 Preply 结果加权的最小二乘求出各词汇表的系数初值
+2. 在初值附近进行随机坐标搜索，每轮向量化评估一批候选参数（与估算服务相同的取整规则），逐步缩小步长
+
+使用方法:
+    python scripts/calibrate_benchmarks.py
+    python scripts/calibrate_benchmarks.py --input preply_analysis_report/preply_results_analysis_20250101_120000.ndjson
+"""
+
+import argparse
+import json
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+import logging
+
+import numpy as np
+
+# 添加项目根目录到Python路径
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.service.vocabulary_service import VocabularyEstimateService
+
+# 配置日志
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# 词汇表顺序，与估算服务的基准一致
+VOCAB_TYPES = tuple(VocabularyEstimateService.VOCABULARY_BENCHMARKS)
+
+DEFAULT_REPORT_DIR = project_root / "preply_analysis_report"
+
+# 每次向量化评估的候选数，限制 (候选数 × 用户数 × 词汇表数) 临时数组的大小
+EVALUATE_CHUNK_SIZE = 256
+
+# 坐标搜索扰动权重时的下限，非负最小二乘置为 0 的权重也能被重新搜索到
+MIN_SEARCH_WEIGHT = 0.01
+
+
+def find_latest_details(report_dir: Path) -> Optional[Path]:
+    """
+    查找报告目录中最新的分析明细文件（NDJSON）
+    """
+    candidates = sorted(report_dir.glob("preply_results_analysis_*.ndjson"))
+    return candidates[-1] if candidates else None
+
+
+def _iter_results(path: Path):
+    """
+    逐个读取分析结果，支持 NDJSON 明细和包含 detailed_results 的 JSON 报告
+    """
+    if path.suffix == ".ndjson":
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    yield json.loads(line)
+    else:
+        with open(path, "r", encoding="utf-8") as f:
+            yield from json.load(f).get("detailed_results", [])
+
+
+def load_samples(paths: List[Path]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    将分析结果载入数组
+
+    Args:
+        paths: 分析明细文件路径
+
+    Returns:
+        (掌握率矩阵 [用户数, 词汇表数], Preply 词汇量 [用户数])，
+        跳过没有有效测试或 Preply 结果无法解析的用户
+    """
+    mastery_rows = []
+    targets = []
+    skipped = 0
+    for path in paths:
+        for result in _iter_results(path):
+            distribution = result.get("distribution", {})
+            try:
+                target = int(result.get("preply_result"))
+                tested = distribution[VOCAB_TYPES[0]]["total_tested"]
+            except (KeyError, TypeError, ValueError):
+                skipped += 1
+                continue
+            if target <= 0 or tested <= 0:
+                skipped += 1
+                continue
+            mastery_rows.append([
+                distribution[vocab_type]["highest_level_count"] / distribution[vocab_type]["total_tested"]
+                for vocab_type in VOCAB_TYPES
+            ])
+            targets.append(target)
+
+    if skipped:
+        logger.warning(f"跳过 {skipped} 个无效的分析结果")
+    return np.array(mastery_rows, dtype=np.float64).reshape(-1, len(VOCAB_TYPES)), np.array(targets, dtype=np.float64)
+
+
+def evaluate(totals: np.ndarray, weights: np.ndarray, mastery: np.ndarray, targets: np.ndarray) -> np.ndarray:
+    """
+    向量化计算一批候选参数的平均相对误差（百分比）
+    估算方式与 VocabularyEstimateService.estimate_vocabulary 一致: sum(int(掌握率 × 总量) × 权重) 取整
+
+    Args:
+        totals: 候选词汇总量 [候选数, 词汇表数]
+        weights: 候选权重 [候选数, 词汇表数]
+        mastery: 掌握率矩阵 [用户数, 词汇表数]
+        targets: Preply 词汇量 [用户数]
+
+    Returns:
+        各候选的平均相对误差 [候选数]
+    """
+    errors = np.empty(len(totals))
+    for start in range(0, len(totals), EVALUATE_CHUNK_SIZE):
+        end = start + EVALUATE_CHUNK_SIZE
+        words = np.floor(mastery[None, :, :] * totals[start:end, None, :])
+        # 按词汇表顺序逐项累加，浮点舍入与估算服务一致
+        estimates = np.zeros(words.shape[:2])
+        for i in range(len(VOCAB_TYPES)):
+            estimates += words[:, :, i] * weights[start:end, i, None]
+        estimates = np.floor(estimates)
+        errors[start:end] = np.mean(np.abs(estimates - targets) / targets, axis=1) * 100
+    return errors
+
+
+def fit_coefficients(mastery: np.ndarray, targets: np.ndarray) -> np.ndarray:
+    """
+    以相对误差为目标的非负最小二乘，求各词汇表“总量 × 权重”的系数
+
+    每行除以 Preply 词汇量，使残差为相对误差；出现负系数时将其固定为 0 后重新求解。
+
+    Args:
+        mastery: 掌握率矩阵 [用户数, 词汇表数]
+        targets: Preply 词汇量 [用户数]
+
+    Returns:
+        系数 [词汇表数]
+    """
+    design = mastery / targets[:, None]
+    rhs = np.ones(len(targets))
+    active = np.ones(mastery.shape[1], dtype=bool)
+    coefficients = np.zeros(mastery.shape[1])
+    while active.any():
+        solution, *_ = np.linalg.lstsq(design[:, active], rhs, rcond=None)
+        if (solution >= 0).all():
+            coefficients[active] = solution
+            break
+        # 去掉最负的系数后重新求解
+        indexes = np.flatnonzero(active)
+        active[indexes[np.argmin(solution)]] = False
+    return coefficients
+
+
+def coordinate_search(
+    totals: np.ndarray,
+    weights: np.ndarray,
+    mastery: np.ndarray,
+    targets: np.ndarray,
+    rounds: int,
+    candidates: int,
+    seed: int
+) -> Tuple[np.ndarray, np.ndarray, float, int]:
+    """
+    随机坐标搜索: 每轮在当前最优参数附近按对数正态扰动生成一批候选，向量化评估后保留最优，
+    连续两轮没有改进时缩小步长；被扰动的权重先提升到 MIN_SEARCH_WEIGHT，为 0 的权重也能恢复
+
+    Args:
+        totals: 初始词汇总量 [词汇表数]
+        weights: 初始权重 [词汇表数]
+        mastery: 掌握率矩阵
+        targets: Preply 词汇量
+        rounds: 搜索轮数
+        candidates: 每轮候选数
+        seed: 随机种子
+
+    Returns:
+        (最优词汇总量, 最优权重, 最优平均相对误差, 评估的候选总数)
+    """
+    rng = np.random.default_rng(seed)
+    best_totals, best_weights = totals.astype(np.float64), weights.astype(np.float64)
+    best_error = evaluate(best_totals[None, :], best_weights[None, :], mastery, targets)[0]
+    step = 0.2
+    stale = 0
+    evaluated = 1
+
+    for _ in range(rounds):
+        # 每个候选随机扰动部分坐标，其余坐标保持不变
+        mask = rng.random((candidates, len(VOCAB_TYPES))) < 0.5
+        total_noise = np.exp(rng.normal(0, step, (candidates, len(VOCAB_TYPES))) * mask)
+        weight_noise = np.exp(rng.normal(0, step, (candidates, len(VOCAB_TYPES))) * mask)
+        candidate_totals = np.maximum(np.round(best_totals * total_noise), 1)
+        candidate_weights = np.where(mask, np.maximum(best_weights, MIN_SEARCH_WEIGHT) * weight_noise, best_weights)
+
+        errors = evaluate(candidate_totals, candidate_weights, mastery, targets)
+        evaluated += candidates
+        index = int(np.argmin(errors))
+        if errors[index] < best_error:
+            best_error = float(errors[index])
+            best_totals, best_weights = candidate_totals[index], candidate_weights[index]
+            stale = 0
+        else:
+            stale += 1
+            if stale >= 2:
+                step = max(step / 2, 0.005)
+                stale = 0
+
+    return best_totals, best_weights, float(best_error), evaluated
+
+
+def calibrate(
+    mastery: np.ndarray,
+    targets: np.ndarray,
+    rounds: int = 200,
+    candidates: int = 1024,
+    seed: int = 0
+) -> Dict[str, Any]:
+    """
+    校准词汇总量和权重
+
+    最小二乘只能确定“总量 × 权重”的乘积，初值保留当前词汇总量并据此换算权重，
+    再由坐标搜索同时调整两者（取整规则使两者不完全等价）。
+    平均掌握率不参与估算值的计算，沿用当前基准的值，估算服务用它作除数计算相对表现。
+
+    Args:
+        mastery: 掌握率矩阵 [用户数, 词汇表数]
+        targets: Preply 词汇量 [用户数]
+        rounds: 坐标搜索轮数
+        candidates: 每轮候选数
+        seed: 随机种子
+
+    Returns:
+        校准结果，包含新的基准和前后误差
+
+    Raises:
+        ValueError: 当前基准的平均掌握率不为正数时
+    """
+    benchmarks = VocabularyEstimateService.VOCABULARY_BENCHMARKS
+    current_totals = np.array([benchmarks[vocab_type]["total_words"] for vocab_type in VOCAB_TYPES], dtype=np.float64)
+    current_weights = np.array([benchmarks[vocab_type]["weight"] for vocab_type in VOCAB_TYPES], dtype=np.float64)
+    baseline_error = float(evaluate(current_totals[None, :], current_weights[None, :], mastery, targets)[0])
+
+    coefficients = fit_coefficients(mastery, targets)
+    lstsq_weights = coefficients / current_totals
+    lstsq_error = float(evaluate(current_totals[None, :], lstsq_weights[None, :], mastery, targets)[0])
+    logger.info(f"当前基准平均相对误差 {baseline_error:.2f}%，最小二乘初值 {lstsq_error:.2f}%")
+
+    # 从更好的一组参数开始搜索
+    if lstsq_error < baseline_error:
+        start_weights = lstsq_weights
+    else:
+        start_weights = current_weights
+    start_time = time.perf_counter()
+    totals, weights, error, evaluated = coordinate_search(
+        current_totals, start_weights, mastery, targets, rounds, candidates, seed
+    )
+    elapsed = time.perf_counter() - start_time
+    rate = evaluated / elapsed if elapsed > 0 else 0.0
+    logger.info(f"坐标搜索评估 {evaluated} 组参数，耗时 {elapsed:.2f}s（{rate:.0f} 组/秒），平均相对误差 {error:.2f}%")
+
+    calibrated = {}
+    for i, vocab_type in enumerate(VOCAB_TYPES):
+        average_mastery = benchmarks[vocab_type]["average_mastery"]
+        if average_mastery <= 0:
+            raise ValueError(f"{vocab_type} 的平均掌握率必须为正数: {average_mastery}")
+        calibrated[vocab_type] = {
+            "total_words": int(totals[i]),
+            "average_mastery": average_mastery,
+            "weight": round(float(weights[i]), 6)
+        }
+
+    return {
+        "samples": int(len(targets)),
+        "baseline_error": baseline_error,
+        "lstsq_error": lstsq_error,
+        "calibrated_error": error,
+        "candidates_evaluated": evaluated,
+        "candidates_per_second": rate,
+        "benchmarks": calibrated
+    }
+
+
+def parse_arguments():
+    """
+    解析命令行参数
+    """
+    parser = argparse.ArgumentParser(
+        description="词汇量估算基准校准脚本",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+输入为 analyze_preply_results.py 输出的 NDJSON 明细或 JSON 报告，可指定多个文件合并校准。
+输出文件中的 benchmarks 与 VocabularyEstimateService.VOCABULARY_BENCHMARKS 结构相同，
+确认误差改善后可替换到估算服务中。
+
+示例:
+  python scripts/calibrate_benchmarks.py                      # 使用最新的分析明细
+  python scripts/calibrate_benchmarks.py --input a.ndjson b.ndjson --rounds 500
+  python scripts/calibrate_benchmarks.py --output ./calibrated_benchmarks.json
+        """
+    )
+    parser.add_argument("--input", nargs="+", type=str, help="分析明细文件（默认: 报告目录中最新的 NDJSON 明细）")
+    parser.add_argument(
+        "--report-dir",
+        type=str,
+        default=str(DEFAULT_REPORT_DIR),
+        help="分析报告目录，用于查找默认输入和写出结果（默认: preply_analysis_report）"
+    )
+    parser.add_argument("--output", type=str, help="结果输出路径（默认: 报告目录下的 calibrated_benchmarks_<时间>.json）")
+    parser.add_argument("--rounds", type=int, default=200, help="坐标搜索轮数（默认: 200）")
+    parser.add_argument("--candidates", type=int, default=1024, help="每轮评估的候选参数组数（默认: 1024）")
+    parser.add_argument("--seed", type=int, default=0, help="随机种子（默认: 0）")
+    return parser.parse_args()
+
+
+def main():
+    """
+    主函数
+    """
+    args = parse_arguments()
+    report_dir = Path(args.report_dir)
+
+    if args.input:
+        paths = [Path(path) for path in args.input]
+    else:
+        latest = find_latest_details(report_dir)
+        if latest is None:
+            logger.error(f"报告目录中没有分析明细: {report_dir}，请先运行 analyze_preply_results.py")
+            sys.exit(1)
+        paths = [latest]
+    logger.info(f"读取分析明细: {', '.join(str(path) for path in paths)}")
+
+    mastery, targets = load_samples(paths)
+    if len(targets) < len(VOCAB_TYPES):
+        logger.error(f"有效样本只有 {len(targets)} 个，不足以校准 {len(VOCAB_TYPES)} 个词汇表的参数")
+        sys.exit(1)
+    logger.info(f"载入 {len(targets)} 个样本")
+
+    result = calibrate(mastery, targets, rounds=args.rounds, candidates=args.candidates, seed=args.seed)
+    result["inputs"] = [str(path) for path in paths]
+    result["calibrated_at"] = datetime.now().isoformat()
+
+    if args.output:
+        output_path = Path(args.output)
+    else:
+        output_path = report_dir / f"calibrated_benchmarks_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+
+    logger.info(
+        f"平均相对误差: 当前 {result['baseline_error']:.2f}% -> 校准后 {result['calibrated_error']:.2f}%"
+    )
+    for vocab_type, benchmark in result["benchmarks"].items():
+        logger.info(
+            f"  {vocab_type:<8} total_words={benchmark['total_words']:<6} "
+            f"weight={benchmark['weight']:.4f} average_mastery={benchmark['average_mastery']:.3f}"
+        )
+    logger.info(f"校准结果已写入: {output_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+合成词汇数据集生成脚本
+
+生成与 datasets/*.json 结构一致的 JSON Lines 文件（content.word.content.trans 等嵌套结构），
+用于在没有真实数据集的环境中测试和压测同步脚本。生成过程逐行写出，内存占用与行数无关。
+
+使用方法:
+    python scripts/generate_vocab_dataset.py --rows 100000 --output-dir /tmp/vocab_datasets
+"""
+
+import argparse
+import json
+import random
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterator
+import logging
+
+# 添加项目根目录到Python路径
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+# 配置日志
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# 数据文件名到真实数据集中 bookId 的映射
+BOOK_IDS = {
+    "cet4.json": "CET4luan_2",
+    "cet6.json": "CET6_2",
+    "kaoyan.json": "KaoYan_2",
+    "level4.json": "Level4luan_2",
+    "level8.json": "Level8luan_2",
+}
+
+# 音节均为“辅音+元音”形式，拼接结果可唯一切分，保证不同序号生成的单词不重复
+_ONSETS = ("b", "c", "d", "f", "g", "h", "l", "m", "n", "p", "r", "s", "t", "v", "w", "br", "cl", "st", "tr")
+_NUCLEI = ("a", "e", "i", "o", "u", "ea", "io", "ou")
+_SYLLABLES = tuple(onset + nucleus for onset in _ONSETS for nucleus in _NUCLEI)
+
+_POS = ("n", "v", "adj", "adv", "prep", "conj")
+_TRANSLATIONS = ("拒绝", "可溶的", "解决", "方法", "重要的", "迅速地", "环境", "发展", "影响", "经济的", "理论", "结构")
+
+
+def synthetic_head_word(index: int) -> str:
+    """
+    将序号编码为唯一、可读的合成单词
+
+    Args:
+        index: 单词在全局词池中的序号
+
+    Returns:
+        合成单词
+    """
+    syllables = []
+    index += 1
+    while index:
+        index, digit = divmod(index - 1, len(_SYLLABLES))
+        syllables.append(_SYLLABLES[digit])
+    return "".join(reversed(syllables))
+
+
+def generate_word_record(rank: int, word_index: int, book_id: str, rng: random.Random, sentences: int) -> Dict[str, Any]:
+    """
+    生成一条与真实数据集结构一致的单词记录
+
+    Args:
+        rank: 单词在词书中的序号（从1开始）
+        word_index: 单词在全局词池中的序号，不同词书使用相同序号时生成相同单词
+        book_id: 词书ID
+        rng: 随机数生成器
+        sentences: 每个单词附带的例句数量，用于模拟真实数据的行宽
+
+    Returns:
+        单词记录字典
+    """
+    head_word = synthetic_head_word(word_index)
+    trans = [
+        {"tranCn": rng.choice(_TRANSLATIONS), "pos": rng.choice(_POS), "tranOther": f"to {head_word} something"}
+        for _ in range(rng.randint(1, 3))
+    ]
+    detail = {
+        "trans": trans,
+        "usphone": f"'{head_word}",
+        "ukphone": f"'{head_word}ː",
+        "usspeech": f"{head_word}&type=2",
+        "ukspeech": f"{head_word}&type=1",
+        "sentence": {
+            "sentences": [
+                {"sContent": f"This sentence uses {head_word} in context number {i}.", "sCn": "这是一个例句。"}
+                for i in range(sentences)
+            ],
+            "desc": "例句"
+        },
+    }
+    return {
+        "wordRank": rank,
+        "headWord": head_word,
+        "content": {
+            "word": {
+                "wordHead": head_word,
+                "wordId": f"{book_id}_{rank}",
+                "content": detail
+            }
+        },
+        "bookId": book_id
+    }
+
+
+def iter_book_lines(
+    file_name: str,
+    rows: int,
+    book_number: int,
+    seed: int = 0,
+    sentences: int = 2,
+    invalid_rate: float = 0.0
+) -> Iterator[str]:
+    """
+    逐行生成一个词书文件的内容
+
+    相邻词书的词池有一半重叠，便于模拟同一单词出现在多个词书中的情况。
+
+    Args:
+        file_name: 数据文件名
+        rows: 记录行数
+        book_number: 词书序号，决定词池偏移
+        seed: 随机种子
+        sentences: 每个单词的例句数量
+        invalid_rate: 插入无法解析的行的比例
+
+    Yields:
+        不含换行符的JSON行
+    """
+    rng = random.Random(f"{seed}:{file_name}")
+    book_id = BOOK_IDS.get(file_name, Path(file_name).stem)
+    offset = book_number * rows // 2
+    for rank in range(1, rows + 1):
+        if invalid_rate and rng.random() < invalid_rate:
+            yield '{"wordRank": ' + str(rank) + ', "headWord": '
+        record = generate_word_record(rank, offset + rank - 1, book_id, rng, sentences)
+        yield json.dumps(record, ensure_ascii=False, separators=(",", ":"))
+
+
+def generate_dataset(
+    output_dir: Path,
+    rows: int,
+    files=tuple(BOOK_IDS),
+    seed: int = 0,
+    sentences: int = 2,
+    invalid_rate: float = 0.0
+) -> Dict[str, int]:
+    """
+    生成合成数据集目录
+
+    Args:
+        output_dir: 输出目录
+        rows: 每个文件的记录行数
+        files: 要生成的数据文件名
+        seed: 随机种子，相同参数生成的文件内容相同
+        sentences: 每个单词的例句数量
+        invalid_rate: 插入无法解析的行的比例
+
+    Returns:
+        文件名到文件字节数的映射
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    sizes = {}
+    for book_number, file_name in enumerate(files):
+        file_path = output_dir / file_name
+        with open(file_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+            for line in iter_book_lines(file_name, rows, book_number, seed, sentences, invalid_rate):
+                f.write(line)
+                f.write("\n")
+        sizes[file_name] = file_path.stat().st_size
+        logger.info(f"已生成 {file_path}: {rows} 行，{sizes[file_name] / 1024 / 1024:.1f} MB")
+    return sizes
+
+
+def parse_arguments():
+    """
+    解析命令行参数
+    """
+    parser = argparse.ArgumentParser(
+        description="合成词汇数据集生成脚本",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+示例:
+  python scripts/generate_vocab_dataset.py --rows 10000 --output-dir /tmp/vocab
+  python scripts/generate_vocab_dataset.py --rows 1000000 --files cet4.json --output-dir /tmp/vocab_1m
+  python scripts/generate_vocab_dataset.py --rows 50000 --invalid-rate 0.001 --output-dir /tmp/vocab_bad
+        """
+    )
+    parser.add_argument("--rows", type=int, default=10000, help="每个文件的记录行数（默认: 10000）")
+    parser.add_argument("--output-dir", type=str, required=True, help="输出目录")
+    parser.add_argument(
+        "--files",
+        nargs="+",
+        default=list(BOOK_IDS),
+        choices=list(BOOK_IDS),
+        help="要生成的数据文件（默认: 全部5个词书）"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="随机种子（默认: 0）")
+    parser.add_argument("--sentences", type=int, default=2, help="每个单词的例句数量，影响行宽（默认: 2）")
+    parser.add_argument("--invalid-rate", type=float, default=0.0, help="插入无法解析的行的比例（默认: 0）")
+    return parser.parse_args()
+
+
+def main():
+    """
+    主函数
+    """
+    args = parse_arguments()
+    sizes = generate_dataset(
+        Path(args.output_dir),
+        args.rows,
+        files=args.files,
+        seed=args.seed,
+        sentences=args.sentences,
+        invalid_rate=args.invalid_rate
+    )
+    logger.info(f"共生成 {len(sizes)} 个文件，{sum(sizes.values()) / 1024 / 1024:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,618 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Preply词汇测试批量运行脚本
+
+维护一个无头浏览器池：每个工作线程独占一个浏览器，并在多次测试之间复用，
+并行运行多组模拟测试配置，结果写入 preply_results/，用于快速收集估算基准校准所需的数据。
+
+测试配置（模拟用户）有两种：
+    {"name": "beginner", "round1_clicks": 3, "round2_clicks": 1}
+        每轮随机点击指定数量的单词
+    {"name": "cet6-user", "target_level": "cet6", "known_rate": 0.9, "count": 20}
+        按单词等级词典点击所属最低等级不高于目标等级的单词，每个单词以 known_rate 的概率点击
+
+配置文件为上述对象组成的 JSON 数组（或 {"profiles": [...]}），count 表示该配置重复运行的次数。
+
+使用方法:
+    python scripts/preply_batch_runner.py --tests 100 --workers 4
+    python scripts/preply_batch_runner.py --profiles profiles.json --workers 4
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+# 添加项目根目录到Python路径
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from scripts.preply_vocab_test import (
+    DEFAULT_PROFILE_DIR,
+    DEFAULT_RESULTS_DIR,
+    VocabTestScraper,
+    logger,
+    resolve_driver_path,
+    uniform_wait_timeouts
+)
+from scripts.preply_fixture_server import add_replay_arguments, replay_target
+from app.models import normalize_head_word
+from app.service.word_levels import load_word_levels, resolve_word_levels_path
+
+
+# 词汇等级由低到高的顺序，与结果分析脚本的 vocab_priority 一致
+LEVEL_PRIORITY = {
+    'cet4': 1,
+    'cet6': 2,
+    'kaoyan': 3,
+    'level4': 4,
+    'level8': 5
+}
+
+
+def generate_profiles(count: int, min_clicks: int, max_clicks: int, seed: Optional[int] = None) -> List[Dict[str, int]]:
+    """
+    生成模拟测试配置，每轮点击数在给定范围内均匀随机
+
+    Args:
+        count: 配置数量
+        min_clicks: 每轮最少点击数
+        max_clicks: 每轮最多点击数
+        seed: 随机种子
+
+    Returns:
+        List[Dict[str, int]]: 测试配置列表，包含 round1_clicks 和 round2_clicks
+    """
+    rng = random.Random(seed)
+    return [
+        {
+            'name': 'random',
+            'round1_clicks': rng.randint(min_clicks, max_clicks),
+            'round2_clicks': rng.randint(min_clicks, max_clicks)
+        }
+        for _ in range(count)
+    ]
+
+
+def load_profiles(path: str) -> List[Dict[str, Any]]:
+    """
+    加载测试配置文件，按 count 展开为逐个测试的配置
+
+    Args:
+        path: 配置文件路径
+
+    Returns:
+        List[Dict[str, Any]]: 测试配置列表
+
+    Raises:
+        ValueError: 配置格式无效
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if isinstance(data, dict):
+        data = data.get('profiles')
+    if not isinstance(data, list):
+        raise ValueError(f"配置文件应为测试配置数组: {path}")
+
+    profiles = []
+    for position, item in enumerate(data, 1):
+        if not isinstance(item, dict):
+            raise ValueError(f"第 {position} 个测试配置不是对象")
+        name = str(item.get('name', f"profile-{position}"))
+        if 'target_level' in item:
+            if item['target_level'] not in LEVEL_PRIORITY:
+                raise ValueError(f"测试配置 {name} 的 target_level 无效，可选: {', '.join(LEVEL_PRIORITY)}")
+            known_rate = float(item.get('known_rate', 1.0))
+            if not 0 < known_rate <= 1:
+                raise ValueError(f"测试配置 {name} 的 known_rate 应在 (0, 1] 范围内")
+            profile = {'name': name, 'target_level': item['target_level'], 'known_rate': known_rate}
+        else:
+            try:
+                profile = {
+                    'name': name,
+                    'round1_clicks': int(item['round1_clicks']),
+                    'round2_clicks': int(item['round2_clicks'])
+                }
+            except (KeyError, TypeError, ValueError):
+                raise ValueError(f"测试配置 {name} 需要 target_level 或整数 round1_clicks/round2_clicks")
+            if profile['round1_clicks'] < 0 or profile['round2_clicks'] < 0:
+                raise ValueError(f"测试配置 {name} 的点击数不能为负数")
+        profiles.extend(dict(profile) for _ in range(int(item.get('count', 1))))
+    return profiles
+
+
+def describe_profile(profile: Dict[str, Any]) -> str:
+    """
+    生成测试配置的简短描述
+    """
+    if 'target_level' in profile:
+        return f"目标等级 {profile['target_level']}，认识率 {profile['known_rate']:.0%}"
+    return f"点击 {profile['round1_clicks']}+{profile['round2_clicks']} 个"
+
+
+class TargetLevelSelector:
+    """
+    按目标等级选词
+    单词所属的最低等级不高于目标等级时视为认识，并以 known_rate 的概率点击；不在词典中的单词不点击
+    """
+
+    def __init__(self, word_levels: Dict[str, Set[str]], target_level: str, known_rate: float = 1.0):
+        """
+        初始化选词器
+
+        Args:
+            word_levels: load_word_levels 返回的单词归属映射
+            target_level: 目标等级
+            known_rate: 认识的单词被点击的概率
+        """
+        self.word_levels = word_levels
+        self.max_priority = LEVEL_PRIORITY[target_level]
+        self.known_rate = known_rate
+        self.rng = random.Random()
+
+    def is_known(self, word: str) -> bool:
+        """
+        判断单词是否在目标等级范围内
+        """
+        books = self.word_levels.get(normalize_head_word(word))
+        if not books:
+            return False
+        return min(LEVEL_PRIORITY.get(book, len(LEVEL_PRIORITY) + 1) for book in books) <= self.max_priority
+
+    def __call__(self, round_num: int, words: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return [
+            word for word in words
+            if self.is_known(word['word']) and self.rng.random() < self.known_rate
+        ]
+
+
+class BrowserPool:
+    """
+    浏览器池
+    每个工作线程首次取用时创建自己的抓取器（浏览器），之后在该线程的测试之间复用；
+    测试失败时丢弃该线程的浏览器，下次取用时重新创建。
+    精简模式下每个工作线程固定使用 profile_root 下的一个用户数据目录，重建的浏览器沿用预热过的目录
+    """
+
+    def __init__(self, scraper_options: Dict[str, Any], profile_root: Optional[str] = None):
+        """
+        初始化浏览器池
+
+        Args:
+            scraper_options: 创建 VocabTestScraper 的参数
+            profile_root: 精简模式下各工作线程用户数据目录的上级目录
+        """
+        self.scraper_options = scraper_options
+        self.profile_root = profile_root or DEFAULT_PROFILE_DIR
+        self._local = threading.local()
+        self._scrapers: List[VocabTestScraper] = []
+        self._lock = threading.Lock()
+        self._worker_count = 0
+
+    def acquire(self) -> VocabTestScraper:
+        """
+        获取当前线程的抓取器，不存在时创建
+        """
+        scraper = getattr(self._local, 'scraper', None)
+        if scraper is None:
+            if not hasattr(self._local, 'worker_id'):
+                with self._lock:
+                    self._worker_count += 1
+                    self._local.worker_id = self._worker_count
+            options = dict(self.scraper_options)
+            if options.get('lean'):
+                # 同一个用户数据目录同时只能被一个浏览器使用
+                options['profile_dir'] = os.path.join(self.profile_root, f"worker-{self._local.worker_id}")
+            scraper = VocabTestScraper(**options)
+            self._local.scraper = scraper
+            with self._lock:
+                self._scrapers.append(scraper)
+        return scraper
+
+    def discard(self):
+        """
+        关闭并丢弃当前线程的抓取器
+        """
+        scraper = getattr(self._local, 'scraper', None)
+        if scraper is None:
+            return
+        self._local.scraper = None
+        with self._lock:
+            self._scrapers.remove(scraper)
+        scraper.close()
+
+    def close(self):
+        """
+        关闭池中所有浏览器
+        """
+        with self._lock:
+            scrapers, self._scrapers = self._scrapers, []
+        for scraper in scrapers:
+            scraper.close()
+
+
+def run_profile(
+    pool: BrowserPool,
+    index: int,
+    profile: Dict[str, Any],
+    word_levels: Optional[Dict[str, Set[str]]] = None
+) -> Dict[str, Any]:
+    """
+    在当前线程的浏览器中运行一次测试
+
+    Args:
+        pool: 浏览器池
+        index: 测试序号
+        profile: 测试配置
+        word_levels: 单词归属映射，按目标等级选词的配置需要
+
+    Returns:
+        Dict[str, Any]: 运行结果，包含是否成功、最终词汇量、结果文件和耗时
+    """
+    start_time = time.perf_counter()
+    final_vocab_size = None
+    result_path = None
+    wait_seconds = 0.0
+    page_metrics = {}
+    try:
+        scraper = pool.acquire()
+        scraper.open_test_page()
+        page_metrics = scraper.page_metrics
+        if 'target_level' in profile:
+            selector = TargetLevelSelector(word_levels, profile['target_level'], profile['known_rate'])
+            result = scraper.random_click_vocab_labels(word_selector=selector)
+        else:
+            result = scraper.random_click_vocab_labels(profile['round1_clicks'], profile['round2_clicks'])
+        final_vocab_size = result.get('final_vocab_size')
+        result_path = scraper.last_result_path
+        wait_seconds = sum(scraper.wait_timings.values())
+    except Exception as e:
+        logger.error(f"第 {index + 1} 个测试运行失败: {e}")
+
+    success = final_vocab_size is not None and result_path is not None
+    if not success:
+        # 浏览器可能停留在未知状态，丢弃后由下一次测试重新创建
+        pool.discard()
+
+    return {
+        'index': index,
+        'name': profile.get('name'),
+        'profile': profile,
+        'success': success,
+        'final_vocab_size': final_vocab_size,
+        'result_path': result_path,
+        'wait_seconds': wait_seconds,
+        'page_metrics': page_metrics,
+        'seconds': time.perf_counter() - start_time
+    }
+
+
+def run_batch(
+    profiles: List[Dict[str, Any]],
+    workers: int,
+    headless: bool = True,
+    timeout: int = 30,
+    verify_timeout: int = 60,
+    results_dir: Optional[str] = None,
+    wait_timeouts: Optional[Dict[str, float]] = None,
+    word_levels_path: Optional[str] = None,
+    target_url: Optional[str] = None,
+    lean: bool = False,
+    profile_dir: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """
+    使用浏览器池并行运行一批测试
+
+    Args:
+        profiles: 测试配置列表
+        workers: 并行的浏览器数量
+        headless: 是否使用无头模式
+        timeout: 页面加载超时时间（秒）
+        verify_timeout: Cloudflare验证等待超时时间（秒），批量运行时超时即判定失败
+        results_dir: 结果保存目录
+        wait_timeouts: 各条件等待的上限（秒），为None时使用默认值
+        word_levels_path: 单词等级词典路径，默认使用配置中的路径，仅在有按目标等级选词的配置时加载
+        target_url: 词汇测试页面地址，为None时使用线上 Preply 页面
+        lean: 是否使用精简模式（拦截媒体和第三方请求、禁用图片、复用预热的用户数据目录）
+        profile_dir: 精简模式下各浏览器用户数据目录的上级目录，默认 .chrome_profiles
+
+    Returns:
+        List[Dict[str, Any]]: 按测试序号排列的运行结果
+    """
+    # 单词等级词典只加载一次，各线程只读共享
+    word_levels = None
+    if any('target_level' in profile for profile in profiles):
+        word_levels_file = resolve_word_levels_path(word_levels_path)
+        word_levels = load_word_levels(word_levels_file)
+        logger.info(f"已加载单词等级词典: {word_levels_file}，共 {len(word_levels)} 个单词")
+
+    # 启动线程前先解析ChromeDriver路径，避免各线程同时下载
+    resolve_driver_path()
+
+    pool = BrowserPool({
+        'headless': headless,
+        'timeout': timeout,
+        'verify_timeout': verify_timeout,
+        'interactive': False,
+        'results_dir': results_dir or DEFAULT_RESULTS_DIR,
+        'wait_timeouts': wait_timeouts,
+        'target_url': target_url,
+        'lean': lean
+    }, profile_dir)
+    workers = max(1, min(workers, len(profiles)))
+    logger.info(f"使用 {workers} 个{'精简模式' if lean else ''}浏览器并行运行 {len(profiles)} 个测试")
+
+    outcomes = []
+    try:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="browser") as executor:
+            futures = [executor.submit(run_profile, pool, index, profile, word_levels) for index, profile in enumerate(profiles)]
+            for future in as_completed(futures):
+                outcome = future.result()
+                outcomes.append(outcome)
+                status = f"词汇量 {outcome['final_vocab_size']}" if outcome['success'] else "失败"
+                logger.info(
+                    f"[{len(outcomes)}/{len(profiles)}] 第 {outcome['index'] + 1} 个测试{status}，"
+                    f"耗时 {outcome['seconds']:.1f}s"
+                )
+    finally:
+        pool.close()
+
+    outcomes.sort(key=lambda outcome: outcome['index'])
+    return outcomes
+
+
+def summarize_batch(outcomes: List[Dict[str, Any]], wall_seconds: float) -> Dict[str, Any]:
+    """
+    汇总批量运行的耗时和结果
+
+    Args:
+        outcomes: run_batch 返回的运行结果
+        wall_seconds: 总耗时（秒）
+
+    Returns:
+        Dict[str, Any]: 汇总信息，包含耗时统计、按配置名称分组的词汇量统计和逐个测试结果
+    """
+    succeeded = [outcome for outcome in outcomes if outcome['success']]
+    seconds = [outcome['seconds'] for outcome in succeeded]
+    timing = {
+        'wall_seconds': round(wall_seconds, 2),
+        'tests_per_minute': round(len(succeeded) / wall_seconds * 60, 2) if wall_seconds else 0.0
+    }
+    if seconds:
+        timing.update({
+            'mean_seconds': round(statistics.mean(seconds), 2),
+            'median_seconds': round(statistics.median(seconds), 2),
+            'min_seconds': round(min(seconds), 2),
+            'max_seconds': round(max(seconds), 2),
+            'mean_wait_seconds': round(statistics.mean(outcome['wait_seconds'] for outcome in succeeded), 2)
+        })
+
+    # 页面加载耗时和内存指标的平均值，用于比较精简模式的效果
+    page = {}
+    for key in ('load_ms', 'dom_content_loaded_ms', 'resource_count', 'transfer_kb', 'js_heap_mb', 'browser_memory_mb'):
+        values = [outcome['page_metrics'][key] for outcome in outcomes if outcome['page_metrics'].get(key) is not None]
+        if values:
+            page[f"mean_{key}"] = round(statistics.mean(values), 1)
+
+    by_profile: Dict[str, Dict[str, Any]] = {}
+    for outcome in outcomes:
+        group = by_profile.setdefault(outcome['name'], {
+            'description': describe_profile(outcome['profile']),
+            'tests': 0,
+            'succeeded': 0,
+            'vocab_sizes': []
+        })
+        group['tests'] += 1
+        if group['description'] != describe_profile(outcome['profile']):
+            # 同名配置参数不同（如随机生成的点击数）时不展示具体参数
+            group['description'] = "参数不同的多个配置"
+        if outcome['success']:
+            group['succeeded'] += 1
+            try:
+                group['vocab_sizes'].append(int(str(outcome['final_vocab_size']).replace(',', '')))
+            except ValueError:
+                pass
+    for group in by_profile.values():
+        sizes = group.pop('vocab_sizes')
+        if sizes:
+            group.update({
+                'mean_vocab_size': round(statistics.mean(sizes)),
+                'min_vocab_size': min(sizes),
+                'max_vocab_size': max(sizes)
+            })
+
+    return {
+        'total_tests': len(outcomes),
+        'succeeded': len(succeeded),
+        'failed': [outcome['index'] + 1 for outcome in outcomes if not outcome['success']],
+        'timing': timing,
+        'page': page,
+        'profiles': by_profile,
+        'tests': outcomes
+    }
+
+
+def save_batch_summary(summary: Dict[str, Any], results_dir: Optional[str] = None) -> str:
+    """
+    保存批量运行汇总到结果目录（文件名不匹配结果分析脚本读取的 vocab_test_result_*.json）
+
+    Args:
+        summary: summarize_batch 返回的汇总信息
+        results_dir: 结果保存目录
+
+    Returns:
+        str: 汇总文件路径
+    """
+    results_dir = results_dir or DEFAULT_RESULTS_DIR
+    os.makedirs(results_dir, exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    filepath = os.path.join(results_dir, f"batch_summary_{timestamp}.json")
+    with open(filepath, 'w', encoding='utf-8') as f:
+        json.dump(summary, f, ensure_ascii=False, indent=2)
+    logger.info(f"批量运行汇总已保存到: {filepath}")
+    return filepath
+
+
+def print_batch_summary(summary: Dict[str, Any]):
+    """
+    打印批量运行汇总
+
+    Args:
+        summary: summarize_batch 返回的汇总信息
+    """
+    timing = summary['timing']
+    print("\n" + "=" * 60)
+    print("📊 批量测试汇总")
+    print("=" * 60)
+    print(f"✅ 成功 {summary['succeeded']}/{summary['total_tests']} 个测试，总耗时 {timing['wall_seconds']:.1f}s，"
+          f"吞吐量 {timing['tests_per_minute']:.1f} 个/分钟")
+    if 'mean_seconds' in timing:
+        print(f"⏱️  单个测试耗时: 平均 {timing['mean_seconds']:.1f}s，中位数 {timing['median_seconds']:.1f}s，"
+              f"最短 {timing['min_seconds']:.1f}s，最长 {timing['max_seconds']:.1f}s（其中条件等待平均 {timing['mean_wait_seconds']:.1f}s）")
+
+    page = summary['page']
+    if page:
+        labels = {
+            'mean_load_ms': ('页面加载', 'ms'),
+            'mean_dom_content_loaded_ms': ('DOMContentLoaded', 'ms'),
+            'mean_resource_count': ('请求数', ''),
+            'mean_transfer_kb': ('传输量', 'KB'),
+            'mean_js_heap_mb': ('JS堆', 'MB'),
+            'mean_browser_memory_mb': ('单个浏览器内存', 'MB')
+        }
+        print("🌐 页面指标平均值: " + "，".join(
+            f"{labels[key][0]} {value:g}{labels[key][1]}" for key, value in page.items()
+        ))
+
+    print("\n📋 各配置结果:")
+    for name, group in summary['profiles'].items():
+        line = f"   {name}（{group['description']}）: 成功 {group['succeeded']}/{group['tests']}"
+        if 'mean_vocab_size' in group:
+            line += f"，词汇量平均 {group['mean_vocab_size']}（{group['min_vocab_size']} ~ {group['max_vocab_size']}）"
+        print(line)
+
+    if summary['failed']:
+        print(f"\n❌ 失败的测试序号: {', '.join(map(str, summary['failed']))}")
+    print("=" * 60)
+
+
+def add_batch_arguments(parser: argparse.ArgumentParser):
+    """
+    添加批量运行相关的命令行参数，供本脚本和 run_preply_test.py 共用
+    """
+    parser.add_argument("--workers", type=int, default=4, help="并行的无头浏览器数量（默认: 4）")
+    parser.add_argument("--min-clicks", type=int, default=1, help="每轮最少点击的单词数（默认: 1）")
+    parser.add_argument("--max-clicks", type=int, default=15, help="每轮最多点击的单词数（默认: 15）")
+    parser.add_argument("--seed", type=int, help="生成测试配置的随机种子")
+    parser.add_argument("--profiles", type=str, help="测试配置文件（JSON），指定后忽略随机点击数参数")
+    parser.add_argument("--word-levels", type=str, help="单词等级词典路径，按目标等级选词时使用（默认使用配置中的路径）")
+    parser.add_argument("--lean", action="store_true", help="精简模式：拦截图片、字体和已知的第三方统计/广告请求（拒绝列表，未列出的第三方仍会加载），复用预热的浏览器用户数据目录")
+    parser.add_argument("--profile-dir", type=str, help="精简模式浏览器用户数据目录的上级目录，每个浏览器使用其下的独立子目录（默认: .chrome_profiles）")
+    parser.add_argument("--results-dir", type=str, help="结果保存目录（默认: preply_results）")
+
+
+def parse_arguments():
+    """
+    解析命令行参数
+    """
+    parser = argparse.ArgumentParser(
+        description="Preply词汇测试批量运行脚本",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+说明:
+  每个工作线程独占一个无头浏览器，测试之间复用，失败时自动重建。
+  批量运行为非交互模式，遇到Cloudflare验证且在超时时间内未通过时判定该测试失败。
+  运行结束后打印耗时和结果汇总，并写入结果目录下的 batch_summary_<时间>.json。
+
+配置文件示例:
+  [
+    {"name": "beginner", "round1_clicks": 3, "round2_clicks": 1, "count": 10},
+    {"name": "cet6-user", "target_level": "cet6", "known_rate": 0.9, "count": 20}
+  ]
+
+示例:
+  python scripts/preply_batch_runner.py --tests 100 --workers 4
+  python scripts/preply_batch_runner.py --tests 20 --workers 2 --min-clicks 5 --max-clicks 10 --seed 1
+  python scripts/preply_batch_runner.py --profiles profiles.json --workers 4
+  python scripts/preply_batch_runner.py --tests 50 --replay        # 使用本地回放服务，无需网络
+  python scripts/preply_batch_runner.py --tests 50 --lean          # 精简模式，对比汇总中的页面加载耗时和浏览器内存
+        """
+    )
+    parser.add_argument("--tests", type=int, default=10, help="运行的测试数量（默认: 10）")
+    add_batch_arguments(parser)
+    parser.add_argument("--timeout", type=int, default=30, help="页面加载超时时间（秒），默认30秒")
+    parser.add_argument("--verify-timeout", type=int, default=60, help="Cloudflare验证等待超时时间（秒），默认60秒")
+    parser.add_argument("--wait-timeout", type=float, help="页面元素条件等待的统一上限（秒），默认按等待类型使用10~20秒")
+    add_replay_arguments(parser)
+    return parser.parse_args()
+
+
+def run_batch_from_args(args: argparse.Namespace, test_count: int) -> bool:
+    """
+    按命令行参数生成或加载测试配置，运行批量测试并输出汇总，供本脚本和 run_preply_test.py 共用
+
+    Args:
+        args: 包含 add_batch_arguments、add_replay_arguments 参数以及 timeout、verify_timeout、wait_timeout 的命令行参数
+        test_count: 未指定配置文件时随机生成的测试数量
+
+    Returns:
+        bool: 是否至少有一个测试成功
+    """
+    try:
+        if args.profiles:
+            profiles = load_profiles(args.profiles)
+        else:
+            profiles = generate_profiles(test_count, args.min_clicks, args.max_clicks, args.seed)
+    except (OSError, ValueError) as e:
+        logger.error(f"加载测试配置失败: {e}")
+        return False
+    if not profiles:
+        logger.error("没有需要运行的测试")
+        return False
+
+    with replay_target(args) as target_url:
+        start_time = time.perf_counter()
+        outcomes = run_batch(
+            profiles,
+            args.workers,
+            timeout=args.timeout,
+            verify_timeout=args.verify_timeout,
+            results_dir=args.results_dir,
+            wait_timeouts=uniform_wait_timeouts(args.wait_timeout),
+            word_levels_path=args.word_levels,
+            target_url=target_url,
+            lean=args.lean,
+            profile_dir=args.profile_dir
+        )
+        summary = summarize_batch(outcomes, time.perf_counter() - start_time)
+    save_batch_summary(summary, args.results_dir)
+    print_batch_summary(summary)
+    return summary['succeeded'] > 0
+
+
+def main():
+    """
+    主函数
+    """
+    args = parse_arguments()
+    try:
+        succeeded = run_batch_from_args(args, args.tests)
+    except KeyboardInterrupt:
+        print("\n\n⚠️  用户中断了批量测试")
+        sys.exit(1)
+
+    if not succeeded:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
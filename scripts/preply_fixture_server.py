@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Preply词汇测试本地回放服务
+
+在本地提供与 Preply 词汇测试页面结构一致的离线页面（scripts/fixtures/preply/），
+模拟两轮单词选择、Continue 按钮和最终词汇量结果页，抓取器将 target_url 指向该服务后
+即可在无网络的机器上对抓取流程做回归测试和耗时基准测试。
+
+使用方法:
+    python scripts/preply_fixture_server.py --port 8765
+    python run_preply_test.py --headless --target-url http://127.0.0.1:8765/en/learn/english/test-your-vocab
+    python run_preply_test.py --batch 20 --replay
+"""
+
+import argparse
+import json
+import logging
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Iterator, Optional
+from urllib.parse import urlsplit
+
+# 配置日志
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# 回放页面模板和单词数据所在目录
+DEFAULT_FIXTURES_DIR = Path(__file__).parent / 'fixtures' / 'preply'
+
+# 与线上一致的测试页面路径，抓取器依赖URL中的 test-your-vocab 判断已到达目标页面
+TEST_PAGE_PATH = '/en/learn/english/test-your-vocab'
+
+
+def build_test_page(fixtures_dir: Path, render_delay: float = 0.0) -> bytes:
+    """
+    用单词数据渲染测试页面模板
+
+    Args:
+        fixtures_dir: 回放数据目录，包含 test_your_vocab.html 和 rounds.json
+        render_delay: 页面渲染和翻页的模拟延迟（秒）
+
+    Returns:
+        bytes: UTF-8 编码的页面内容
+    """
+    template = (fixtures_dir / 'test_your_vocab.html').read_text(encoding='utf-8')
+    with open(fixtures_dir / 'rounds.json', 'r', encoding='utf-8') as f:
+        config = json.load(f)
+    config['render_delay_ms'] = int(render_delay * 1000)
+    return template.replace('__FIXTURE_CONFIG__', json.dumps(config, ensure_ascii=False)).encode('utf-8')
+
+
+class FixtureRequestHandler(BaseHTTPRequestHandler):
+    """
+    回放服务请求处理器，只提供首页和测试页面
+    """
+
+    server_version = "PreplyFixture/1.0"
+
+    def do_GET(self):
+        if self.server.latency:
+            time.sleep(self.server.latency)
+
+        path = urlsplit(self.path).path.rstrip('/')
+        if path == TEST_PAGE_PATH:
+            body = self.server.test_page
+        elif path == '':
+            body = f'<!DOCTYPE html><title>Preply fixture</title><a href="{TEST_PAGE_PATH}">Test your vocabulary</a>'.encode('utf-8')
+        else:
+            self.send_error(404)
+            return
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Cache-Control', 'no-store')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug(f"{self.address_string()} - {format % args}")
+
+
+class FixtureServer(ThreadingHTTPServer):
+    """
+    回放HTTP服务，每个请求一个线程，测试页面内容在启动时渲染一次
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        host: str = '127.0.0.1',
+        port: int = 0,
+        fixtures_dir: Optional[Path] = None,
+        latency: float = 0.0,
+        render_delay: float = 0.0
+    ):
+        """
+        初始化回放服务
+
+        Args:
+            host: 监听地址
+            port: 监听端口，0 表示自动分配
+            fixtures_dir: 回放数据目录，默认 scripts/fixtures/preply
+            latency: 每个请求的模拟网络延迟（秒）
+            render_delay: 页面渲染和翻页的模拟延迟（秒）
+        """
+        super().__init__((host, port), FixtureRequestHandler)
+        self.latency = latency
+        self.test_page = build_test_page(Path(fixtures_dir or DEFAULT_FIXTURES_DIR), render_delay)
+
+    @property
+    def test_url(self) -> str:
+        """
+        测试页面URL
+        """
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}{TEST_PAGE_PATH}"
+
+
+def start_fixture_server(
+    host: str = '127.0.0.1',
+    port: int = 0,
+    fixtures_dir: Optional[Path] = None,
+    latency: float = 0.0,
+    render_delay: float = 0.0
+) -> FixtureServer:
+    """
+    在后台线程启动回放服务，调用方负责 shutdown() 和 server_close()
+
+    Returns:
+        FixtureServer: 已启动的回放服务
+    """
+    server = FixtureServer(host, port, fixtures_dir, latency, render_delay)
+    thread = threading.Thread(target=server.serve_forever, name="preply-fixture-server", daemon=True)
+    thread.start()
+    logger.info(f"回放服务已启动: {server.test_url}")
+    return server
+
+
+def add_replay_arguments(parser: argparse.ArgumentParser):
+    """
+    添加目标地址和离线回放相关的命令行参数，供 run_preply_test.py 和批量运行脚本共用
+    """
+    parser.add_argument("--target-url", type=str, help="词汇测试页面地址（默认: 线上 Preply 页面）")
+    parser.add_argument("--replay", action="store_true", help="启动本地回放服务并将目标地址指向它，无需网络")
+    parser.add_argument("--replay-latency", type=float, default=0.0, help="回放服务每个请求的模拟延迟（秒），默认0")
+    parser.add_argument("--replay-render-delay", type=float, default=0.0, help="回放页面渲染和翻页的模拟延迟（秒），默认0")
+
+
+@contextmanager
+def replay_target(args: argparse.Namespace) -> Iterator[Optional[str]]:
+    """
+    按命令行参数确定目标地址；指定 --replay 时在上下文内运行本地回放服务
+
+    Args:
+        args: 包含 add_replay_arguments 参数的命令行参数
+
+    Yields:
+        Optional[str]: 目标地址，为None时使用抓取器默认地址
+    """
+    if not args.replay:
+        yield args.target_url
+        return
+
+    server = start_fixture_server(latency=args.replay_latency, render_delay=args.replay_render_delay)
+    try:
+        yield server.test_url
+    finally:
+        server.shutdown()
+        server.server_close()
+        logger.info("回放服务已关闭")
+
+
+def parse_arguments():
+    """
+    解析命令行参数
+    """
+    parser = argparse.ArgumentParser(
+        description="Preply词汇测试本地回放服务",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+说明:
+  页面保留了抓取器依赖的容器 class、label 的 for 属性、Continue 按钮和结果标题结构，
+  单词数据在 scripts/fixtures/preply/rounds.json 中，第二轮按第一轮认识的比例选择难度。
+  最终词汇量 = 第二轮 max_vocab × (0.4 × 第一轮认识比例 + 0.6 × 第二轮认识比例)。
+
+示例:
+  python scripts/preply_fixture_server.py
+  python scripts/preply_fixture_server.py --port 8765 --latency 0.2 --render-delay 0.5
+        """
+    )
+    parser.add_argument("--host", type=str, default="127.0.0.1", help="监听地址（默认: 127.0.0.1）")
+    parser.add_argument("--port", type=int, default=8765, help="监听端口（默认: 8765）")
+    parser.add_argument("--fixtures-dir", type=str, help="回放数据目录（默认: scripts/fixtures/preply）")
+    parser.add_argument("--latency", type=float, default=0.0, help="每个请求的模拟网络延迟（秒），默认0")
+    parser.add_argument("--render-delay", type=float, default=0.0, help="页面渲染和翻页的模拟延迟（秒），默认0")
+    return parser.parse_args()
+
+
+def main():
+    """
+    主函数
+    """
+    args = parse_arguments()
+    try:
+        server = FixtureServer(args.host, args.port, args.fixtures_dir, args.latency, args.render_delay)
+    except OSError as e:
+        logger.error(f"回放服务启动失败: {e}")
+        sys.exit(1)
+
+    logger.info(f"回放服务已启动: {server.test_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("回放服务已停止")
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
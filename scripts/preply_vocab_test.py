@@ -7,15 +7,21 @@
 用于结果比对和数据验证
 """
 
+import json
 import time
 import os
 import random
+import threading
+import uuid
+from datetime import datetime
+from urllib.parse import urlsplit
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
 from webdriver_manager.chrome import ChromeDriverManager
 import logging
 
@@ -26,6 +32,90 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 默认的词汇测试页面地址
+DEFAULT_TARGET_URL = "https://preply.com/en/learn/english/test-your-vocab"
+
+# 精简模式默认的浏览器用户数据目录，批量运行时每个工作线程使用其下的独立子目录
+DEFAULT_PROFILE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.chrome_profiles')
+
+# 精简模式下通过CDP拦截的请求：页面只需要单词文本，图片、字体、音视频和第三方统计组件都不需要加载
+# 这是拒绝列表，未列出的第三方请求仍会加载
+# 图片、字体和音视频的扩展名，只匹配URL路径的结尾，不会误拦截查询参数中包含这些字符的同站请求
+LEAN_BLOCKED_EXTENSIONS = (
+    "png", "jpg", "jpeg", "gif", "webp", "avif", "svg", "ico",
+    "woff", "woff2", "ttf", "otf",
+    "mp4", "webm", "mp3"
+)
+# 第三方统计、广告、埋点和客服组件的域名，匹配该域名及其子域名
+LEAN_BLOCKED_HOSTS = (
+    "google-analytics.com", "googletagmanager.com", "googleadservices.com", "doubleclick.net",
+    "facebook.net", "connect.facebook.com", "hotjar.com", "segment.com", "segment.io",
+    "amplitude.com", "intercom.io", "intercomcdn.com", "sentry.io", "optimizely.com",
+    "clarity.ms", "bat.bing.com", "analytics.tiktok.com"
+)
+# Network.setBlockedURLs 只支持 * 通配符，扩展名分别匹配无查询参数和带查询参数两种情况
+LEAN_BLOCKED_URL_PATTERNS = [
+    pattern
+    for extension in LEAN_BLOCKED_EXTENSIONS
+    for pattern in (f"*.{extension}", f"*.{extension}?*")
+] + [
+    pattern
+    for host in LEAN_BLOCKED_HOSTS
+    for pattern in (f"*://{host}/*", f"*://*.{host}/*")
+]
+
+# 默认的结果保存目录
+DEFAULT_RESULTS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'preply_results')
+
+# 各条件等待的默认上限（秒）；条件满足即返回，只有页面异常时才会等满
+DEFAULT_WAIT_TIMEOUTS = {
+    'page_ready': 10,    # document.readyState 为 complete
+    'container': 15,     # 词汇测试容器出现
+    'labels': 10,        # 单词label渲染完成
+    'next_round': 15,    # 点击Continue后下一轮单词出现
+    'result': 20,        # 最终词汇量数字可见
+    'click': 5           # 按钮可点击、复选框勾选生效
+}
+
+# 条件等待的轮询间隔（秒）
+WAIT_POLL_INTERVAL = 0.1
+
+
+def uniform_wait_timeouts(seconds: float = None) -> dict:
+    """
+    为所有条件等待设置统一上限，供命令行参数使用
+    
+    Args:
+        seconds: 等待上限（秒），为None时使用默认值
+        
+    Returns:
+        dict: 传给 VocabTestScraper 的 wait_timeouts，seconds为None时返回None
+    """
+    if seconds is None:
+        return None
+    return dict.fromkeys(DEFAULT_WAIT_TIMEOUTS, seconds)
+
+# ChromeDriver 路径只解析一次，避免多个浏览器同时初始化时重复下载
+_driver_path = None
+_driver_path_lock = threading.Lock()
+
+
+def resolve_driver_path() -> str:
+    """
+    获取ChromeDriver可执行文件路径，首次调用时自动下载，线程安全
+    
+    Returns:
+        str: ChromeDriver路径
+    """
+    global _driver_path
+    with _driver_path_lock:
+        if _driver_path is None:
+            # 获取下载目录
+            path = ChromeDriverManager().install()
+            # 修复路径指向非可执行文件问题
+            _driver_path = os.path.join(os.path.dirname(path), "chromedriver")
+        return _driver_path
+
 
 class VocabTestScraper:
     """
@@ -33,7 +123,18 @@ class VocabTestScraper:
     用于从Preply网站抓取词汇测试相关数据
     """
     
-    def __init__(self, headless: bool = True, timeout: int = 30, verify_timeout: int = 300):
+    def __init__(
+        self,
+        headless: bool = True,
+        timeout: int = 30,
+        verify_timeout: int = 300,
+        interactive: bool = True,
+        results_dir: str = None,
+        wait_timeouts: dict = None,
+        target_url: str = None,
+        lean: bool = False,
+        profile_dir: str = None
+    ):
         """
         初始化抓取器
         
@@ -41,12 +142,28 @@ class VocabTestScraper:
             headless: 是否使用无头模式运行浏览器
             timeout: 页面加载超时时间（秒）
             verify_timeout: Cloudflare验证等待超时时间（秒）
+            interactive: 是否为交互模式；非交互模式下不等待用户输入、不打印完整结果，验证超时直接失败
+            results_dir: 结果保存目录，默认为项目根目录下的 preply_results
+            wait_timeouts: 各条件等待的上限（秒），覆盖 DEFAULT_WAIT_TIMEOUTS 中的同名项
+            target_url: 词汇测试页面地址，默认为线上 Preply 页面，可指向本地回放服务
+            lean: 是否使用精简模式：禁用图片、通过CDP拦截媒体和第三方请求，并复用预热过的用户数据目录
+            profile_dir: 精简模式使用的浏览器用户数据目录，默认 .chrome_profiles/default；同一目录同时只能被一个浏览器使用
         """
         self.headless = headless
         self.timeout = timeout
         self.verify_timeout = verify_timeout
+        self.interactive = interactive
+        self.results_dir = results_dir or DEFAULT_RESULTS_DIR
+        self.wait_timeouts = {**DEFAULT_WAIT_TIMEOUTS, **(wait_timeouts or {})}
+        # 本次测试中各类等待的累计耗时（秒）
+        self.wait_timings = {}
+        self.last_result_path = None
         self.driver = None
-        self.target_url = "https://preply.com/en/learn/english/test-your-vocab"
+        self.target_url = target_url or DEFAULT_TARGET_URL
+        self.lean = lean
+        self.profile_dir = profile_dir or os.path.join(DEFAULT_PROFILE_DIR, 'default')
+        # 最近一次打开测试页面的加载耗时和内存指标
+        self.page_metrics = {}
 
         self.cookies_original = {
             'init_uid': '9f168d9385908ebc06d735e442b45b54dbd185a372b17a71ac34bad70b01c71d',
@@ -151,19 +268,34 @@ class VocabTestScraper:
             chrome_options.add_argument("--disable-gpu")
             chrome_options.add_argument("--window-size=1920,1080")
             
-            # 获取下载目录
-            path = ChromeDriverManager().install()
-
-            # 修复路径指向非可执行文件问题
-            correct_driver_path = os.path.join(os.path.dirname(path), "chromedriver")
+            if self.lean:
+                # 精简模式：禁用图片和后台活动，复用预热过的用户数据目录（保留HTTP缓存和验证Cookie）
+                os.makedirs(self.profile_dir, exist_ok=True)
+                chrome_options.add_argument(f"--user-data-dir={self.profile_dir}")
+                chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+                chrome_options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+                chrome_options.add_argument("--disable-extensions")
+                chrome_options.add_argument("--disable-background-networking")
+                chrome_options.add_argument("--disable-component-update")
+                chrome_options.add_argument("--mute-audio")
             
             # 自动下载并设置ChromeDriver
-            service = Service(executable_path=correct_driver_path)
+            service = Service(executable_path=resolve_driver_path())
             
             # 创建WebDriver实例
             self.driver = webdriver.Chrome(service=service, options=chrome_options)
             self.driver.set_page_load_timeout(self.timeout)
             
+            # 启用性能指标收集，精简模式下拦截媒体和第三方请求
+            self.driver.execute_cdp_cmd("Performance.enable", {})
+            if self.lean:
+                self.driver.execute_cdp_cmd("Network.enable", {})
+                self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": LEAN_BLOCKED_URL_PATTERNS})
+                logger.info(
+                    f"精简模式已启用，拦截 {len(LEAN_BLOCKED_EXTENSIONS)} 种媒体扩展名和 {len(LEAN_BLOCKED_HOSTS)} 个第三方域名，"
+                    f"用户数据目录: {self.profile_dir}"
+                )
+            
             # 隐藏WebDriver特征
             self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
             
@@ -182,18 +314,23 @@ class VocabTestScraper:
                 });
             """)
             
-            # 先访问目标域名以设置Cookie
-            logger.info("正在访问目标域名以设置Cookie...")
-            self.driver.get("https://preply.com")
-            time.sleep(2)
-            
-            # 添加预设的Cookie
-            logger.info("正在添加预设Cookie...")
-            for cookie in self.cookies:
-                try:
-                    self.driver.add_cookie(cookie)
-                except Exception as e:
-                    logger.warning(f"添加Cookie失败: {cookie['name']} - {e}")
+            # 预设Cookie只对 preply.com 有效，其他目标（如本地回放服务）跳过
+            hostname = urlsplit(self.target_url).hostname or ""
+            if hostname == "preply.com" or hostname.endswith(".preply.com"):
+                # 先访问目标域名以设置Cookie
+                logger.info("正在访问目标域名以设置Cookie...")
+                self.driver.get("https://preply.com")
+                self._wait_for_document_ready()
+                
+                # 添加预设的Cookie
+                logger.info("正在添加预设Cookie...")
+                for cookie in self.cookies:
+                    try:
+                        self.driver.add_cookie(cookie)
+                    except Exception as e:
+                        logger.warning(f"添加Cookie失败: {cookie['name']} - {e}")
+            else:
+                logger.info(f"目标地址不是preply.com（{hostname}），跳过预设Cookie")
             
             logger.info("Chrome WebDriver 初始化成功")
             
@@ -203,19 +340,108 @@ class VocabTestScraper:
     
 
     
+    def _wait_until(self, name: str, condition, description: str):
+        """
+        以 WebDriverWait 等待条件满足，记录并累计等待耗时
+        
+        Args:
+            name: 等待类型，对应 wait_timeouts 中的键
+            condition: 接收driver的条件函数，返回真值时等待结束
+            description: 日志中的等待描述
+            
+        Returns:
+            条件函数返回的真值
+            
+        Raises:
+            TimeoutException: 超过等待上限条件仍未满足
+        """
+        timeout = self.wait_timeouts[name]
+        start_time = time.perf_counter()
+        try:
+            value = WebDriverWait(self.driver, timeout, poll_frequency=WAIT_POLL_INTERVAL).until(condition)
+        except TimeoutException:
+            logger.warning(f"等待{description}超时（{timeout}秒）")
+            raise
+        finally:
+            elapsed = time.perf_counter() - start_time
+            self.wait_timings[name] = self.wait_timings.get(name, 0.0) + elapsed
+        logger.info(f"等待{description}完成，耗时 {elapsed:.2f}s")
+        return value
+    
+    def _wait_for_document_ready(self):
+        """
+        等待 document.readyState 变为 complete，超时只记录警告
+        """
+        try:
+            self._wait_until(
+                'page_ready',
+                lambda driver: driver.execute_script("return document.readyState") == "complete",
+                "页面加载"
+            )
+        except TimeoutException:
+            logger.warning("页面加载状态检查超时，但继续执行")
+    
+    def _extract_round_words(self, driver):
+        """
+        用一次 execute_script 读取当前页面的词汇测试容器和其中所有单词label
+        容器先按完整class匹配，失败时按部分class匹配；单词取label内第一个span的可见文本
+        
+        Returns:
+            dict: {'containers': 容器数量, 'words': [{'word': str, 'for': str, 'checked': bool或None}]}
+        """
+        return driver.execute_script("""
+            const findAll = (xpath, context) => {
+                const snapshot = document.evaluate(
+                    xpath, context, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+                );
+                return Array.from({length: snapshot.snapshotLength}, (_, i) => snapshot.snapshotItem(i));
+            };
+            let containers = findAll(arguments[0], document);
+            if (!containers.length) {
+                containers = findAll(arguments[1], document);
+            }
+            const words = [];
+            for (const container of containers) {
+                for (const label of findAll(".//label[starts-with(@for, 'word_')]", container)) {
+                    const span = label.querySelector('span');
+                    const text = span ? span.innerText.trim() : '';
+                    if (!text) {
+                        continue;
+                    }
+                    const checkbox = label.querySelector("input[type='checkbox']");
+                    words.push({
+                        word: text,
+                        for: label.getAttribute('for'),
+                        checked: checkbox ? checkbox.checked : null
+                    });
+                }
+            }
+            return {containers: containers.length, words: words};
+        """,
+            f"//div[@class='{self.vocab_test_container_class}']",
+            "//div[contains(@class, 'LayoutGrid__-dslt') and contains(@class, 'LayoutGrid--columns__kFwZC')]"
+        )
+    
+    def _current_words(self, driver):
+        """
+        读取当前页面的单词文本，用于判断单词是否渲染完成以及是否已翻页
+        
+        Returns:
+            list: 单词文本列表
+        """
+        return [word['word'] for word in self._extract_round_words(driver)['words']]
+    
+
     def _wait_for_page_load(self):
         """
         等待页面完全加载
         """
         try:
             # 等待页面标题加载
-            WebDriverWait(self.driver, self.timeout).until(
+            WebDriverWait(self.driver, self.timeout, poll_frequency=WAIT_POLL_INTERVAL).until(
                 lambda driver: driver.execute_script("return document.readyState") == "complete"
             )
             
-            # 额外等待一些时间确保动态内容加载
-            time.sleep(3)
-            
             logger.info("页面加载完成")
             
         except TimeoutException:
@@ -291,75 +517,74 @@ class VocabTestScraper:
         # 等待用户手动验证
         start_time = time.time()
         verification_completed = False
-        last_url = self.driver.current_url
         
         print("\n⏳ 自动检测验证状态中... (每3秒检查一次)")
         print("💡 提示: 如果验证完成但未自动检测到，请按 Ctrl+C 然后手动确认继续")
         
-        while time.time() - start_time < max_wait_time and not verification_completed:
-            try:
-                # 检查是否已经通过验证
-                current_url = self.driver.current_url
-                page_title = self.driver.title
-                
-                logger.info(f"当前页面标题: {page_title}")
-                logger.info(f"当前URL: {current_url}")
+        check_state = {'passed_checks': 0}
+        
+        def verification_passed(driver):
+            # 多重检查验证是否完成
+            current_url = driver.current_url
+            page_title = driver.title
+            page_source = driver.page_source.lower()
+            verification_checks = [
+                # 检查1: 页面标题不包含验证相关内容
+                ("Just a moment" not in page_title and 
+                 "Checking" not in page_title and
+                 "Please wait" not in page_title and
+                 "Verify you are human" not in page_title and
+                 current_url != "about:blank"),
                 
-                # 检查URL是否发生变化（可能表示重定向完成）
-                url_changed = current_url != last_url
-                last_url = current_url
+                # 检查2: 目标页面元素存在
+                any(driver.find_elements(By.XPATH, indicator) for indicator in target_page_indicators),
                 
-                # 多重检查验证是否完成
-                verification_checks = [
-                    # 检查1: 页面标题不包含验证相关内容
-                    ("Just a moment" not in page_title and 
-                     "Checking" not in page_title and
-                     "Please wait" not in page_title and
-                     "Verify you are human" not in page_title and
-                     current_url != "about:blank"),
-                    
-                    # 检查2: 目标页面元素存在
-                    any(self.driver.find_elements(By.XPATH, indicator) for indicator in target_page_indicators),
-                    
-                    # 检查3: URL包含目标路径
-                    "test-your-vocab" in current_url.lower(),
-                    
-                    # 检查4: 页面源码包含目标内容
-                    "vocabulary test" in self.driver.page_source.lower() or "preply" in self.driver.page_source.lower()
-                ]
+                # 检查3: URL包含目标路径
+                "test-your-vocab" in current_url.lower(),
                 
-                # 如果多个检查通过，认为验证完成
-                passed_checks = sum(verification_checks)
-                logger.info(f"验证检查通过数: {passed_checks}/4")
+                # 检查4: 页面源码包含目标内容
+                "vocabulary test" in page_source or "preply" in page_source
+            ]
+            
+            # 如果多个检查通过，认为验证完成
+            check_state['passed_checks'] = sum(verification_checks)
+            if check_state['passed_checks'] < 2:  # 至少2个检查通过
+                return False
+            
+            # 再次确认没有验证元素
+            for indicator in cloudflare_indicators:
+                try:
+                    elements = driver.find_elements(By.XPATH, indicator)
+                    if elements and any(elem.is_displayed() for elem in elements):
+                        return False
+                except:
+                    continue
+            return True
+        
+        while time.time() - start_time < max_wait_time and not verification_completed:
+            try:
+                # 条件满足立即返回，否则每3秒刷新一次等待状态
+                try:
+                    WebDriverWait(
+                        self.driver, 3, poll_frequency=0.5, ignored_exceptions=(WebDriverException,)
+                    ).until(verification_passed)
+                    logger.info(f"检测到验证已完成，自动继续，耗时 {time.time() - start_time:.1f}s")
+                    print("\n✅ 检测到验证已完成，页面已加载")
+                    verification_completed = True
+                    break
+                except TimeoutException:
+                    pass
                 
-                if passed_checks >= 2:  # 至少2个检查通过
-                    # 再次确认没有验证元素
-                    still_verifying = False
-                    for indicator in cloudflare_indicators:
-                        try:
-                            elements = self.driver.find_elements(By.XPATH, indicator)
-                            if elements and any(elem.is_displayed() for elem in elements):
-                                still_verifying = True
-                                break
-                        except:
-                            continue
-                    
-                    if not still_verifying:
-                        logger.info("检测到验证已完成，自动继续")
-                        print("\n✅ 检测到验证已完成，页面已加载")
-                        verification_completed = True
-                        break
-                    else:
-                        logger.info(f"验证检查未完全通过，继续等待...")
+                logger.info(f"验证检查通过数: {check_state['passed_checks']}/4")
                 
                 # 显示等待状态
                 elapsed_time = int(time.time() - start_time)
                 remaining_time = max_wait_time - elapsed_time
-                print(f"\r⏱️  等待验证完成... 已等待 {elapsed_time}s，剩余 {remaining_time}s (检查通过: {passed_checks}/4)", end="", flush=True)
-                
-                time.sleep(3)  # 每3秒检查一次，提高响应速度
+                print(f"\r⏱️  等待验证完成... 已等待 {elapsed_time}s，剩余 {remaining_time}s (检查通过: {check_state['passed_checks']}/4)", end="", flush=True)
                 
             except KeyboardInterrupt:
+                if not self.interactive:
+                    raise
                 print("\n\n⚠️  检测到用户中断")
                 user_choice = input("是否继续执行数据抓取？(y/n): ").strip().lower()
                 if user_choice in ['y', 'yes', '是']:
@@ -371,10 +596,11 @@ class VocabTestScraper:
                     raise KeyboardInterrupt("用户手动退出")
             except Exception as e:
                 logger.warning(f"验证检查过程中出现异常: {e}")
-                time.sleep(3)
         
         if not verification_completed and time.time() - start_time >= max_wait_time:
             print(f"\n⚠️  等待超时 ({max_wait_time}秒)")
+            if not self.interactive:
+                raise TimeoutException(f"验证等待超时 ({max_wait_time}秒)")
             # 最后一次检查是否在目标页面
             try:
                 current_url = self.driver.current_url
@@ -391,28 +617,118 @@ class VocabTestScraper:
                 if user_choice not in ['y', 'yes', '是']:
                     raise TimeoutException("验证等待超时，用户选择退出")
         
-        # 最终等待页面稳定
-        logger.info("等待页面稳定...")
-        time.sleep(10)  # 减少等待时间
-        
         # 验证完成后，确保页面完全加载
-        try:
-            WebDriverWait(self.driver, 10).until(
-                lambda driver: driver.execute_script("return document.readyState") == "complete"
-            )
-            logger.info("页面加载状态确认完成")
-        except TimeoutException:
-            logger.warning("页面加载状态检查超时，但继续执行")
+        self._wait_for_document_ready()
         
         print("\n🚀 继续执行数据抓取...")
     
-    def random_click_vocab_labels(self, round1_clicks=5, round2_clicks=5):
+    def open_test_page(self):
+        """
+        打开词汇测试页面，浏览器未启动时先初始化
+        已有浏览器时重新加载页面开始新一轮测试，供批量运行复用同一个浏览器
+        """
+        if not self.driver:
+            self._setup_driver()
+        logger.info(f"正在访问目标网站: {self.target_url}")
+        self.driver.get(self.target_url)
+        self._wait_for_page_load()
+        self._wait_for_cloudflare_verification(self.verify_timeout)
+        self.page_metrics = self.collect_page_metrics()
+    
+    def collect_page_metrics(self):
+        """
+        收集当前页面的加载耗时、请求数和内存指标，用于比较精简模式的效果
+        
+        Returns:
+            dict: 包含 load_ms、dom_content_loaded_ms、resource_count、transfer_kb、js_heap_mb、browser_memory_mb，
+                无法获取的指标为None
+        """
+        metrics = {}
+        try:
+            metrics.update(self.driver.execute_script("""
+                const navigation = performance.getEntriesByType('navigation')[0];
+                const resources = performance.getEntriesByType('resource');
+                return {
+                    load_ms: navigation ? Math.round(navigation.loadEventEnd - navigation.startTime) : null,
+                    dom_content_loaded_ms: navigation ? Math.round(navigation.domContentLoadedEventEnd - navigation.startTime) : null,
+                    resource_count: resources.length,
+                    transfer_kb: Math.round(resources.reduce((total, entry) => total + (entry.transferSize || 0), 0) / 1024)
+                };
+            """))
+        except Exception as e:
+            logger.warning(f"读取页面加载耗时失败: {e}")
+        
+        try:
+            performance = {
+                item['name']: item['value']
+                for item in self.driver.execute_cdp_cmd("Performance.getMetrics", {})['metrics']
+            }
+            metrics['js_heap_mb'] = round(performance['JSHeapUsedSize'] / 1024 / 1024, 1)
+        except Exception as e:
+            logger.warning(f"读取CDP性能指标失败: {e}")
+            metrics['js_heap_mb'] = None
+        
+        metrics['browser_memory_mb'] = self._browser_memory_mb()
+        logger.info(f"页面指标: {metrics}")
+        return metrics
+    
+    def _browser_memory_mb(self):
+        """
+        统计ChromeDriver及其启动的所有浏览器进程的内存占用（MB）
+        优先使用PSS（按共享页比例分摊，多进程浏览器不会重复计算共享内存），不支持时使用RSS；仅支持Linux
+        
+        Returns:
+            float: 内存占用，无法统计时返回None
+        """
+        try:
+            root_pid = self.driver.service.process.pid
+            children = {}
+            for entry in os.listdir('/proc'):
+                if not entry.isdigit():
+                    continue
+                try:
+                    with open(f'/proc/{entry}/stat', 'r') as f:
+                        # 进程名可能包含空格，从最后一个右括号之后解析父进程号
+                        parent_pid = int(f.read().rsplit(')', 1)[1].split()[1])
+                except (OSError, IndexError, ValueError):
+                    continue
+                children.setdefault(parent_pid, []).append(int(entry))
+            
+            total_kb = 0
+            pending = [root_pid]
+            while pending:
+                pid = pending.pop()
+                pending.extend(children.get(pid, []))
+                total_kb += self._process_memory_kb(pid)
+            return round(total_kb / 1024, 1)
+        except Exception as e:
+            logger.debug(f"统计浏览器内存失败: {e}")
+            return None
+    
+    @staticmethod
+    def _process_memory_kb(pid):
+        """
+        读取单个进程的PSS（KB），不支持时读取RSS，进程已退出时返回0
+        """
+        for path, field in ((f'/proc/{pid}/smaps_rollup', 'Pss:'), (f'/proc/{pid}/status', 'VmRSS:')):
+            try:
+                with open(path, 'r') as f:
+                    for line in f:
+                        if line.startswith(field):
+                            return int(line.split()[1])
+            except OSError:
+                continue
+        return 0
+    
+    def random_click_vocab_labels(self, round1_clicks=5, round2_clicks=5, word_selector=None):
         """
         随机点击词汇测试容器中的label元素，固定执行两轮点击
         
         Args:
             round1_clicks: 第一轮要点击的label数量，默认为5个
             round2_clicks: 第二轮要点击的label数量，默认为5个
+            word_selector: 可选的选词函数，接收轮次编号和本轮单词列表（[{'word': str, 'for': str, ...}]），
+                返回要点击的单词；提供时忽略点击数量
             
         Returns:
             dict: 包含所有轮次单词信息的字典，格式为:
@@ -441,15 +757,13 @@ class VocabTestScraper:
                 'total_clicked': 0
             }
         }
+        self.last_result_path = None
+        self.wait_timings = {}
         
         try:
             # 如果driver未初始化，先初始化
             if not self.driver:
-                self._setup_driver()
-                logger.info(f"正在访问目标网站: {self.target_url}")
-                self.driver.get(self.target_url)
-                self._wait_for_page_load()
-                self._wait_for_cloudflare_verification(self.verify_timeout)
+                self.open_test_page()
             
             # 执行固定两轮点击
             rounds = 2
@@ -457,10 +771,11 @@ class VocabTestScraper:
             
             for round_num in range(rounds):
                 current_click_count = click_counts[round_num]
-                logger.info(f"开始第 {round_num + 1} 轮点击，本轮点击 {current_click_count} 个label")
-                print(f"\n🎯 第 {round_num + 1} 轮点击开始（点击 {current_click_count} 个label）...")
+                click_plan = "按选词函数选择label" if word_selector else f"点击 {current_click_count} 个label"
+                logger.info(f"开始第 {round_num + 1} 轮点击，本轮{click_plan}")
+                print(f"\n🎯 第 {round_num + 1} 轮点击开始（{click_plan}）...")
                 
-                round_result = self._click_labels_in_current_page(current_click_count, round_num + 1)
+                round_result = self._click_labels_in_current_page(current_click_count, round_num + 1, word_selector)
                 
                 # 构建轮次结果
                 round_data = {
@@ -476,15 +791,22 @@ class VocabTestScraper:
                 result['summary']['total_clicked'] += len(round_result['clicked_labels'])
                 
                 # 点击Continue按钮并等待（包括最后一轮）
+                previous_words = [word['word'] for word in round_result['words']]
                 if self._click_continue_button():
                     if round_num < rounds - 1:
-                        logger.info("Continue按钮点击成功，等待3秒加载下一页")
-                        print("⏳ 等待3秒加载下一页...")
-                        time.sleep(3)
+                        logger.info("Continue按钮点击成功，等待下一页单词出现")
+                        print("⏳ 等待下一页加载...")
+                        try:
+                            self._wait_until(
+                                'next_round',
+                                lambda driver: (words := self._current_words(driver)) and words != previous_words,
+                                "下一页单词"
+                            )
+                        except TimeoutException:
+                            logger.warning("下一页单词未出现，继续尝试")
                     else:
-                        logger.info("最后一轮Continue按钮点击成功，等待5秒获取最终结果")
-                        print("⏳ 等待5秒获取最终词汇量结果...")
-                        time.sleep(5)
+                        logger.info("最后一轮Continue按钮点击成功，等待最终词汇量结果出现")
+                        print("⏳ 等待最终词汇量结果...")
                         
                         # 捕获最终词汇量
                         final_vocab_size = self._capture_final_vocab_size()
@@ -508,35 +830,13 @@ class VocabTestScraper:
             logger.info(f"所有轮次完成，总共 {result['summary']['total_rounds']} 轮，{result['summary']['total_words']} 个单词，点击了 {result['summary']['total_clicked']} 个")
             
             # 输出JSON格式结果
-            import json
-            import os
-            from datetime import datetime
-            
             json_result = json.dumps(result, ensure_ascii=False, indent=2)
-            print(f"\n📊 点击结果JSON:")
-            print(json_result)
+            if self.interactive:
+                print(f"\n📊 点击结果JSON:")
+                print(json_result)
             
             # 保存JSON结果到文件
-            try:
-                # 创建结果目录（如果不存在）
-                results_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'preply_results')
-                os.makedirs(results_dir, exist_ok=True)
-                
-                # 生成文件名（包含时间戳）
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                filename = f"vocab_test_result_{timestamp}.json"
-                filepath = os.path.join(results_dir, filename)
-                
-                # 保存到文件
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    f.write(json_result)
-                
-                logger.info(f"结果已保存到文件: {filepath}")
-                print(f"💾 结果已保存到文件: {filepath}")
-                
-            except Exception as e:
-                logger.error(f"保存JSON文件时发生错误: {e}")
-                print(f"⚠️ 保存JSON文件失败: {e}")
+            self.last_result_path = self._save_result(json_result)
             
             return result
             
@@ -544,13 +844,50 @@ class VocabTestScraper:
             logger.error(f"随机点击label过程中发生错误: {e}")
             return result
     
-    def _click_labels_in_current_page(self, click_count, round_num):
+    def _save_result(self, json_result: str):
+        """
+        保存测试结果到结果目录
+        文件名包含时间戳和随机后缀，多个浏览器同时完成测试时不会互相覆盖
+        
+        Args:
+            json_result: JSON格式的测试结果
+            
+        Returns:
+            str: 保存的文件路径，保存失败时返回None
+        """
+        try:
+            # 创建结果目录（如果不存在）
+            os.makedirs(self.results_dir, exist_ok=True)
+            
+            # 生成文件名（包含时间戳和随机后缀）
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"vocab_test_result_{timestamp}_{uuid.uuid4().hex[:8]}.json"
+            filepath = os.path.join(self.results_dir, filename)
+            
+            # 保存到文件
+            with open(filepath, 'w', encoding='utf-8') as f:
+                f.write(json_result)
+            
+            logger.info(f"结果已保存到文件: {filepath}")
+            print(f"💾 结果已保存到文件: {filepath}")
+            return filepath
+            
+        except Exception as e:
+            logger.error(f"保存JSON文件时发生错误: {e}")
+            print(f"⚠️ 保存JSON文件失败: {e}")
+            return None
+    
+    def _click_labels_in_current_page(self, click_count, round_num, word_selector=None):
         """
         在当前页面中点击指定数量的label元素，并收集所有单词信息
         
+        单词、label的for属性和勾选状态由一次 execute_script 读取，选中的label也在页面内一次性点击，
+        只有页面内点击未生效的单词才逐个回退到 WebDriver 点击
+        
         Args:
             click_count: 要点击的label数量
             round_num: 当前轮次编号
+            word_selector: 可选的选词函数，提供时由其决定点击哪些单词
             
         Returns:
             dict: 包含所有单词信息的字典，格式为 {'words': [{'word': str, 'known': bool, 'for': str}], 'clicked_labels': []}
@@ -563,157 +900,78 @@ class VocabTestScraper:
         try:
             logger.info(f"正在查找词汇测试容器，class: {self.vocab_test_container_class}")
             
-            # 查找词汇测试容器
-            container_elements = self.driver.find_elements(
-                By.XPATH, 
-                f"//div[@class='{self.vocab_test_container_class}']"
-            )
-            
-            if not container_elements:
-                # 如果完整匹配失败，尝试部分匹配
-                logger.info("完整class匹配失败，尝试部分匹配...")
-                container_elements = self.driver.find_elements(
-                    By.XPATH,
-                    "//div[contains(@class, 'LayoutGrid__-dslt') and contains(@class, 'LayoutGrid--columns__kFwZC')]"
+            # 等待词汇测试容器出现，并等待单词label渲染出文本
+            try:
+                self._wait_until('container', lambda driver: self._extract_round_words(driver)['containers'], "词汇测试容器")
+                extracted = self._wait_until(
+                    'labels',
+                    lambda driver: (data := self._extract_round_words(driver))['words'] and data,
+                    "单词label渲染"
                 )
+            except TimeoutException:
+                extracted = self._extract_round_words(self.driver)
             
-            if not container_elements:
+            if not extracted['containers']:
                 logger.warning(f"第 {round_num} 轮：未找到词汇测试容器")
                 return result
             
-            logger.info(f"第 {round_num} 轮：找到 {len(container_elements)} 个词汇测试容器")
+            logger.info(f"第 {round_num} 轮：找到 {extracted['containers']} 个词汇测试容器")
             
-            # 在每个容器中查找label元素
-            all_labels = []
-            for container in container_elements:
-                try:
-                    # 查找容器内所有含有for="word_xxx"属性的label元素
-                    labels = container.find_elements(
-                        By.XPATH,
-                        ".//label[starts-with(@for, 'word_')]"
-                    )
-                    all_labels.extend(labels)
-                    logger.info(f"第 {round_num} 轮：在容器中找到 {len(labels)} 个label元素")
-                except Exception as e:
-                    logger.warning(f"第 {round_num} 轮：在容器中查找label元素时出错: {e}")
-            
-            if not all_labels:
+            all_words_info = extracted['words']
+            if not all_words_info:
                 logger.warning(f"第 {round_num} 轮：未找到任何含有for='word_xxx'属性的label元素")
                 return result
             
-            logger.info(f"第 {round_num} 轮：总共找到 {len(all_labels)} 个可点击的label元素")
-            
-            # 收集所有label内第一个span标签的文本作为单词
-            all_words_info = []
-            for label in all_labels:
-                try:
-                    label_for = label.get_attribute('for')
-                    # 查找label内的第一个span标签
-                    span_elements = label.find_elements(By.XPATH, ".//span")
-                    if span_elements:
-                        word_text = span_elements[0].text.strip()
-                        if word_text:  # 只保存非空的单词
-                            word_info = {
-                                'word': word_text,
-                                'known': False,  # 默认为未知
-                                'for': label_for,
-                                'label_element': label  # 临时保存元素引用用于点击
-                            }
-                            all_words_info.append(word_info)
-                            logger.debug(f"第 {round_num} 轮：收集到单词: {word_text} (for={label_for})")
-                except Exception as e:
-                    logger.warning(f"第 {round_num} 轮：收集label单词时出错: {e}")
-            
             logger.info(f"第 {round_num} 轮：收集到 {len(all_words_info)} 个单词")
             
-            # 随机选择要点击的label
-            click_count = min(click_count, len(all_words_info))
-            selected_words = random.sample(all_words_info, click_count)
+            if word_selector:
+                # 由选词函数决定要点击的label
+                selected_words = list(word_selector(round_num, all_words_info))
+                logger.info(f"第 {round_num} 轮：选词函数选择了 {len(selected_words)} 个单词进行点击")
+            else:
+                # 随机选择要点击的label
+                click_count = min(click_count, len(all_words_info))
+                selected_words = random.sample(all_words_info, click_count)
+                logger.info(f"第 {round_num} 轮：随机选择了 {click_count} 个单词进行点击")
             
-            logger.info(f"第 {round_num} 轮：随机选择了 {click_count} 个单词进行点击")
+            # 在页面内一次性点击选中的label，返回每个label点击后是否处于勾选状态
+            clicked_states = self.driver.execute_script("""
+                return arguments[0].map(labelFor => {
+                    const label = document.querySelector(`label[for="${CSS.escape(labelFor)}"]`);
+                    if (!label) {
+                        return false;
+                    }
+                    label.scrollIntoView({block: 'center'});
+                    const checkbox = label.querySelector("input[type='checkbox']");
+                    (checkbox || label).click();
+                    return checkbox ? checkbox.checked : true;
+                });
+            """, [word['for'] for word in selected_words])
             
-            # 创建点击的单词for属性集合，用于快速查找
-            clicked_for_set = {word['for'] for word in selected_words}
+            # 页面内点击未生效的单词回退到 WebDriver 逐个点击
+            for word_info, clicked in zip(selected_words, clicked_states):
+                if not clicked:
+                    logger.info(f"第 {round_num} 轮：页面内点击未生效，回退到WebDriver点击: '{word_info['word']}'")
+                    clicked = self._click_label_fallback(word_info['for'], round_num)
+                if clicked:
+                    result['clicked_labels'].append({
+                        'word': word_info['word'],
+                        'for': word_info['for'],
+                        'index': len(result['clicked_labels']) + 1,
+                        'round': round_num
+                    })
+                else:
+                    logger.error(f"第 {round_num} 轮：所有点击策略都失败，跳过单词: '{word_info['word']}' (for='{word_info['for']}')")
             
-            # 点击选中的单词对应的label
-            for i, word_info in enumerate(selected_words):
-                try:
-                    label = word_info['label_element']
-                    word_text = word_info['word']
-                    label_for = word_info['for']
-                    
-                    logger.info(f"第 {round_num} 轮：正在点击第 {i + 1} 个单词: '{word_text}' (for='{label_for}')")
-                    print(f"🎯 第 {round_num} 轮：点击第 {i + 1} 个单词: {word_text}")
-                    
-                    # 多策略点击机制
-                    click_success = False
-                    
-                    # 策略1: 尝试点击label内的checkbox input元素
-                    try:
-                        checkbox = label.find_element(By.XPATH, ".//input[@type='checkbox']")
-                        if checkbox:
-                            # 滚动到checkbox元素
-                            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", checkbox)
-                            time.sleep(0.5)
-                            
-                            # 点击checkbox
-                            checkbox.click()
-                            click_success = True
-                            logger.info(f"第 {round_num} 轮：策略1成功: 点击了checkbox元素")
-                    except Exception as e:
-                        logger.debug(f"第 {round_num} 轮：策略1失败 (checkbox): {e}")
-                    
-                    # 策略2: 如果策略1失败，尝试点击span文本元素
-                    if not click_success:
-                        try:
-                            span = label.find_element(By.XPATH, ".//span")
-                            if span:
-                                # 滚动到span元素
-                                self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", span)
-                                time.sleep(0.5)
-                                
-                                # 点击span
-                                span.click()
-                                click_success = True
-                                logger.info(f"第 {round_num} 轮：策略2成功: 点击了span元素")
-                        except Exception as e:
-                            logger.debug(f"第 {round_num} 轮：策略2失败 (span): {e}")
-                    
-                    # 策略3: 如果前两种策略都失败，直接用JavaScript点击label
-                    if not click_success:
-                        try:
-                            # 滚动到label元素
-                            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", label)
-                            time.sleep(0.5)
-                            
-                            # 使用JavaScript直接点击
-                            self.driver.execute_script("arguments[0].click();", label)
-                            click_success = True
-                            logger.info(f"第 {round_num} 轮：策略3成功: 使用JavaScript点击了label元素")
-                        except Exception as e:
-                            logger.error(f"第 {round_num} 轮：策略3失败 (JavaScript): {e}")
-                    
-                    if click_success:
-                        # 记录点击信息
-                        clicked_info = {
-                            'word': word_text,
-                            'for': label_for,
-                            'index': i + 1,
-                            'round': round_num
-                        }
-                        result['clicked_labels'].append(clicked_info)
-                        logger.info(f"第 {round_num} 轮：成功点击单词: {word_text}")
-                        
-                        # 点击间隔
-                        time.sleep(random.uniform(0.5, 1.5))
-                    else:
-                        logger.error(f"第 {round_num} 轮：所有点击策略都失败，跳过单词: '{word_text}' (for='{label_for}')")
-                        
-                except Exception as e:
-                    logger.error(f"第 {round_num} 轮：点击第 {i + 1} 个单词时发生错误: {e}")
-                    continue
+            clicked_words = [word['word'] for word in result['clicked_labels']]
+            logger.info(f"第 {round_num} 轮：点击了单词: {', '.join(clicked_words)}")
+            print(f"🎯 第 {round_num} 轮：点击了 {len(clicked_words)} 个单词: {', '.join(clicked_words)}")
+            
+            # 等待勾选状态生效后再继续
+            self._wait_for_labels_checked([word['for'] for word in result['clicked_labels']])
             
             # 设置所有单词的known状态并添加到结果中
+            clicked_for_set = {word['for'] for word in result['clicked_labels']}
             for word_info in all_words_info:
                 word_result = {
                     'word': word_info['word'],
@@ -731,6 +989,78 @@ class VocabTestScraper:
             logger.error(f"第 {round_num} 轮：点击单词过程中发生错误: {e}")
             return result
     
+    def _click_label_fallback(self, label_for, round_num):
+        """
+        使用 WebDriver 多策略点击单个label，页面内批量点击未生效时使用
+        
+        Args:
+            label_for: label的for属性
+            round_num: 当前轮次编号
+            
+        Returns:
+            bool: 点击是否成功
+        """
+        try:
+            label = self.driver.find_element(By.XPATH, f"//label[@for='{label_for}']")
+        except Exception as e:
+            logger.error(f"第 {round_num} 轮：未找到label (for='{label_for}'): {e}")
+            return False
+        
+        # 策略1: 尝试点击label内的checkbox input元素
+        try:
+            checkbox = label.find_element(By.XPATH, ".//input[@type='checkbox']")
+            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", checkbox)
+            checkbox.click()
+            logger.info(f"第 {round_num} 轮：策略1成功: 点击了checkbox元素")
+            return True
+        except Exception as e:
+            logger.debug(f"第 {round_num} 轮：策略1失败 (checkbox): {e}")
+        
+        # 策略2: 尝试点击span文本元素
+        try:
+            span = label.find_element(By.XPATH, ".//span")
+            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", span)
+            span.click()
+            logger.info(f"第 {round_num} 轮：策略2成功: 点击了span元素")
+            return True
+        except Exception as e:
+            logger.debug(f"第 {round_num} 轮：策略2失败 (span): {e}")
+        
+        # 策略3: 直接用JavaScript点击label
+        try:
+            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'}); arguments[0].click();", label)
+            logger.info(f"第 {round_num} 轮：策略3成功: 使用JavaScript点击了label元素")
+            return True
+        except Exception as e:
+            logger.error(f"第 {round_num} 轮：策略3失败 (JavaScript): {e}")
+            return False
+    
+    def _wait_for_labels_checked(self, label_fors):
+        """
+        等待已点击label内的复选框全部变为勾选状态，没有复选框的label不参与判断
+        
+        Args:
+            label_fors: 已点击label的for属性列表
+        """
+        if not label_fors:
+            return
+        try:
+            self._wait_until(
+                'click',
+                lambda driver: not driver.execute_script("""
+                    return arguments[0].filter(labelFor => {
+                        const checkbox = document.querySelector(
+                            `label[for="${CSS.escape(labelFor)}"] input[type='checkbox']`
+                        );
+                        return checkbox && !checkbox.checked;
+                    });
+                """, label_fors),
+                "单词勾选生效"
+            )
+        except TimeoutException:
+            logger.warning("单词勾选状态未确认，继续执行")
+    
+
     def _click_continue_button(self):
         """
         点击Continue按钮
@@ -748,9 +1078,9 @@ class VocabTestScraper:
             )
             
             if continue_button:
-                # 滚动到按钮
+                # 滚动到按钮并等待其可点击
                 self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", continue_button)
-                time.sleep(0.5)
+                self._wait_until('click', EC.element_to_be_clickable(continue_button), "Continue按钮可点击")
                 
                 # 点击按钮
                 continue_button.click()
@@ -775,6 +1105,22 @@ class VocabTestScraper:
         try:
             logger.info("正在查找最终词汇量结果...")
             
+            # 等待结果数字可见
+            try:
+                self._wait_until(
+                    'result',
+                    lambda driver: any(
+                        element.is_displayed() and any(char.isdigit() for char in element.text)
+                        for element in driver.find_elements(
+                            By.XPATH,
+                            "//h3[contains(@class, 'preply-ds-heading') and contains(@class, 'Heading--variant-huge')]"
+                        )
+                    ),
+                    "最终词汇量数字"
+                )
+            except TimeoutException:
+                pass
+            
             # 查找包含最终词汇量的h3元素
             vocab_element = self.driver.find_element(
                 By.XPATH,
@@ -832,49 +1178,56 @@ class VocabTestScraper:
             # 查找具有指定class属性的div元素
             logger.info(f"正在查找class属性为: {self.target_class}")
             
-            # 使用完整的class属性查找
-            elements = self.driver.find_elements(
-                By.XPATH, 
-                f"//div[@class='{self.target_class}']"
+            # 一次 execute_script 查找元素并读取所有属性：先完整class匹配，失败时部分匹配
+            elements_info = self.driver.execute_script("""
+                const findAll = xpath => {
+                    const snapshot = document.evaluate(
+                        xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+                    );
+                    return Array.from({length: snapshot.snapshotLength}, (_, i) => snapshot.snapshotItem(i));
+                };
+                let elements = findAll(arguments[0]);
+                if (!elements.length) {
+                    elements = findAll(arguments[1]);
+                }
+                return elements.map(element => {
+                    const rect = element.getBoundingClientRect();
+                    return {
+                        tag_name: element.localName,
+                        text: element.innerText.trim(),
+                        class_attribute: element.getAttribute('class'),
+                        inner_html: element.innerHTML,
+                        location: {x: Math.round(rect.left + window.scrollX), y: Math.round(rect.top + window.scrollY)},
+                        size: {height: rect.height, width: rect.width}
+                    };
+                });
+            """,
+                f"//div[@class='{self.target_class}']",
+                "//div[contains(@class, 'LayoutGap__FdLKD') and contains(@class, 'LayoutHide__Q53jS')]"
             )
             
-            if not elements:
-                # 如果完整匹配失败，尝试部分匹配
-                logger.info("完整class匹配失败，尝试部分匹配...")
-                elements = self.driver.find_elements(
-                    By.XPATH,
-                    "//div[contains(@class, 'LayoutGap__FdLKD') and contains(@class, 'LayoutHide__Q53jS')]"
-                )
-            
-            logger.info(f"找到 {len(elements)} 个匹配的元素")
+            logger.info(f"找到 {len(elements_info)} 个匹配的元素")
             
-            # 提取元素信息
-            for i, element in enumerate(elements):
-                try:
-                    element_info = {
-                        'index': i + 1,
-                        'tag_name': element.tag_name,
-                        'text': element.text.strip(),
-                        'class_attribute': element.get_attribute('class'),
-                        'inner_html': element.get_attribute('innerHTML')[:500] + '...' if len(element.get_attribute('innerHTML')) > 500 else element.get_attribute('innerHTML'),
-                        'location': element.location,
-                        'size': element.size
-                    }
-                    
-                    results.append(element_info)
-                    
-                    # 打印元素信息
-                    print(f"\n=== 元素 {i + 1} ===")
-                    print(f"标签名: {element_info['tag_name']}")
-                    print(f"文本内容: {element_info['text']}")
-                    print(f"Class属性: {element_info['class_attribute']}")
-                    print(f"位置: {element_info['location']}")
-                    print(f"大小: {element_info['size']}")
-                    print(f"HTML内容(前500字符): {element_info['inner_html']}")
-                    print("-" * 50)
-                    
-                except Exception as e:
-                    logger.error(f"提取第 {i + 1} 个元素信息时出错: {e}")
+            # 整理元素信息
+            for i, element_info in enumerate(elements_info):
+                inner_html = element_info['inner_html']
+                element_info = {
+                    'index': i + 1,
+                    **element_info,
+                    'inner_html': inner_html[:500] + '...' if len(inner_html) > 500 else inner_html
+                }
+                
+                results.append(element_info)
+                
+                # 打印元素信息
+                print(f"\n=== 元素 {i + 1} ===")
+                print(f"标签名: {element_info['tag_name']}")
+                print(f"文本内容: {element_info['text']}")
+                print(f"Class属性: {element_info['class_attribute']}")
+                print(f"位置: {element_info['location']}")
+                print(f"大小: {element_info['size']}")
+                print(f"HTML内容(前500字符): {element_info['inner_html']}")
+                print("-" * 50)
             
             return results
             
@@ -893,6 +1246,19 @@ class VocabTestScraper:
                 self.driver.quit()
                 logger.info("WebDriver 已关闭")
     
+    def close(self):
+        """
+        关闭浏览器
+        """
+        if self.driver:
+            try:
+                self.driver.quit()
+                logger.info("WebDriver 已关闭")
+            except Exception as e:
+                logger.warning(f"关闭WebDriver时出错: {e}")
+            finally:
+                self.driver = None
+    
     def get_page_info(self):
         """
         获取页面基本信息
@@ -1,18 +1,34 @@
+import argparse
+import csv
+import hashlib
+import io
 import json
 import os
+import queue
 import sys
 import json
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
+from itertools import chain, islice
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
 import logging
 
 # 添加项目根目录到Python路径
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from sqlalchemy.orm import Session
+from sqlalchemy import MetaData, Table, create_engine, func, inspect, text
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.schema import CreateTable
 from app.db import SessionLocal, init_db, check_db_connection
-from app.models import TABLE_MODEL_MAPPING
+from app.models import TABLE_MODEL_MAPPING, normalize_head_word
+from app.service.sync_report import SYNC_REPORT_VERSION, peak_rss_bytes, resolve_report_dir, write_sync_report
+from app.service.vocabulary_snapshot import RECORD_FIELDS, resolve_snapshot_path, write_snapshot
+from app.service.word_levels import resolve_word_levels_path, write_word_levels
 
 # 配置日志
 logging.basicConfig(
@@ -21,6 +37,284 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 批量写入的列顺序，与 _extract_row 返回的元组一一对应
+VOCABULARY_COLUMNS = (
+    "word_rank", "head_word", "head_word_norm", "translation", "book_id", "word_id", "us_phone", "uk_phone",
+    "content_hash"
+)
+WORD_ID_INDEX = VOCABULARY_COLUMNS.index("word_id")
+
+# 同步性能分析的阶段：读取原始行、JSON解析、字段提取、写入数据库、写入方等待解析线程，
+# 以及批量重新加载时的删除索引、重建索引和更新统计信息
+PROFILE_STAGES = ("read", "decode", "extract", "insert", "wait", "drop_index", "create_index", "analyze")
+INDEX_STAGES = ("drop_index", "create_index", "analyze")
+
+# 原子切换时等待表锁的最长时间，超时则放弃切换而不是长时间阻塞读请求
+SWAP_LOCK_TIMEOUT = "5s"
+
+# 支持 INSERT ... ON CONFLICT 的方言
+UPSERT_DIALECTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+# 每批写入的行数，流水线内存占用与之成正比
+DEFAULT_BATCH_SIZE = 5000
+
+# 解析线程预先准备好的批次数量
+PREFETCH_DEPTH = 2
+
+
+class _PrefetchError:
+    """
+    预取线程中抛出的异常，转交给消费方重新抛出
+    """
+    
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+_PREFETCH_DONE = object()
+
+
+def _prefetch(iterable: Iterable, depth: int = PREFETCH_DEPTH) -> Iterator:
+    """
+    在后台线程中消费迭代器，并通过有界队列交给调用方
+    写入当前批次的同时解析下一批次，队列长度限制了内存中的批次数量
+    
+    Args:
+        iterable: 数据来源迭代器
+        depth: 预取的最大元素数量
+        
+    Yields:
+        来源迭代器中的元素
+    """
+    items = queue.Queue(maxsize=depth)
+    stopped = threading.Event()
+    
+    def put(item) -> bool:
+        while not stopped.is_set():
+            try:
+                items.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def produce():
+        try:
+            for item in iterable:
+                if not put(item):
+                    return
+            put(_PREFETCH_DONE)
+        except BaseException as e:
+            put(_PrefetchError(e))
+    
+    producer = threading.Thread(target=produce, name="sync-prefetch", daemon=True)
+    producer.start()
+    try:
+        while True:
+            item = items.get()
+            if item is _PREFETCH_DONE:
+                return
+            if isinstance(item, _PrefetchError):
+                raise item.error
+            yield item
+    finally:
+        stopped.set()
+
+
+def _content_hash(row: Tuple) -> str:
+    """
+    计算记录内容哈希，用于增量同步时判断记录是否变化
+    """
+    content = "\x1f".join(map(str, row))
+    return hashlib.sha1(content.encode("utf-8")).hexdigest()
+
+
+def _extract_row(word_data: Dict[str, Any]) -> Tuple:
+    """
+    单次遍历嵌套的单词数据，提取批量写入用的行元组，列顺序见 VOCABULARY_COLUMNS
+    
+    Args:
+        word_data: 单词数据字典
+        
+    Returns:
+        行元组
+    """
+    word = word_data.get("content") or {}
+    word = word.get("word") or {}
+    detail = word.get("content") or {}
+    
+    # 提取所有翻译并合并
+    translations = []
+    for trans in detail.get("trans") or ():
+        tran_cn = trans.get("tranCn")
+        if tran_cn:
+            pos = trans.get("pos")
+            translations.append(f"{pos}. {tran_cn}" if pos else tran_cn)
+    
+    head_word = word_data.get("headWord", "")
+    row = (
+        word_data.get("wordRank", 0),
+        head_word,
+        normalize_head_word(head_word),
+        "; ".join(translations),
+        word_data.get("bookId", ""),
+        word.get("wordId", ""),
+        detail.get("usphone", ""),
+        detail.get("ukphone", "")
+    )
+    return row + (_content_hash(row),)
+
+
+def _filter_word_ids(rows: List[Tuple], seen: set, counters: Dict[str, Any]) -> List[Tuple]:
+    """
+    跳过单词ID为空或在本文件中重复出现的行，保留首次出现的记录
+    word_id 上有唯一约束，所有同步模式写入前都经过此过滤
+    
+    Args:
+        rows: 行元组列表
+        seen: 本文件中已出现的单词ID，原地更新
+        counters: 累计跳过行数的报告字典
+        
+    Returns:
+        过滤后的行元组列表
+    """
+    kept = []
+    for row in rows:
+        word_id = row[WORD_ID_INDEX]
+        if not word_id:
+            logger.warning(f"单词ID为空，已跳过: {row[1]}")
+        elif word_id in seen:
+            logger.warning(f"重复的单词ID，已跳过: {word_id}")
+        else:
+            seen.add(word_id)
+            kept.append(row)
+            continue
+        counters["skipped_word_ids"] += 1
+    return kept
+
+
+def _timed(iterable: Iterable, timings: Dict[str, float], stage: str) -> Iterator:
+    """
+    将从迭代器取下一个元素所花费的时间累计到指定阶段
+    """
+    iterator = iter(iterable)
+    while True:
+        start = time.perf_counter()
+        item = next(iterator, _PREFETCH_DONE)
+        timings[stage] += time.perf_counter() - start
+        if item is _PREFETCH_DONE:
+            return
+        yield item
+
+
+@contextmanager
+def _stage_timer(timings: Dict[str, float], stage: str):
+    """
+    将代码块的耗时累计到指定阶段
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[stage] += time.perf_counter() - start
+
+
+def _format_timings(timings: Dict[str, float]) -> str:
+    """
+    格式化分阶段耗时
+    """
+    return "，".join(f"{stage} {timings.get(stage, 0.0):.2f}s" for stage in PROFILE_STAGES)
+
+
+def _new_file_report(file_name: str, table_name: str) -> Dict[str, Any]:
+    """
+    创建单个文件的同步报告，计数在读取、解析和写入过程中累计
+    """
+    return {
+        "file": file_name,
+        "table": table_name,
+        "success": False,
+        "lines_read": 0,
+        "decode_failures": 0,
+        "extract_failures": 0,
+        "skipped_word_ids": 0,
+        "rows_written": 0,
+        "bytes_read": 0,
+        "wall_seconds": 0.0,
+        "cpu_seconds": 0.0,
+        "rows_per_second": 0.0,
+        "peak_rss_bytes": None,
+        "stages": dict.fromkeys(PROFILE_STAGES, 0.0),
+    }
+
+
+def _finish_file_report(report: Dict[str, Any], start_time: float, start_cpu: float):
+    """
+    填写文件同步报告的耗时、吞吐量和内存占用
+    """
+    wall = time.perf_counter() - start_time
+    report["wall_seconds"] = wall
+    report["cpu_seconds"] = time.process_time() - start_cpu
+    report["rows_per_second"] = report["rows_written"] / wall if wall > 0 else 0.0
+    report["peak_rss_bytes"] = peak_rss_bytes()
+
+
+def positive_int(value: str) -> int:
+    """
+    argparse 参数类型：解析正整数，批次大小和进程数为0或负数时在解析参数阶段报错
+    
+    Args:
+        value: 命令行参数值
+        
+    Returns:
+        正整数
+        
+    Raises:
+        argparse.ArgumentTypeError: 参数不是正整数时
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"不是有效的整数: {value}")
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"必须为正整数: {value}")
+    return number
+
+
+class _CopyStream:
+    """
+    将行迭代器包装为 copy_expert 可读取的文件对象
+    按 CSV 格式按需生成数据，不会一次性在内存中构造整个文件
+    """
+    
+    def __init__(self, rows: Iterable[Tuple]):
+        self._rows = iter(rows)
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer, quoting=csv.QUOTE_NONNUMERIC, lineterminator="\n")
+        self._exhausted = False
+        self.row_count = 0
+    
+    def read(self, size: int = -1) -> str:
+        while not self._exhausted and (size < 0 or self._buffer.tell() < size):
+            row = next(self._rows, None)
+            if row is None:
+                self._exhausted = True
+            else:
+                self._writer.writerow(row)
+                self.row_count += 1
+        
+        data = self._buffer.getvalue()
+        rest = ""
+        if 0 <= size < len(data):
+            data, rest = data[:size], data[size:]
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        self._buffer.write(rest)
+        return data
+
 
 class VocabularyDataSync:
     """
@@ -28,16 +322,59 @@ class VocabularyDataSync:
     负责从JSON文件读取数据并同步到数据库
     """
     
-    def __init__(self, datasets_dir: str = "datasets"):
+    def __init__(
+        self,
+        datasets_dir: str = "datasets",
+        snapshot_path: Optional[str] = None,
+        bulk: bool = False,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        session_factory: sessionmaker = SessionLocal,
+        incremental: bool = False,
+        swap: bool = False,
+        report_dir: Optional[str] = None,
+        resume: bool = False,
+        checkpoint_dir: Optional[str] = None,
+        word_levels_path: Optional[str] = None
+    ):
         """
         初始化数据同步器
         
         Args:
             datasets_dir: 数据集目录路径
+            snapshot_path: 词汇快照输出路径，默认使用配置中的路径
+            bulk: 是否使用批量写入（PostgreSQL 使用 COPY，其他数据库使用 executemany）
+            batch_size: 每批解析和写入的行数
+            session_factory: 数据库会话工厂，默认使用应用的全局会话工厂
+            incremental: 是否按 word_id 增量同步，仅写入内容哈希发生变化的记录
+            swap: 全量同步时是否先加载到暂存表再原子切换（仅支持 PostgreSQL）
+            report_dir: 同步报告输出目录，默认使用配置中的目录
+            resume: 是否从检查点继续上次中断的暂存表加载，启用后总是使用暂存表切换
+            checkpoint_dir: 检查点目录，默认为数据集目录下的 .checkpoints
+            word_levels_path: 单词等级词典输出路径，默认使用配置中的路径
+            
+        Raises:
+            ValueError: batch_size 不是正整数时
         """
+        if batch_size <= 0:
+            raise ValueError(f"batch_size 必须为正整数: {batch_size}")
         self.datasets_dir = Path(datasets_dir)
+        self.bulk = bulk
+        self.incremental = incremental
+        self.swap = swap or resume
+        self.resume = resume
+        self.batch_size = batch_size
+        self.snapshot_path = resolve_snapshot_path(snapshot_path)
+        self.word_levels_path = resolve_word_levels_path(word_levels_path)
+        self.report_dir = resolve_report_dir(report_dir)
+        self.checkpoint_dir = Path(checkpoint_dir) if checkpoint_dir else self.datasets_dir / ".checkpoints"
+        self.session_factory = session_factory
         self.db_session: Session = None
         
+        # 各文件的同步报告（计数、耗时、内存占用及分阶段耗时）
+        self.file_reports: Dict[str, Dict[str, Any]] = {}
+        self.started_at = time.time()
+        self._start_time = time.perf_counter()
+        
         # 文件名到表名的映射
         self.file_table_mapping = {
             "cet4.json": "cet4",
@@ -52,7 +389,7 @@ class VocabularyDataSync:
         获取数据库会话
         """
         if self.db_session is None:
-            self.db_session = SessionLocal()
+            self.db_session = self.session_factory()
         return self.db_session
     
     def _close_db_session(self):
@@ -63,147 +400,499 @@ class VocabularyDataSync:
             self.db_session.close()
             self.db_session = None
     
-    def _extract_translation(self, word_data: Dict[str, Any]) -> str:
+    def _iter_line_batches(
+        self,
+        file_path: Path,
+        counters: Dict[str, Any],
+        start_offset: int = 0,
+        start_line: int = 1
+    ) -> Iterator[Tuple[int, List[bytes], int]]:
+        """
+        按批次读取文件原始行
+        
+        Args:
+            file_path: JSON文件路径
+            counters: 累计读取行数和字节数的报告字典
+            start_offset: 开始读取的字节偏移（从检查点恢复时使用）
+            start_line: start_offset 处的行号
+            
+        Yields:
+            (批次第一行的行号, 原始行列表, 批次结束处的字节偏移)
+        """
+        line_num = start_line
+        with open(file_path, 'rb') as f:
+            f.seek(start_offset)
+            while True:
+                lines = list(islice(f, self.batch_size))
+                end_offset = f.tell()
+                counters["bytes_read"] = end_offset
+                if not lines:
+                    return
+                counters["lines_read"] += len(lines)
+                yield line_num, lines, end_offset
+                line_num += len(lines)
+    
+    def _process_lines(
+        self,
+        first_line_num: int,
+        lines: List[bytes],
+        timings: Dict[str, float],
+        counters: Dict[str, Any]
+    ) -> Tuple[List[Tuple], int]:
         """
-        从词汇数据中提取中文翻译
+        解析一批JSON行并提取为行元组，跳过空行、无法解析的行和无法提取的记录
+        解析与提取逐行交替进行，解析出的字典用完即释放
         
         Args:
-            word_data: 单词数据字典
+            first_line_num: 批次第一行的行号
+            lines: 原始行列表
+            timings: 阶段耗时累计字典
+            counters: 累计解析失败和提取失败数的报告字典
             
         Returns:
-            中文翻译字符串
+            (行元组列表, 成功解析的记录数)
         """
-        try:
-            content = word_data.get("content", {})
-            word_content = content.get("word", {})
-            word_detail = word_content.get("content", {})
-            trans_list = word_detail.get("trans", [])
+        rows = []
+        parsed_count = decode_failures = extract_failures = 0
+        decode_time = extract_time = 0.0
+        clock = time.perf_counter
+        for line_num, line in enumerate(lines, first_line_num):
+            line = line.strip()
+            if not line:  # 跳过空行
+                continue
             
-            # 提取所有翻译并合并
-            translations = []
-            for trans in trans_list:
-                tran_cn = trans.get("tranCn", "")
-                pos = trans.get("pos", "")
-                if tran_cn:
-                    if pos:
-                        translations.append(f"{pos}. {tran_cn}")
-                    else:
-                        translations.append(tran_cn)
+            start = clock()
+            try:
+                word_data = json.loads(line)
+            except ValueError as e:
+                logger.warning(f"第{line_num}行JSON解析失败: {e}")
+                decode_failures += 1
+                continue
+            decoded = clock()
+            decode_time += decoded - start
+            parsed_count += 1
             
-            return "; ".join(translations) if translations else ""
-        except Exception as e:
-            logger.warning(f"提取翻译失败: {e}")
-            return ""
+            try:
+                rows.append(_extract_row(word_data))
+            except Exception as e:
+                logger.warning(f"创建记录失败: {e}, 数据: {word_data.get('headWord', 'unknown')}")
+                extract_failures += 1
+            extract_time += clock() - decoded
+        
+        timings["decode"] += decode_time
+        timings["extract"] += extract_time
+        counters["decode_failures"] += decode_failures
+        counters["extract_failures"] += extract_failures
+        return rows, parsed_count
     
-    def _extract_phonetics(self, word_data: Dict[str, Any]) -> tuple:
+    def _iter_positioned_batches(
+        self,
+        file_path: Path,
+        timings: Dict[str, float],
+        counters: Dict[str, Any],
+        start_offset: int = 0,
+        start_line: int = 1,
+        seen_word_ids: Optional[set] = None
+    ) -> Iterator[Tuple[List[Tuple], int, int]]:
         """
-        从词汇数据中提取音标信息
+        读取、解析、提取字段并按批次输出行元组及批次结束位置，同时累计各阶段耗时和计数
+        单词ID为空或重复的行在此跳过，见 _filter_word_ids
         
         Args:
-            word_data: 单词数据字典
+            file_path: JSON文件路径
+            timings: 阶段耗时累计字典
+            counters: 读取、解析计数的报告字典
+            start_offset: 开始读取的字节偏移
+            start_line: start_offset 处的行号
+            seen_word_ids: 已写入的单词ID（从检查点恢复时使用），默认为空
             
-        Returns:
-            (美音音标, 英音音标) 元组
+        Yields:
+            (不超过 batch_size 行的批次, 批次结束处的字节偏移, 下一批次的起始行号)，批次可能为空
         """
-        try:
-            content = word_data.get("content", {})
-            word_content = content.get("word", {})
-            word_detail = word_content.get("content", {})
+        parsed_count = 0
+        seen = set() if seen_word_ids is None else seen_word_ids
+        line_batches = _timed(
+            self._iter_line_batches(file_path, counters, start_offset, start_line), timings, "read"
+        )
+        for first_line_num, lines, end_offset in line_batches:
+            rows, count = self._process_lines(first_line_num, lines, timings, counters)
+            parsed_count += count
+            rows = _filter_word_ids(rows, seen, counters)
+            yield rows, end_offset, first_line_num + len(lines)
+        
+        logger.info(f"成功解析 {parsed_count} 条记录从文件 {file_path}")
+    
+    def _iter_batches(
+        self, file_path: Path, timings: Dict[str, float], counters: Dict[str, Any]
+    ) -> Iterator[List[Tuple]]:
+        """
+        读取、解析、提取字段并按批次输出行元组，同时累计各阶段耗时和计数
+        
+        Args:
+            file_path: JSON文件路径
+            timings: 阶段耗时累计字典
+            counters: 读取、解析计数的报告字典
             
-            us_phone = word_detail.get("usphone", "")
-            uk_phone = word_detail.get("ukphone", "")
+        Yields:
+            不超过 batch_size 行的非空批次
+        """
+        for rows, _, _ in self._iter_positioned_batches(file_path, timings, counters):
+            if rows:
+                yield rows
+    
+    def _write_batch(self, db: Session, model_class, batch: List[Tuple], table: Optional[Table] = None) -> int:
+        """
+        写入一个批次的行数据
+        批量模式下 PostgreSQL 通过 copy_expert 以 COPY ... FROM STDIN 流式写入，其他数据库使用 executemany；
+        否则通过ORM逐条添加并在批次结束时flush
+        
+        Args:
+            db: 数据库会话
+            model_class: 模型类
+            batch: 行元组列表
+            table: 写入的目标表，默认为模型对应的表；指定暂存表时总是批量写入
             
-            return us_phone, uk_phone
-        except Exception as e:
-            logger.warning(f"提取音标失败: {e}")
-            return "", ""
+        Returns:
+            写入的行数
+        """
+        if not self.bulk and table is None:
+            for row in batch:
+                db.add(model_class(**dict(zip(VOCABULARY_COLUMNS, row))))
+            db.flush()
+            # 释放已写入的对象，避免会话随文件大小增长
+            db.expunge_all()
+            return len(batch)
+        
+        table = model_class.__table__ if table is None else table
+        connection = db.connection()
+        
+        if connection.dialect.name == "postgresql":
+            stream = _CopyStream(batch)
+            copy_sql = f"COPY {table.name} ({', '.join(VOCABULARY_COLUMNS)}) FROM STDIN WITH (FORMAT csv)"
+            with connection.connection.cursor() as cursor:
+                cursor.copy_expert(copy_sql, stream)
+            return stream.row_count
+        
+        connection.execute(table.insert(), [dict(zip(VOCABULARY_COLUMNS, row)) for row in batch])
+        return len(batch)
     
-    def _extract_word_id(self, word_data: Dict[str, Any]) -> str:
+    def _upsert_rows(self, db: Session, model_class, rows: List[Tuple]):
         """
-        从词汇数据中提取单词ID
+        以 INSERT ... ON CONFLICT (word_id) DO UPDATE 写入新增或变化的记录
         
         Args:
-            word_data: 单词数据字典
+            db: 数据库会话
+            model_class: 模型类
+            rows: 行元组列表
+        """
+        connection = db.connection()
+        insert = UPSERT_DIALECTS.get(connection.dialect.name)
+        if insert is None:
+            raise RuntimeError(f"增量同步不支持数据库类型: {connection.dialect.name}")
+        
+        stmt = insert(model_class.__table__)
+        update_columns = {
+            column: stmt.excluded[column]
+            for column in VOCABULARY_COLUMNS
+            if column != "word_id"
+        }
+        update_columns["updated_at"] = func.now()
+        stmt = stmt.on_conflict_do_update(index_elements=["word_id"], set_=update_columns)
+        connection.execute(stmt, [dict(zip(VOCABULARY_COLUMNS, row)) for row in rows])
+    
+    def _apply_incremental(self, db: Session, model_class, batches: Iterable[List[Tuple]]) -> Dict[str, int]:
+        """
+        增量同步：按 word_id 对比内容哈希，只写入变化的记录并删除已不存在的记录
+        
+        Args:
+            db: 数据库会话
+            model_class: 模型类
+            batches: 行元组批次迭代器
             
         Returns:
-            单词ID字符串
+            新增、更新、删除和未变化的记录数
         """
-        try:
-            content = word_data.get("content", {})
-            word_content = content.get("word", {})
-            return word_content.get("wordId", "")
-        except Exception as e:
-            logger.warning(f"提取单词ID失败: {e}")
-            return ""
+        existing = dict(db.query(model_class.word_id, model_class.content_hash))
+        seen = set()
+        counts = {"inserted": 0, "updated": 0, "deleted": 0, "unchanged": 0}
+        
+        for batch in batches:
+            changed = []
+            for row in batch:
+                # 空ID和重复ID已在读取时跳过
+                word_id = row[WORD_ID_INDEX]
+                seen.add(word_id)
+                
+                if word_id not in existing:
+                    counts["inserted"] += 1
+                    changed.append(row)
+                elif existing[word_id] != row[-1]:
+                    counts["updated"] += 1
+                    changed.append(row)
+                else:
+                    counts["unchanged"] += 1
+            
+            if changed:
+                self._upsert_rows(db, model_class, changed)
+        
+        # 删除数据文件中已不存在的记录
+        vanished = [word_id for word_id in existing if word_id not in seen]
+        for start in range(0, len(vanished), self.batch_size):
+            chunk = vanished[start:start + self.batch_size]
+            db.query(model_class).filter(model_class.word_id.in_(chunk)).delete(synchronize_session=False)
+        counts["deleted"] = len(vanished)
+        
+        return counts
     
-    def _parse_json_file(self, file_path: Path) -> List[Dict[str, Any]]:
+    def _use_swap(self, db: Session) -> bool:
+        """
+        判断本次全量同步是否使用暂存表原子切换
         """
-        解析JSON文件 - 支持每行一个JSON对象的格式
+        if not self.swap:
+            return False
+        if db.get_bind().dialect.name != "postgresql":
+            logger.warning("暂存表原子切换仅支持 PostgreSQL，回退为原地重新加载")
+            return False
+        return True
+    
+    @staticmethod
+    def _staging_table(model_class) -> Table:
+        """
+        构建与模型表结构相同的暂存表定义（独立的索引、主键和序列名称）
+        """
+        table = model_class.__table__
+        return table.to_metadata(MetaData(), name=f"{table.name}_staging")
+    
+    def _bulk_reload(
+        self, db: Session, model_class, batches: Iterable[List[Tuple]], timings: Dict[str, float]
+    ) -> int:
+        """
+        原地批量重新加载：先删除二级索引，清空并写入数据后再重建索引，最后更新统计信息
+        避免在加载过程中逐行维护索引；删除索引、清空、写入和重建索引在同一事务中，
+        PostgreSQL 上 DROP INDEX 获取的 ACCESS EXCLUSIVE 锁会一直持有到提交，整个重新加载期间读请求都会被阻塞，
+        线上环境请使用 --swap
         
         Args:
-            file_path: JSON文件路径
+            db: 数据库会话
+            model_class: 模型类
+            batches: 行元组批次迭代器
+            timings: 分阶段耗时
             
         Returns:
-            解析后的数据列表
+            写入的行数
+        """
+        table = model_class.__table__
+        if db.get_bind().dialect.name == "postgresql":
+            logger.warning(f"原地重新加载期间表 {table.name} 被排他锁定，读请求将被阻塞直至提交；线上环境请使用 --swap")
+        
+        with _stage_timer(timings, "drop_index"):
+            for index in table.indexes:
+                index.drop(bind=db.connection(), checkfirst=True)
+        
+        db.query(model_class).delete()
+        logger.info(f"已删除表 {table.name} 的二级索引并清空现有数据")
+        
+        success_count = 0
+        for batch in batches:
+            success_count += self._write_batch(db, model_class, batch)
+        
+        with _stage_timer(timings, "create_index"):
+            for index in table.indexes:
+                index.create(bind=db.connection())
+        db.commit()
+        
+        with _stage_timer(timings, "analyze"):
+            db.execute(text(f"ANALYZE {table.name}"))
+            db.commit()
+        
+        return success_count
+    
+    @staticmethod
+    def _create_indexes_concurrently(db: Session, table: Table):
+        """
+        使用 CREATE INDEX CONCURRENTLY 建立索引，需要在自动提交的独立连接上执行
+        先删除上次中断时可能残留的无效索引
+        """
+        with db.get_bind().connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+            for index in table.indexes:
+                index.drop(bind=connection, checkfirst=True)
+                index.dialect_kwargs["postgresql_concurrently"] = True
+                index.create(bind=connection)
+    
+    def _checkpoint_path(self, file_name: str) -> Path:
+        """
+        获取文件的检查点路径
+        """
+        return self.checkpoint_dir / f"{file_name}.checkpoint.json"
+    
+    @staticmethod
+    def _save_checkpoint(checkpoint_path: Path, checkpoint: Dict[str, Any]):
+        """
+        写入检查点，先写临时文件再原子替换，中断时不会留下不完整的检查点
+        """
+        checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = checkpoint_path.with_name(checkpoint_path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(checkpoint, f, ensure_ascii=False)
+        os.replace(tmp_path, checkpoint_path)
+    
+    def _load_checkpoint(
+        self, db: Session, checkpoint_path: Path, file_path: Path, staging: Table
+    ) -> Optional[Dict[str, Any]]:
+        """
+        读取并校验检查点
+        数据文件的大小和修改时间与检查点记录一致且暂存表仍存在时才可恢复
+        
+        Returns:
+            有效的检查点，无检查点或已失效时返回 None
         """
-        data_list = []
+        if not checkpoint_path.exists():
+            logger.info(f"没有找到检查点 {checkpoint_path}，从头开始加载")
+            return None
+        
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                for line_num, line in enumerate(f, 1):
-                    line = line.strip()
-                    if not line:  # 跳过空行
-                        continue
-                    
-                    try:
-                        # 解析每行的JSON数据
-                        json_data = json.loads(line)
-                        data_list.append(json_data)
-                    except json.JSONDecodeError as e:
-                        logger.warning(f"第{line_num}行JSON解析失败: {e}")
-                        continue
-                        
-            logger.info(f"成功解析 {len(data_list)} 条记录从文件 {file_path}")
-            return data_list
-                
-        except Exception as e:
-            logger.error(f"解析JSON文件失败 {file_path}: {e}")
-            return []
+            with open(checkpoint_path, "r", encoding="utf-8") as f:
+                checkpoint = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"无法读取检查点 {checkpoint_path}: {e}，从头开始加载")
+            return None
+        
+        stat = file_path.stat()
+        if (
+            checkpoint.get("file_size") != stat.st_size
+            or checkpoint.get("file_mtime_ns") != stat.st_mtime_ns
+            or checkpoint.get("staging_table") != staging.name
+            or checkpoint.get("batch_size") != self.batch_size
+        ):
+            logger.warning(f"数据文件或同步参数已变化，检查点 {checkpoint_path} 失效，从头开始加载")
+            return None
+        if not inspect(db.connection()).has_table(staging.name):
+            logger.warning(f"暂存表 {staging.name} 不存在，检查点 {checkpoint_path} 失效，从头开始加载")
+            return None
+        return checkpoint
     
-    def _create_vocabulary_record(self, word_data: Dict[str, Any], model_class) -> object:
+    def _load_staging(self, db: Session, model_class, staging: Table, file_path: Path, report: Dict[str, Any]) -> int:
         """
-        创建词汇记录对象
+        分批加载数据到暂存表，每批单独提交并在提交后记录检查点
+        启用 resume 时从检查点记录的字节偏移处继续加载
         
         Args:
-            word_data: 单词数据字典
+            db: 数据库会话
             model_class: 模型类
+            staging: 暂存表
+            file_path: 数据文件路径
+            report: 文件同步报告
             
         Returns:
-            词汇记录对象
-        """
-        # 提取基本信息
-        word_rank = word_data.get("wordRank", 0)
-        head_word = word_data.get("headWord", "")
-        book_id = word_data.get("bookId", "")
-        
-        # 提取翻译
-        translation = self._extract_translation(word_data)
-        
-        # 提取音标
-        us_phone, uk_phone = self._extract_phonetics(word_data)
-        
-        # 提取单词ID
-        word_id = self._extract_word_id(word_data)
-        
-        # 创建记录
-        return model_class(
-            word_rank=word_rank,
-            head_word=head_word,
-            translation=translation,
-            book_id=book_id,
-            word_id=word_id,
-            us_phone=us_phone,
-            uk_phone=uk_phone
+            暂存表中的总行数
+        """
+        timings = report["stages"]
+        checkpoint_path = self._checkpoint_path(file_path.name)
+        checkpoint = self._load_checkpoint(db, checkpoint_path, file_path, staging) if self.resume else None
+        
+        if checkpoint:
+            # 删除最后一批已提交但检查点未写入的记录，避免重复加载
+            db.execute(text(f"DELETE FROM {staging.name} WHERE id > :max_id"), {"max_id": checkpoint["max_id"]})
+            db.commit()
+            start_offset, start_line = checkpoint["byte_offset"], checkpoint["line_number"]
+            success_count = checkpoint["rows_loaded"]
+            seen_word_ids = set(db.execute(text(f"SELECT word_id FROM {staging.name}")).scalars())
+            report["resumed_from_line"] = start_line
+            logger.info(
+                f"从检查点恢复: 第 {start_line} 行（字节偏移 {start_offset}），"
+                f"暂存表 {staging.name} 已有 {success_count} 条记录"
+            )
+        else:
+            # 创建不带索引的暂存表
+            staging.drop(bind=db.connection(), checkfirst=True)
+            db.execute(CreateTable(staging))
+            db.commit()
+            start_offset, start_line, success_count = 0, 1, 0
+            seen_word_ids = set()
+            logger.info(f"已创建暂存表 {staging.name}")
+        
+        stat = file_path.stat()
+        batches = _timed(
+            _prefetch(self._iter_positioned_batches(
+                file_path, timings, report, start_offset, start_line, seen_word_ids
+            )),
+            timings, "wait"
         )
+        for rows, end_offset, next_line in batches:
+            if rows:
+                success_count += self._write_batch(db, model_class, rows, table=staging)
+            max_id = db.execute(text(f"SELECT COALESCE(MAX(id), 0) FROM {staging.name}")).scalar()
+            db.commit()
+            self._save_checkpoint(checkpoint_path, {
+                "file": file_path.name,
+                "staging_table": staging.name,
+                "byte_offset": end_offset,
+                "line_number": next_line,
+                "rows_loaded": success_count,
+                "max_id": max_id,
+                "batch_size": self.batch_size,
+                "file_size": stat.st_size,
+                "file_mtime_ns": stat.st_mtime_ns
+            })
+        
+        logger.info(f"暂存表 {staging.name} 加载完成，共 {success_count} 条记录")
+        return success_count
+    
+    def _load_and_swap(self, db: Session, model_class, file_path: Path, report: Dict[str, Any]) -> int:
+        """
+        将数据加载到暂存表并建立索引，然后在单个事务中通过重命名替换正式表
+        加载期间正式表保持可读，读请求不会看到清空或只加载了一部分的词汇表；
+        暂存表按批提交并记录检查点，中断后可通过 resume 继续加载
+        
+        Args:
+            db: 数据库会话
+            model_class: 模型类
+            file_path: 数据文件路径
+            report: 文件同步报告
+            
+        Returns:
+            写入的行数
+        """
+        live = model_class.__table__
+        staging = self._staging_table(model_class)
+        timings = report["stages"]
+        checkpoint_path = self._checkpoint_path(file_path.name)
+        
+        success_count = self._load_staging(db, model_class, staging, file_path, report)
+        if success_count == 0:
+            logger.warning(f"文件 {file_path.name} 中没有有效数据")
+            staging.drop(bind=db.connection(), checkfirst=True)
+            db.commit()
+            checkpoint_path.unlink(missing_ok=True)
+            return 0
+        
+        # 数据加载完成后在暂存表上并发建立索引并更新统计信息
+        with _stage_timer(timings, "create_index"):
+            self._create_indexes_concurrently(db, staging)
+        with _stage_timer(timings, "analyze"):
+            db.execute(text(f"ANALYZE {staging.name}"))
+            db.commit()
+        
+        # 在单个事务中删除旧表并将暂存表及其索引、主键、序列重命名为正式名称
+        live_index_names = {tuple(column.name for column in index.columns): index.name for index in live.indexes}
+        statements = [
+            f"SET LOCAL lock_timeout = '{SWAP_LOCK_TIMEOUT}'",
+            f"DROP TABLE IF EXISTS {live.name}",
+            f"ALTER TABLE {staging.name} RENAME TO {live.name}",
+            f"ALTER TABLE {live.name} RENAME CONSTRAINT {staging.name}_pkey TO {live.name}_pkey",
+            f"ALTER SEQUENCE {staging.name}_id_seq RENAME TO {live.name}_id_seq",
+        ]
+        for index in staging.indexes:
+            live_name = live_index_names[tuple(column.name for column in index.columns)]
+            statements.append(f"ALTER INDEX {index.name} RENAME TO {live_name}")
+        for statement in statements:
+            db.execute(text(statement))
+        db.commit()
+        logger.info(f"已将暂存表 {staging.name} 原子切换为 {live.name}")
+        
+        # 切换完成后检查点不再需要
+        checkpoint_path.unlink(missing_ok=True)
+        return success_count
     
     def sync_file(self, file_name: str) -> bool:
         """
@@ -222,39 +911,93 @@ class VocabularyDataSync:
         table_name = self.file_table_mapping[file_name]
         model_class = TABLE_MODEL_MAPPING[table_name]
         
+        report = _new_file_report(file_name, f"t_{table_name}")
+        self.file_reports[file_name] = report
+        start_time = time.perf_counter()
+        start_cpu = time.process_time()
+        try:
+            report["success"] = self._sync_file(file_name, model_class, report)
+        finally:
+            _finish_file_report(report, start_time, start_cpu)
+        
+        if report["success"]:
+            logger.info(
+                f"成功同步 {report['rows_written']} 条记录到表 {report['table']}，"
+                f"耗时 {report['wall_seconds']:.2f}s，{report['rows_per_second']:.0f} 行/秒"
+            )
+            logger.info(f"文件 {file_name} 阶段耗时: {_format_timings(report['stages'])}")
+        return report["success"]
+    
+    def _sync_file(self, file_name: str, model_class, report: Dict[str, Any]) -> bool:
+        """
+        读取并写入单个文件，同时在报告中累计计数和分阶段耗时
+        
+        Args:
+            file_name: 文件名
+            model_class: 模型类
+            report: 文件同步报告
+            
+        Returns:
+            是否同步成功
+        """
+        table_name = report["table"]
         file_path = self.datasets_dir / file_name
         if not file_path.exists():
             logger.error(f"文件不存在: {file_path}")
             return False
         
-        logger.info(f"开始同步文件: {file_name} -> 表: t_{table_name}")
+        logger.info(f"开始同步文件: {file_name} -> 表: {table_name}")
         
         try:
-            # 解析JSON数据
-            word_list = self._parse_json_file(file_path)
-            if not word_list:
-                logger.warning(f"文件 {file_name} 中没有有效数据")
+            timings = report["stages"]
+            db = self._get_db_session()
+            
+            if not self.incremental and self._use_swap(db):
+                # 分批加载到暂存表（可从检查点恢复）后原子切换
+                write_start = time.perf_counter()
+                report["rows_written"] = self._load_and_swap(db, model_class, file_path, report)
+                index_time = sum(timings[stage] for stage in INDEX_STAGES)
+                timings["insert"] = time.perf_counter() - write_start - timings["wait"] - index_time
                 return True
             
-            db = self._get_db_session()
+            # 在后台线程中流式解析JSON数据，写入当前批次时准备下一批次
+            batches = _timed(_prefetch(self._iter_batches(file_path, timings, report)), timings, "wait")
+            first_batch = next(batches, None)
+            if first_batch is None:
+                logger.warning(f"文件 {file_name} 中没有有效数据")
+                return True
             
-            # 清空现有数据
-            db.query(model_class).delete()
-            logger.info(f"清空表 t_{table_name} 的现有数据")
+            write_start = time.perf_counter()
+            wait_before_write = timings["wait"]
             
-            # 批量插入新数据
-            success_count = 0
-            for word_data in word_list:
-                try:
-                    record = self._create_vocabulary_record(word_data, model_class)
-                    db.add(record)
-                    success_count += 1
-                except Exception as e:
-                    logger.warning(f"创建记录失败: {e}, 数据: {word_data.get('headWord', 'unknown')}")
+            if self.incremental:
+                # 只写入变化的记录
+                counts = self._apply_incremental(db, model_class, chain([first_batch], batches))
+                success_count = counts["inserted"] + counts["updated"]
+                report["incremental"] = counts
+                logger.info(
+                    f"表 {table_name} 增量同步: 新增 {counts['inserted']}，更新 {counts['updated']}，"
+                    f"删除 {counts['deleted']}，未变化 {counts['unchanged']}"
+                )
+            elif self.bulk:
+                # 删除索引后批量加载，完成后重建索引
+                success_count = self._bulk_reload(db, model_class, chain([first_batch], batches), timings)
+            else:
+                # 清空现有数据
+                db.query(model_class).delete()
+                logger.info(f"清空表 {table_name} 的现有数据")
+                
+                # 按批次写入新数据
+                success_count = 0
+                for batch in chain([first_batch], batches):
+                    success_count += self._write_batch(db, model_class, batch)
             
             # 提交事务
             db.commit()
-            logger.info(f"成功同步 {success_count} 条记录到表 t_{table_name}")
+            # 写入阶段耗时不包含等待解析线程以及删除、重建索引的时间
+            index_time = sum(timings[stage] for stage in INDEX_STAGES)
+            timings["insert"] = time.perf_counter() - write_start - (timings["wait"] - wait_before_write) - index_time
+            report["rows_written"] = success_count
             return True
             
         except Exception as e:
@@ -263,26 +1006,172 @@ class VocabularyDataSync:
                 self.db_session.rollback()
             return False
     
-    def sync_all(self) -> bool:
+    def _worker_options(self) -> Dict[str, Any]:
+        """
+        构建子进程重建同步器所需的参数
+        """
+        bind = self.session_factory.kw["bind"]
+        return {
+            "database_url": bind.url.render_as_string(hide_password=False),
+            "datasets_dir": str(self.datasets_dir),
+            "bulk": self.bulk,
+            "batch_size": self.batch_size,
+            "incremental": self.incremental,
+            "swap": self.swap,
+            "report_dir": str(self.report_dir),
+            "resume": self.resume,
+            "checkpoint_dir": str(self.checkpoint_dir)
+        }
+    
+    def _sync_files_parallel(self, file_names: List[str], jobs: int) -> Dict[str, bool]:
+        """
+        在进程池中并行同步多个文件，每个子进程使用独立的数据库引擎和连接
+        
+        Args:
+            file_names: 要同步的文件名列表
+            jobs: 并行进程数
+            
+        Returns:
+            文件名到同步结果的映射
+        """
+        options = self._worker_options()
+        results = {}
+        with ProcessPoolExecutor(max_workers=min(jobs, len(file_names))) as executor:
+            futures = {
+                executor.submit(_sync_file_in_worker, options, file_name): file_name
+                for file_name in file_names
+            }
+            for future in as_completed(futures):
+                file_name = futures[future]
+                try:
+                    results[file_name], report = future.result()
+                    if report:
+                        self.file_reports[file_name] = report
+                except Exception as e:
+                    logger.error(f"同步进程处理文件 {file_name} 时异常退出: {e}")
+                    results[file_name] = False
+        return results
+    
+    def sync_all(self, jobs: int = 1) -> bool:
         """
         同步所有支持的文件到数据库
         
+        Args:
+            jobs: 并行同步的进程数，1 表示在当前进程中依次同步
+        
         Returns:
             是否全部同步成功
         """
         logger.info("开始同步所有词汇数据...")
         
-        success_count = 0
-        total_count = len(self.file_table_mapping)
+        file_names = list(self.file_table_mapping.keys())
+        total_count = len(file_names)
         
-        for file_name in self.file_table_mapping.keys():
-            if self.sync_file(file_name):
+        if jobs > 1:
+            logger.info(f"使用 {min(jobs, total_count)} 个进程并行同步")
+            results = self._sync_files_parallel(file_names, jobs)
+        else:
+            results = {file_name: self.sync_file(file_name) for file_name in file_names}
+        
+        success_count = 0
+        for file_name in file_names:
+            if results[file_name]:
                 success_count += 1
             else:
                 logger.error(f"同步文件 {file_name} 失败")
         
         logger.info(f"同步完成: {success_count}/{total_count} 个文件同步成功")
-        return success_count == total_count
+        
+        if self.file_reports:
+            totals = {
+                stage: sum(report["stages"][stage] for report in self.file_reports.values())
+                for stage in PROFILE_STAGES
+            }
+            logger.info(f"全部文件阶段耗时合计: {_format_timings(totals)}")
+        
+        snapshot_exported = self.export_snapshot()
+        success = snapshot_exported and success_count == total_count
+        self.write_report(success, jobs=jobs)
+        return success
+    
+    def write_report(self, success: bool, jobs: int = 1) -> Optional[Path]:
+        """
+        将本次运行的同步报告写入报告目录，并更新 /metrics 读取的最新报告
+        
+        Args:
+            success: 本次运行是否全部成功
+            jobs: 并行同步的进程数
+            
+        Returns:
+            报告文件路径，写入失败时返回 None
+        """
+        files = [self.file_reports[name] for name in self.file_table_mapping if name in self.file_reports]
+        peaks = [report["peak_rss_bytes"] for report in files if report["peak_rss_bytes"] is not None]
+        own_peak = peak_rss_bytes()
+        if own_peak is not None:
+            peaks.append(own_peak)
+        
+        report = {
+            "version": SYNC_REPORT_VERSION,
+            "started_at": self.started_at,
+            "finished_at": time.time(),
+            "wall_seconds": time.perf_counter() - self._start_time,
+            "success": success,
+            "options": {
+                "bulk": self.bulk,
+                "incremental": self.incremental,
+                "swap": self.swap,
+                "resume": self.resume,
+                "batch_size": self.batch_size,
+                "jobs": jobs
+            },
+            "peak_rss_bytes": max(peaks) if peaks else None,
+            "totals": {
+                field: sum(item[field] for item in files)
+                for field in (
+                    "lines_read", "decode_failures", "extract_failures", "skipped_word_ids",
+                    "rows_written", "bytes_read", "cpu_seconds"
+                )
+            },
+            "files": files
+        }
+        
+        try:
+            report_path = write_sync_report(report, self.report_dir)
+            logger.info(f"同步报告已写入: {report_path}")
+            return report_path
+        except OSError as e:
+            logger.error(f"写入同步报告失败: {e}")
+            return None
+    
+    def export_snapshot(self) -> bool:
+        """
+        从数据库导出全部词汇表的二进制快照，供API以mmap方式加载
+        同一次遍历中收集各词书的规范化单词，导出供结果分析离线使用的单词等级词典
+        
+        Returns:
+            是否导出成功
+        """
+        try:
+            db = self._get_db_session()
+            books = {}
+            book_words = {}
+            for table_name, model_class in TABLE_MODEL_MAPPING.items():
+                columns = [getattr(model_class, field) for field in RECORD_FIELDS]
+                records = db.query(*columns).order_by(model_class.id).yield_per(5000)
+                book_words[table_name] = set()
+                books[table_name] = _collect_norm_words(records, book_words[table_name])
+            
+            total = write_snapshot(self.snapshot_path, books)
+            logger.info(f"词汇快照已导出: {self.snapshot_path} ({total} 条记录)")
+            
+            word_count = write_word_levels(self.word_levels_path, book_words)
+            logger.info(f"单词等级词典已导出: {self.word_levels_path} ({word_count} 个单词)")
+            return True
+            
+        except Exception as e:
+            logger.error(f"导出词汇快照失败: {e}")
+            return False
     
     def __enter__(self):
         return self
@@ -291,6 +1180,47 @@ class VocabularyDataSync:
         self._close_db_session()
 
 
+def _collect_norm_words(records: Iterable[Tuple], words: set) -> Iterator[Tuple]:
+    """
+    原样转发快照记录，同时将规范化单词收集到 words 中
+    
+    Args:
+        records: 按 RECORD_FIELDS 顺序排列的记录
+        words: 收集规范化单词的集合
+        
+    Yields:
+        原记录
+    """
+    head_word_index = RECORD_FIELDS.index("head_word")
+    norm_index = RECORD_FIELDS.index("head_word_norm")
+    for record in records:
+        # 尚未同步规范化列的旧数据在导出时补算，与快照保持一致
+        words.add(record[norm_index] or normalize_head_word(record[head_word_index]))
+        yield record
+
+
+def _sync_file_in_worker(options: Dict[str, Any], file_name: str) -> Tuple[bool, Optional[Dict[str, Any]]]:
+    """
+    进程池中同步单个文件，创建并在结束时释放子进程自己的数据库引擎
+    
+    Args:
+        options: 同步器参数，见 VocabularyDataSync._worker_options
+        file_name: 要同步的文件名
+        
+    Returns:
+        (是否同步成功, 文件同步报告)
+    """
+    options = dict(options)
+    engine = create_engine(options.pop("database_url"), pool_pre_ping=True)
+    try:
+        session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        with VocabularyDataSync(session_factory=session_factory, **options) as sync_tool:
+            success = sync_tool.sync_file(file_name)
+            return success, sync_tool.file_reports.get(file_name)
+    finally:
+        engine.dispose()
+
+
 def main():
     """
     主函数 - 数据同步脚本入口
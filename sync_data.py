@@ -17,7 +17,7 @@ from pathlib import Path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-from scripts.sync_vocabulary import VocabularyDataSync, logger
+from scripts.sync_vocabulary import VocabularyDataSync, logger, positive_int
 from app.db import check_db_connection, init_db
 
 
@@ -40,6 +40,11 @@ def parse_arguments():
   python sync_data.py                    # 同步所有文件
   python sync_data.py --file cet4.json  # 只同步CET4数据
   python sync_data.py --datasets-dir ./data  # 指定数据目录
+  python sync_data.py --bulk             # 使用COPY批量写入（重新加载期间表被锁定，仅适合离线环境）
+  python sync_data.py --jobs 5           # 5个进程并行同步所有文件
+  python sync_data.py --incremental      # 只写入变化的记录
+  python sync_data.py --bulk --swap      # 加载到暂存表后原子切换，不影响在线读取
+  python sync_data.py --resume           # 从上次中断处继续加载暂存表，完成后原子切换
         """
     )
     
@@ -56,6 +61,69 @@ def parse_arguments():
         help="数据集目录路径（默认: datasets）"
     )
     
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="增量同步：按word_id比较内容哈希，只新增/更新变化的记录并删除已移除的记录"
+    )
+    
+    parser.add_argument(
+        "--swap",
+        action="store_true",
+        help="全量同步时先加载到暂存表并建立索引，再在单个事务中重命名切换（仅PostgreSQL）"
+    )
+    
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="从检查点继续上次中断的暂存表加载（隐含 --swap，仅PostgreSQL）"
+    )
+    
+    parser.add_argument(
+        "--checkpoint-dir",
+        type=str,
+        help="检查点目录（默认: 数据集目录下的 .checkpoints）"
+    )
+    
+    parser.add_argument(
+        "--jobs",
+        type=positive_int,
+        default=1,
+        help="并行同步的进程数，每个进程使用独立的数据库连接（默认: 1）"
+    )
+    
+    parser.add_argument(
+        "--batch-size",
+        type=positive_int,
+        default=5000,
+        help="每批解析和写入的行数，内存占用与之成正比（默认: 5000）"
+    )
+    
+    parser.add_argument(
+        "--snapshot-path",
+        type=str,
+        help="词汇快照输出路径（默认: 配置中的 vocabulary_snapshot_path）"
+    )
+    
+    parser.add_argument(
+        "--word-levels-path",
+        type=str,
+        help="单词等级词典输出路径，供结果分析离线使用（默认: 配置中的 word_levels_path）"
+    )
+    
+    parser.add_argument(
+        "--report-dir",
+        type=str,
+        help="同步报告输出目录（默认: 配置中的 sync_report_dir）"
+    )
+    
+    parser.add_argument(
+        "--bulk",
+        action="store_true",
+        help="使用批量写入（PostgreSQL使用COPY，其他数据库使用executemany）；"
+             "不加 --swap 时整个重新加载期间表被排他锁定、读请求会被阻塞，线上环境请同时使用 --swap"
+    )
+    
     parser.add_argument(
         "--force",
         action="store_true",
@@ -121,11 +189,24 @@ def main():
     
     # 执行数据同步
     try:
-        with VocabularyDataSync(datasets_dir=str(datasets_dir)) as sync_tool:
+        with VocabularyDataSync(
+            datasets_dir=str(datasets_dir),
+            snapshot_path=args.snapshot_path,
+            bulk=args.bulk,
+            batch_size=args.batch_size,
+            incremental=args.incremental,
+            swap=args.swap,
+            report_dir=args.report_dir,
+            resume=args.resume,
+            checkpoint_dir=args.checkpoint_dir,
+            word_levels_path=args.word_levels_path
+        ) as sync_tool:
             if args.file:
                 # 同步指定文件
                 logger.info(f"开始同步指定文件: {args.file}")
-                if sync_tool.sync_file(args.file):
+                success = sync_tool.sync_file(args.file) and sync_tool.export_snapshot()
+                sync_tool.write_report(success)
+                if success:
                     logger.info(f"✅ 文件 {args.file} 同步成功")
                 else:
                     logger.error(f"❌ 文件 {args.file} 同步失败")
@@ -133,7 +214,7 @@ def main():
             else:
                 # 同步所有文件
                 logger.info("开始同步所有词汇数据文件...")
-                if sync_tool.sync_all():
+                if sync_tool.sync_all(jobs=args.jobs):
                     logger.info("✅ 所有数据同步成功")
                 else:
                     logger.error("❌ 部分数据同步失败")
@@ -0,0 +1,10 @@
+import sys
+from pathlib import Path
+
+# 添加项目根目录到Python路径，与 scripts/ 下的脚本保持一致
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "selenium: 需要本地 Chrome 和 chromedriver 的浏览器测试，缺少时跳过")
@@ -0,0 +1,118 @@
+"""
+结果分析脚本的测试：单词等级词典模式下的分析、缓存和查询失败时的处理
+"""
+
+import json
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import analyze_preply_results
+from analyze_preply_results import AnalysisCache, VocabResultAnalyzer
+from app.service.word_levels import write_word_levels
+
+
+WORD_LEVELS = {
+    "cet4": ["apple", "book", "cat"],
+    "cet6": ["book", "diverse"],
+    "kaoyan": ["elaborate"],
+    "level4": [],
+    "level8": ["fastidious"],
+}
+
+
+def write_result(results_dir, user_id, known, unknown=(), final_vocab_size="5000"):
+    words = [{"word": word, "known": True} for word in known] + [{"word": word, "known": False} for word in unknown]
+    data = {"rounds": [{"words": words}], "final_vocab_size": final_vocab_size, "summary": {}}
+    path = results_dir / f"vocab_test_result_{user_id}.json"
+    path.write_text(json.dumps(data), encoding="utf-8")
+    return str(path)
+
+
+@pytest.fixture
+def result_files(tmp_path, monkeypatch):
+    results_dir = tmp_path / "preply_results"
+    results_dir.mkdir()
+    files = [
+        write_result(results_dir, "user1", ["Apple", "book"], ["zzz"]),
+        write_result(results_dir, "user2", ["diverse", "elaborate", "FASTIDIOUS"]),
+        write_result(results_dir, "user3", ["cat", "unknownword"], final_vocab_size="3000"),
+    ]
+    monkeypatch.setattr(VocabResultAnalyzer, "get_test_result_files", lambda self: files)
+    return files
+
+
+@pytest.fixture
+def word_levels_path(tmp_path):
+    path = tmp_path / "word_levels.json.gz"
+    write_word_levels(path, WORD_LEVELS)
+    return str(path)
+
+
+def test_iter_results_with_word_levels(result_files, word_levels_path):
+    analyzer = VocabResultAnalyzer(word_levels_path=word_levels_path)
+    results = list(analyzer.iter_results())
+    
+    assert [result["user_id"] for result in results] == ["user1", "user2", "user3"]
+    distribution = results[0]["distribution"]
+    assert sorted(distribution["cet4"]["found_words"]) == ["apple", "book"]
+    assert distribution["cet6"]["found_words"] == ["book"]
+    # book 按最高等级计入 CET6
+    assert distribution["cet4"]["highest_level_count"] == 1
+    assert distribution["cet6"]["highest_level_count"] == 1
+    assert results[1]["distribution"]["level8"]["found_words"] == ["fastidious"]
+
+
+def test_iter_results_reuses_cache(tmp_path, result_files, word_levels_path):
+    analyzer = VocabResultAnalyzer(word_levels_path=word_levels_path)
+    cache = AnalysisCache(tmp_path / "cache.sqlite3")
+    try:
+        first = list(analyzer.iter_results(cache=cache))
+        dataset_version = analyzer.dataset_version()
+        hashes = [analyze_preply_results._file_hash(path) for path in result_files]
+        assert cache.find_cached(hashes, dataset_version) == set(hashes)
+        
+        second = list(analyzer.iter_results(cache=cache))
+        assert second == first
+    finally:
+        cache.close()
+
+
+def test_failed_lookup_is_not_cached(tmp_path, result_files, monkeypatch):
+    # 空的 SQLite 数据库中没有词汇表，查询会失败
+    def setup_database(self):
+        self.engine = create_engine(f"sqlite:///{tmp_path / 'empty.db'}")
+        self.session = sessionmaker(bind=self.engine)()
+    
+    monkeypatch.setattr(VocabResultAnalyzer, "_setup_database", setup_database)
+    monkeypatch.setattr(VocabResultAnalyzer, "dataset_version", lambda self: "test")
+    analyzer = VocabResultAnalyzer()
+    cache = AnalysisCache(tmp_path / "cache.sqlite3")
+    try:
+        with pytest.raises(Exception):
+            list(analyzer.iter_results(cache=cache))
+        hashes = [analyze_preply_results._file_hash(path) for path in result_files]
+        assert cache.find_cached(hashes, "test") == set()
+    finally:
+        cache.close()
+        analyzer.close()
+
+
+def test_iter_results_analyzes_in_batches(tmp_path, result_files, word_levels_path, monkeypatch):
+    monkeypatch.setattr(analyze_preply_results, "CACHE_WRITE_BATCH", 2)
+    analyzer = VocabResultAnalyzer(word_levels_path=word_levels_path)
+    analyzed_batches = []
+    analyze_files = analyzer.analyze_files
+    monkeypatch.setattr(analyzer, "analyze_files", lambda files: analyzed_batches.append(files) or analyze_files(files))
+    
+    cache = AnalysisCache(tmp_path / "cache.sqlite3")
+    try:
+        results = analyzer.iter_results(cache=cache)
+        assert next(results)["user_id"] == "user1"
+        # 第一个结果输出时只分析了第一批文件
+        assert analyzed_batches == [result_files[:2]]
+        assert [result["user_id"] for result in results] == ["user2", "user3"]
+        assert analyzed_batches == [result_files[:2], result_files[2:]]
+    finally:
+        cache.close()
@@ -0,0 +1,75 @@
+"""
+估算基准校准脚本的测试
+"""
+
+import numpy as np
+import pytest
+
+from app.service.vocabulary_service import (
+    VocabularyEstimateRequest,
+    VocabularyEstimateService,
+    VocabularyTestResult,
+)
+from scripts.calibrate_benchmarks import VOCAB_TYPES, calibrate, coordinate_search, evaluate
+
+BENCHMARKS = VocabularyEstimateService.VOCABULARY_BENCHMARKS
+CURRENT_TOTALS = np.array([BENCHMARKS[vocab_type]["total_words"] for vocab_type in VOCAB_TYPES], dtype=np.float64)
+CURRENT_WEIGHTS = np.array([BENCHMARKS[vocab_type]["weight"] for vocab_type in VOCAB_TYPES], dtype=np.float64)
+
+# 每个词汇表测试 20 个单词，专八一列全部为 0
+KNOWN = np.array([
+    [18, 12, 9, 7, 0],
+    [15, 10, 4, 3, 0],
+    [20, 17, 14, 11, 0],
+    [9, 5, 2, 1, 0],
+    [12, 8, 6, 6, 0],
+    [19, 15, 10, 8, 0],
+])
+TESTED = 20
+
+
+def service_estimate(known_row):
+    request = VocabularyEstimateRequest(**{
+        vocab_type: VocabularyTestResult(known=int(known), total=TESTED)
+        for vocab_type, known in zip(VOCAB_TYPES, known_row)
+    })
+    return VocabularyEstimateService.estimate_vocabulary(request).estimated_vocabulary
+
+
+def test_evaluate_matches_estimate_service():
+    mastery = KNOWN / TESTED
+    estimates = np.array([service_estimate(row) for row in KNOWN], dtype=np.float64)
+    
+    # 以估算服务的结果为目标时误差为 0
+    error = evaluate(CURRENT_TOTALS[None, :], CURRENT_WEIGHTS[None, :], mastery, estimates)
+    assert error[0] == 0
+    
+    targets = estimates * 2
+    error = evaluate(CURRENT_TOTALS[None, :], CURRENT_WEIGHTS[None, :], mastery, targets)
+    assert error[0] == pytest.approx(50.0)
+
+
+def test_calibrate_keeps_positive_average_mastery():
+    mastery = KNOWN / TESTED
+    targets = np.array([8000, 6000, 11000, 3500, 5000, 9000], dtype=np.float64)
+    result = calibrate(mastery, targets, rounds=20, candidates=64)
+    
+    for vocab_type, benchmark in result["benchmarks"].items():
+        assert benchmark["average_mastery"] > 0
+        assert benchmark["average_mastery"] == BENCHMARKS[vocab_type]["average_mastery"]
+        assert benchmark["weight"] >= 0
+
+
+def test_coordinate_search_recovers_zero_weight():
+    rng = np.random.default_rng(1)
+    mastery = rng.uniform(0.1, 0.9, (40, len(VOCAB_TYPES)))
+    true_weights = np.array([0.2, 0.2, 0.2, 0.2, 0.2])
+    targets = np.floor((np.floor(mastery * CURRENT_TOTALS) * true_weights).sum(axis=1))
+    
+    start_weights = true_weights.copy()
+    start_weights[1] = 0.0
+    _, weights, error, _ = coordinate_search(CURRENT_TOTALS, start_weights, mastery, targets, 100, 256, 0)
+    
+    assert weights[1] > 0
+    start_error = evaluate(CURRENT_TOTALS[None, :], start_weights[None, :], mastery, targets)[0]
+    assert error < start_error
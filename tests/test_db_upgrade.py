@@ -0,0 +1,60 @@
+"""
+upgrade_schema 对旧版本表结构的升级测试
+"""
+
+import pytest
+from sqlalchemy import create_engine, inspect, text
+
+import app.db as appdb
+from app.db import Base, upgrade_schema
+from app.models import CET4Vocabulary  # noqa: F401  注册模型表
+
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'vocab.db'}")
+    Base.metadata.create_all(engine)
+    # 模拟旧版本：word_id 上只有非唯一索引
+    with engine.begin() as connection:
+        connection.execute(text("DROP INDEX ix_t_cet4_word_id"))
+        connection.execute(text("CREATE INDEX ix_t_cet4_word_id ON t_cet4 (word_id)"))
+    monkeypatch.setattr(appdb, "engine", engine)
+    yield engine
+    engine.dispose()
+
+
+def insert_words(engine, word_ids, head_words=None):
+    # 与旧版本一样不写入 head_word_norm
+    head_words = head_words or [f"word{rank}" for rank in range(1, len(word_ids) + 1)]
+    with engine.begin() as connection:
+        for rank, (word_id, head_word) in enumerate(zip(word_ids, head_words), 1):
+            connection.execute(
+                text("INSERT INTO t_cet4 (word_rank, head_word, word_id) VALUES (:rank, :word, :word_id)"),
+                {"rank": rank, "word": head_word, "word_id": word_id}
+            )
+
+
+def word_id_index(engine):
+    indexes = inspect(engine).get_indexes("t_cet4")
+    return next(index for index in indexes if index["name"] == "ix_t_cet4_word_id")
+
+
+def test_upgrade_replaces_non_unique_word_id_index(engine):
+    insert_words(engine, ["CET4_1", "CET4_2"])
+    upgrade_schema()
+    assert word_id_index(engine)["unique"]
+
+
+def test_upgrade_keeps_old_index_when_word_ids_are_duplicated(engine):
+    insert_words(engine, ["CET4_1", "CET4_1"])
+    upgrade_schema()
+    assert not word_id_index(engine)["unique"]
+
+
+def test_upgrade_backfills_head_word_norm(engine, monkeypatch):
+    monkeypatch.setattr(appdb, "BACKFILL_BATCH_SIZE", 2)
+    insert_words(engine, ["CET4_1", "CET4_2", "CET4_3"], ["Abandon", " ability ", "ａｂｌｅ"])
+    upgrade_schema()
+    with engine.connect() as connection:
+        norms = connection.execute(text("SELECT head_word_norm FROM t_cet4 ORDER BY word_rank")).scalars().all()
+    assert norms == ["abandon", "ability", "able"]
@@ -0,0 +1,109 @@
+"""
+Preply 离线回放服务测试，以及基于回放服务的抓取器端到端测试
+"""
+
+import json
+import shutil
+import urllib.error
+import urllib.request
+from argparse import Namespace
+
+import pytest
+
+from scripts import preply_vocab_test
+from scripts.preply_fixture_server import DEFAULT_FIXTURES_DIR, TEST_PAGE_PATH, replay_target, start_fixture_server
+
+
+@pytest.fixture
+def server():
+    server = start_fixture_server(render_delay=0.25)
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def fetch(url):
+    with urllib.request.urlopen(url, timeout=5) as response:
+        return response.status, response.headers, response.read().decode("utf-8")
+
+
+def test_serves_test_page_with_injected_config(server):
+    status, headers, body = fetch(server.test_url)
+    
+    assert status == 200
+    assert headers["Content-Type"] == "text/html; charset=utf-8"
+    assert "__FIXTURE_CONFIG__" not in body
+    
+    start = body.index("const CONFIG = ") + len("const CONFIG = ")
+    config, _ = json.JSONDecoder().raw_decode(body[start:])
+    with open(DEFAULT_FIXTURES_DIR / "rounds.json", "r", encoding="utf-8") as f:
+        expected = json.load(f)
+    assert config["render_delay_ms"] == 250
+    assert config["round1"] == expected["round1"]
+    assert config["round2"] == expected["round2"]
+
+
+def test_serves_index_and_trailing_slash(server):
+    host, port = server.server_address[:2]
+    status, _, body = fetch(f"http://{host}:{port}/")
+    assert status == 200
+    assert TEST_PAGE_PATH in body
+    
+    status, _, _ = fetch(f"{server.test_url}/?source=test")
+    assert status == 200
+
+
+@pytest.mark.parametrize("path", ["/missing", "/en/learn/english", TEST_PAGE_PATH + "/extra"])
+def test_unknown_paths_return_404(server, path):
+    host, port = server.server_address[:2]
+    with pytest.raises(urllib.error.HTTPError) as excinfo:
+        fetch(f"http://{host}:{port}{path}")
+    assert excinfo.value.code == 404
+
+
+def test_replay_target_starts_and_stops_server():
+    args = Namespace(target_url=None, replay=True, replay_latency=0.0, replay_render_delay=0.0)
+    with replay_target(args) as target_url:
+        status, _, _ = fetch(target_url)
+        assert status == 200
+    with pytest.raises(urllib.error.URLError):
+        fetch(target_url)
+    
+    args = Namespace(target_url="http://example.invalid/test", replay=False)
+    with replay_target(args) as target_url:
+        assert target_url == "http://example.invalid/test"
+
+
+def find_chrome():
+    for name in ("google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome"):
+        if shutil.which(name):
+            return shutil.which(name)
+    return None
+
+
+@pytest.mark.selenium
+@pytest.mark.skipif(
+    find_chrome() is None or shutil.which("chromedriver") is None,
+    reason="需要本地安装 Chrome 和 chromedriver"
+)
+def test_scraper_replays_fixture(tmp_path, monkeypatch):
+    # 使用 PATH 中的 chromedriver，不通过 webdriver-manager 下载
+    monkeypatch.setattr(preply_vocab_test, "_driver_path", shutil.which("chromedriver"))
+    server = start_fixture_server()
+    scraper = preply_vocab_test.VocabTestScraper(
+        headless=True,
+        interactive=False,
+        results_dir=str(tmp_path),
+        target_url=server.test_url
+    )
+    try:
+        scraper.open_test_page()
+        result = scraper.random_click_vocab_labels(3, 3)
+    finally:
+        scraper.close()
+        server.shutdown()
+        server.server_close()
+    
+    assert [round_data["clicked_count"] for round_data in result["rounds"]] == [3, 3]
+    assert result["final_vocab_size"].isdigit()
+    assert len(list(tmp_path.glob("vocab_test_result_*.json"))) == 1
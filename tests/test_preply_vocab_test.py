@@ -0,0 +1,44 @@
+"""
+抓取器精简模式拦截规则的测试
+"""
+
+import re
+
+import pytest
+
+from scripts.preply_vocab_test import LEAN_BLOCKED_URL_PATTERNS
+
+
+def is_blocked(url):
+    """
+    按 Network.setBlockedURLs 的规则匹配：只有 * 是通配符，其余字符按字面匹配整个URL
+    """
+    return any(
+        re.fullmatch(".*".join(map(re.escape, pattern.split("*"))), url)
+        for pattern in LEAN_BLOCKED_URL_PATTERNS
+    )
+
+
+@pytest.mark.parametrize("url", [
+    "https://preply.com/static/logo.svg",
+    "https://static.preply.com/images/hero.webp?v=3",
+    "https://preply.com/favicon.ico",
+    "https://fonts.example.com/inter.woff2",
+    "https://www.google-analytics.com/g/collect?v=2",
+    "https://googletagmanager.com/gtm.js?id=GTM-1",
+    "https://script.hotjar.com/modules.js",
+])
+def test_blocks_media_and_listed_third_parties(url):
+    assert is_blocked(url)
+
+
+@pytest.mark.parametrize("url", [
+    "https://preply.com/en/learn/english/test-your-vocab",
+    "https://preply.com/api/words?icon=default.ico.json",
+    "https://preply.com/api/search?q=image.svgz&page=2",
+    "https://preply.com/?ref=google-analytics.com",
+    "https://preply.com/graphql?operation=hotjar.com/consent",
+    "https://cdn.notgoogle-analytics.com/app.js",
+])
+def test_does_not_block_first_party_requests(url):
+    assert not is_blocked(url)
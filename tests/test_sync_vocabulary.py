@@ -0,0 +1,190 @@
+"""
+词汇同步在 SQLite 上的往返测试：ORM、批量写入和增量同步三种模式
+"""
+
+import argparse
+import json
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import app.api.vocabulary as vocabulary_api
+from app.api.vocabulary import get_random_words
+from app.db import Base
+from app.models import CET4Vocabulary, normalize_head_word
+from app.service.vocabulary_snapshot import VocabularySnapshot
+from scripts.sync_vocabulary import VocabularyDataSync, positive_int
+
+
+def make_record(rank, head_word, translation="测试"):
+    """
+    构建与数据集结构一致的单词记录
+    """
+    return {
+        "wordRank": rank,
+        "headWord": head_word,
+        "content": {
+            "word": {
+                "wordHead": head_word,
+                "wordId": f"CET4_{rank}",
+                "content": {
+                    "trans": [{"tranCn": translation, "pos": "n"}],
+                    "usphone": f"'{head_word}",
+                    "ukphone": f"'{head_word}ː",
+                }
+            }
+        },
+        "bookId": "CET4"
+    }
+
+
+def write_dataset(datasets_dir, records):
+    """
+    以每行一条JSON记录的格式写入 cet4.json
+    """
+    with open(datasets_dir / "cet4.json", "w", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'vocab.db'}")
+    Base.metadata.create_all(engine)
+    yield sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    engine.dispose()
+
+
+def make_syncer(tmp_path, session_factory, **kwargs):
+    datasets_dir = tmp_path / "datasets"
+    datasets_dir.mkdir(exist_ok=True)
+    return VocabularyDataSync(
+        datasets_dir=str(datasets_dir),
+        snapshot_path=str(tmp_path / "vocabulary.snapshot"),
+        report_dir=str(tmp_path / "reports"),
+        word_levels_path=str(tmp_path / "word_levels.json.gz"),
+        session_factory=session_factory,
+        batch_size=2,
+        **kwargs
+    )
+
+
+def load_rows(session_factory):
+    with session_factory() as db:
+        return {
+            word.word_id: word
+            for word in db.query(CET4Vocabulary).all()
+        }
+
+
+@pytest.mark.parametrize("bulk", [False, True], ids=["orm", "bulk"])
+def test_full_sync_round_trip(tmp_path, session_factory, bulk):
+    records = [make_record(1, "Abandon", "放弃"), make_record(2, "ability"), make_record(3, "able")]
+    with make_syncer(tmp_path, session_factory, bulk=bulk) as syncer:
+        write_dataset(syncer.datasets_dir, records)
+        assert syncer.sync_file("cet4.json")
+        assert syncer.file_reports["cet4.json"]["rows_written"] == 3
+
+    rows = load_rows(session_factory)
+    assert sorted(rows) == ["CET4_1", "CET4_2", "CET4_3"]
+    word = rows["CET4_1"]
+    assert word.head_word == "Abandon"
+    assert word.head_word_norm == normalize_head_word("Abandon") == "abandon"
+    assert word.translation == "n. 放弃"
+    assert word.book_id == "CET4"
+    assert word.us_phone == "'Abandon"
+    assert len(word.content_hash) == 40
+
+    # 再次全量同步会替换已有数据而不是追加
+    with make_syncer(tmp_path, session_factory, bulk=bulk) as syncer:
+        write_dataset(syncer.datasets_dir, records[:2])
+        assert syncer.sync_file("cet4.json")
+    assert sorted(load_rows(session_factory)) == ["CET4_1", "CET4_2"]
+
+
+def test_incremental_sync_round_trip(tmp_path, session_factory):
+    records = [make_record(1, "abandon"), make_record(2, "ability"), make_record(3, "able")]
+    with make_syncer(tmp_path, session_factory, incremental=True) as syncer:
+        write_dataset(syncer.datasets_dir, records)
+        assert syncer.sync_file("cet4.json")
+        assert syncer.file_reports["cet4.json"]["incremental"] == {
+            "inserted": 3, "updated": 0, "deleted": 0, "unchanged": 0
+        }
+    unchanged_hash = load_rows(session_factory)["CET4_1"].content_hash
+
+    # 修改一条、删除一条、新增一条
+    records = [make_record(1, "abandon"), make_record(2, "ability", "能力"), make_record(4, "abroad")]
+    with make_syncer(tmp_path, session_factory, incremental=True) as syncer:
+        write_dataset(syncer.datasets_dir, records)
+        assert syncer.sync_file("cet4.json")
+        assert syncer.file_reports["cet4.json"]["incremental"] == {
+            "inserted": 1, "updated": 1, "deleted": 1, "unchanged": 1
+        }
+
+    rows = load_rows(session_factory)
+    assert sorted(rows) == ["CET4_1", "CET4_2", "CET4_4"]
+    assert rows["CET4_1"].content_hash == unchanged_hash
+    assert rows["CET4_2"].translation == "n. 能力"
+    assert rows["CET4_4"].head_word_norm == "abroad"
+
+
+@pytest.mark.parametrize("value", ["0", "-1", "abc"])
+def test_positive_int_rejects_invalid_values(value):
+    with pytest.raises(argparse.ArgumentTypeError):
+        positive_int(value)
+
+
+def test_syncer_rejects_non_positive_batch_size(tmp_path, session_factory):
+    assert positive_int("5000") == 5000
+    with pytest.raises(ValueError):
+        VocabularyDataSync(datasets_dir=str(tmp_path), batch_size=0, session_factory=session_factory)
+
+
+@pytest.mark.parametrize("options", [{}, {"bulk": True}, {"incremental": True}], ids=["orm", "bulk", "incremental"])
+def test_sync_skips_empty_and_duplicate_word_ids(tmp_path, session_factory, options):
+    empty = make_record(3, "able")
+    empty["content"]["word"]["wordId"] = ""
+    records = [make_record(1, "abandon"), make_record(1, "abandon", "重复"), make_record(2, "ability"), empty]
+    with make_syncer(tmp_path, session_factory, **options) as syncer:
+        write_dataset(syncer.datasets_dir, records)
+        assert syncer.sync_file("cet4.json")
+        assert syncer.file_reports["cet4.json"]["skipped_word_ids"] == 2
+
+    rows = load_rows(session_factory)
+    assert sorted(rows) == ["CET4_1", "CET4_2"]
+    assert rows["CET4_1"].translation == "n. 测试"
+
+
+def test_snapshot_round_trip_matches_database(tmp_path, session_factory, monkeypatch):
+    with make_syncer(tmp_path, session_factory) as syncer:
+        write_dataset(syncer.datasets_dir, [make_record(1, "Abandon", "放弃"), make_record(2, "ability")])
+        assert syncer.sync_file("cet4.json")
+        # 其他途径写入的记录可能带有 NULL 字段
+        with session_factory() as db:
+            db.add(CET4Vocabulary(word_rank=3, head_word="able", word_id="CET4_3", translation=""))
+            db.commit()
+        assert syncer.export_snapshot()
+    
+    snapshot = VocabularySnapshot(syncer.snapshot_path)
+    try:
+        assert snapshot.count("cet4") == 3
+        found = snapshot.find_word("cet4", " ABANDON ")
+        assert [word["word_id"] for word in found] == ["CET4_1"]
+        
+        record = snapshot.find_word("cet4", "able")[0]
+        assert record["translation"] == ""
+        assert record["us_phone"] is None
+        assert record["book_id"] is None
+        
+        # 快照和数据库两条路径返回相同的结果
+        with session_factory() as db:
+            monkeypatch.setattr(vocabulary_api, "get_vocabulary_snapshot", lambda: snapshot)
+            from_snapshot = get_random_words(db, CET4Vocabulary, 10)
+            monkeypatch.setattr(vocabulary_api, "get_vocabulary_snapshot", lambda: None)
+            from_database = get_random_words(db, CET4Vocabulary, 10)
+    finally:
+        snapshot.close()
+    
+    assert len(from_snapshot) == 3
+    assert sorted(from_snapshot, key=lambda word: word.id) == sorted(from_database, key=lambda word: word.id)